@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+HeadForge Bundle Size Analyzer
+Attributes bundle bytes to files and categories across the store trees and
+release packages, and enforces the size budget
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import zipfile
+import zlib
+from pathlib import Path
+
+from file_index import FileHashIndex
+from image_headers import PNG_HEADER_SIZE, parse_png_header, read_image_header
+
+CATEGORIES = ['images', 'icons', 'fonts', 'js', 'sourcemaps', 'css', 'html', 'other']
+
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif'}
+ICON_EXTENSIONS = {'.ico', '.svg'}
+FONT_EXTENSIONS = {'.woff2', '.woff', '.ttf', '.otf'}
+PACKAGE_EXTENSIONS = {'.zip', '.xpi', '.crx'}
+
+CACHE_DIR = Path('.cache') / 'bundle-size'
+DEFAULT_BUDGET = 'config/bundle-budget.json'
+
+
+def categorize(rel_path):
+    """
+    Map a path inside a bundle to its size category
+
+    Args:
+        rel_path (str): POSIX path relative to the bundle root
+
+    Returns:
+        str: One of CATEGORIES
+    """
+    name = rel_path.lower()
+    ext = os.path.splitext(name)[1]
+    parts = name.split('/')
+
+    if ext == '.map':
+        return 'sourcemaps'
+    if ext == '.js':
+        return 'js'
+    if ext == '.css':
+        return 'css'
+    if ext == '.html':
+        return 'html'
+    if ext in FONT_EXTENSIONS:
+        return 'fonts'
+    if ext in ICON_EXTENSIONS or (ext in IMAGE_EXTENSIONS and 'icons' in parts):
+        return 'icons'
+    if ext in IMAGE_EXTENSIONS:
+        return 'images'
+    return 'other'
+
+
+class DeflateSizeCache:
+    """Remembers the deflated size of each file content hash between runs"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.sizes = {}
+        self.dirty = False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.sizes = json.load(f)
+        except (FileNotFoundError, ValueError):
+            pass
+
+    def get(self, sha256, file_path):
+        size = self.sizes.get(sha256)
+        if size is None:
+            with open(file_path, 'rb') as f:
+                size = len(zlib.compress(f.read(), 6))
+            self.sizes[sha256] = size
+            self.dirty = True
+        return size
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.sizes, f)
+        os.replace(tmp_path, self.path)
+
+
+def collect_tree(root, index, deflate_cache):
+    """
+    Measure every file of an unpacked store tree
+
+    Args:
+        root (Path): Store tree (e.g. store/chrome)
+        index (FileHashIndex): Content-hash index
+        deflate_cache (DeflateSizeCache): Deflated size cache
+
+    Returns:
+        list: File records (path, category, size, compressed, image)
+    """
+    records = []
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            file_path = Path(dirpath) / filename
+            rel = file_path.relative_to(root).as_posix()
+            sha256 = index.digest(file_path)
+            records.append({
+                'path': rel,
+                'category': categorize(rel),
+                'size': os.path.getsize(file_path),
+                'compressed': deflate_cache.get(sha256, file_path),
+                'image': read_image_header(file_path),
+            })
+    return records
+
+
+def collect_package(package_path):
+    """
+    Measure every member of a release archive from its central directory
+
+    Args:
+        package_path (Path): .zip/.xpi package
+
+    Returns:
+        list: File records (path, category, size, compressed, image)
+    """
+    records = []
+    with zipfile.ZipFile(package_path) as archive:
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+            image = None
+            if info.filename.lower().endswith('.png'):
+                with archive.open(info) as member:
+                    image = parse_png_header(member.read(PNG_HEADER_SIZE))
+            records.append({
+                'path': info.filename,
+                'category': categorize(info.filename),
+                'size': info.file_size,
+                'compressed': info.compress_size,
+                'image': image,
+            })
+    return records
+
+
+def summarize(records):
+    """Total uncompressed and compressed bytes per category"""
+    summary = {category: {'uncompressed': 0, 'compressed': 0, 'files': 0} for category in CATEGORIES}
+    summary['total'] = {'uncompressed': 0, 'compressed': 0, 'files': 0}
+    for record in records:
+        for key in (record['category'], 'total'):
+            summary[key]['uncompressed'] += record['size']
+            summary[key]['compressed'] += record['compressed']
+            summary[key]['files'] += 1
+    return summary
+
+
+def check_budget(summary, budget):
+    """
+    Compare a summary against one budget scope
+
+    Args:
+        summary (dict): Output of summarize()
+        budget (dict): {"uncompressed": {category: bytes}, "compressed": {...}}
+
+    Returns:
+        list: Violations as (metric, category, actual, limit)
+    """
+    violations = []
+    for metric in ('uncompressed', 'compressed'):
+        for category, limit in budget.get(metric, {}).items():
+            actual = summary.get(category, {}).get(metric, 0)
+            if actual > limit:
+                violations.append((metric, category, actual, limit))
+    return violations
+
+
+def format_bytes(size):
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.2f} MB"
+    if size >= 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size} B"
+
+
+def describe_image(image):
+    if not image or image['width'] is None:
+        return ''
+    return f" [{image['width']}x{image['height']} {image.get('mode', image['format'])}]"
+
+
+def print_summary(name, summary):
+    print(f"\n📦 {name}")
+    print(f"  {'category':<12}{'files':>6}{'uncompressed':>16}{'compressed':>14}")
+    for category in CATEGORIES + ['total']:
+        row = summary[category]
+        if not row['files']:
+            continue
+        print(f"  {category:<12}{row['files']:>6}{format_bytes(row['uncompressed']):>16}"
+              f"{format_bytes(row['compressed']):>14}")
+
+
+def print_offenders(records, violations, top):
+    for metric, category, actual, limit in violations:
+        print(f"  ❌ {category} {metric}: {format_bytes(actual)} exceeds budget of {format_bytes(limit)}")
+        key = 'size' if metric == 'uncompressed' else 'compressed'
+        candidates = [r for r in records if category == 'total' or r['category'] == category]
+        for record in sorted(candidates, key=lambda r: r[key], reverse=True)[:top]:
+            print(f"      {format_bytes(record[key]):>10}  {record['path']}{describe_image(record['image'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Analyze HeadForge bundle sizes against a budget')
+    parser.add_argument('--budget', default=DEFAULT_BUDGET,
+                       help=f'Budget file (default: {DEFAULT_BUDGET})')
+    parser.add_argument('--no-budget', action='store_true',
+                       help='Only report sizes, never fail')
+    parser.add_argument('--top', type=int, default=5,
+                       help='Number of offenders to list per exceeded budget (default: 5)')
+    parser.add_argument('--json', metavar='PATH',
+                       help='Also write the full per-file report as JSON')
+
+    args = parser.parse_args()
+
+    # Get the directory of this script
+    script_dir = Path(__file__).resolve().parent
+    project_root = script_dir.parent
+
+    start = time.perf_counter()
+    index = FileHashIndex(project_root / CACHE_DIR / 'index.json')
+    deflate_cache = DeflateSizeCache(project_root / CACHE_DIR / 'deflate.json')
+
+    bundles = []
+    store_dir = project_root / 'store'
+    if store_dir.is_dir():
+        for tree in sorted(p for p in store_dir.iterdir() if p.is_dir() and (p / 'manifest.json').exists()):
+            bundles.append(('store', tree.relative_to(project_root).as_posix(),
+                            collect_tree(tree, index, deflate_cache)))
+
+    packages_dir = project_root / 'release-packages'
+    if packages_dir.is_dir():
+        for package in sorted(p for p in packages_dir.iterdir() if p.suffix in PACKAGE_EXTENSIONS):
+            bundles.append(('package', package.relative_to(project_root).as_posix(),
+                            collect_package(package)))
+
+    index.save()
+    deflate_cache.save()
+
+    budget = {}
+    if not args.no_budget:
+        budget_path = project_root / args.budget
+        try:
+            with open(budget_path, 'r', encoding='utf-8') as f:
+                budget = json.load(f)
+        except FileNotFoundError:
+            print(f"Error: Budget file not found at {budget_path}")
+            return False
+
+    failed = False
+    report = []
+    for scope, name, records in bundles:
+        summary = summarize(records)
+        print_summary(name, summary)
+        violations = check_budget(summary, budget.get(scope, {}))
+        if violations:
+            failed = True
+            print_offenders(records, violations, args.top)
+        report.append({'name': name, 'scope': scope, 'summary': summary,
+                       'violations': [dict(zip(('metric', 'category', 'actual', 'limit'), v)) for v in violations],
+                       'files': records})
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"\n{'❌ Bundle budget exceeded' if failed else '✅ All bundles within budget'} "
+          f"({len(bundles)} bundle(s) analyzed in {elapsed_ms:.0f} ms)")
+    return not failed
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
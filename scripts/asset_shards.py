@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+HeadForge Asset Shards
+Cost-balanced partitioning of the asset build across CI jobs, per-shard
+manifests of what each job wrote, and merging those manifests back into one
+"""
+
+import hashlib
+import heapq
+import json
+import os
+from collections import namedtuple
+from pathlib import Path
+
+from file_index import hash_file
+
+SHARD_DIR = Path('.cache') / 'shards'
+MANIFEST_VERSION = 1
+
+# One output file: path relative to the project root, build category,
+# (width, height) in pixels and encode profile
+Artifact = namedtuple('Artifact', ['path', 'category', 'size', 'profile'])
+
+# Relative cost per pixel of each encode profile: optimized PNG effort grows
+# with the bytes per pixel, and tracing a vector icon is far dearer than a PNG
+ENCODE_PROFILES = {
+    'png-rgb': 3,
+    'png-rgba': 4,
+    'svg': 16,
+}
+
+
+def parse_shard(value):
+    """
+    Parse a shard spec
+
+    Args:
+        value (str): "i/N" with 1 <= i <= N
+
+    Returns:
+        tuple: (i, N)
+    """
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise ValueError(f'Invalid shard "{value}", expected i/N') from None
+    if not 1 <= index <= count:
+        raise ValueError(f'Invalid shard "{value}", i must be between 1 and N')
+    return index, count
+
+
+def estimate_cost(artifact):
+    """Estimated build cost of an artifact: pixel count x encode profile weight"""
+    width, height = artifact.size
+    return width * height * ENCODE_PROFILES[artifact.profile]
+
+
+def plan_digest(artifacts):
+    """Fingerprint of a plan, so shards built from different arguments are never merged"""
+    spec = json.dumps(sorted([Path(a.path).as_posix(), a.size, a.profile] for a in artifacts))
+    return hashlib.sha256(spec.encode('utf-8')).hexdigest()[:16]
+
+
+def partition(artifacts, count):
+    """
+    Split artifacts into count shards of similar estimated cost
+
+    Greedy longest-processing-time: artifacts are taken from the most to the
+    least expensive and each goes to the currently cheapest shard. Ties are
+    broken by path and shard number, so every job computes the same split.
+
+    Args:
+        artifacts (list): Artifact tuples
+        count (int): Number of shards
+
+    Returns:
+        list: count lists of artifacts, in plan order within each shard
+    """
+    order = {artifact.path: position for position, artifact in enumerate(artifacts)}
+    loads = [(0, shard) for shard in range(count)]
+    shards = [[] for _ in range(count)]
+    for artifact in sorted(artifacts, key=lambda a: (-estimate_cost(a), Path(a.path).as_posix())):
+        load, shard = heapq.heappop(loads)
+        shards[shard].append(artifact)
+        heapq.heappush(loads, (load + estimate_cost(artifact), shard))
+    return [sorted(shard, key=lambda a: order[a.path]) for shard in shards]
+
+
+def shard_manifest_path(index, count):
+    return SHARD_DIR / f'shard-{index}-of-{count}.json'
+
+
+def write_json_atomic(path, data):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+
+def write_shard_manifest(index, count, digest, artifacts, outputs, metrics):
+    """
+    Record what one shard wrote
+
+    Args:
+        index (int): Shard number, 1-based
+        count (int): Total number of shards
+        digest (str): plan_digest() of the full plan
+        artifacts (list): Artifacts assigned to this shard
+        outputs (dict): Artifact path -> file actually written
+        metrics (dict): Timings and other measurements of the shard run
+
+    Returns:
+        Path: Manifest path
+    """
+    entries = {}
+    for artifact in artifacts:
+        output = Path(outputs[artifact.path])
+        entries[output.as_posix()] = {
+            'category': artifact.category,
+            'size': list(artifact.size),
+            'profile': artifact.profile,
+            'estimated_cost': estimate_cost(artifact),
+            'bytes': output.stat().st_size,
+            'sha256': hash_file(output),
+        }
+
+    path = shard_manifest_path(index, count)
+    write_json_atomic(path, {
+        'version': MANIFEST_VERSION,
+        'plan': digest,
+        'shard': index,
+        'shards': count,
+        'metrics': {**metrics, 'estimated_cost': sum(e['estimated_cost'] for e in entries.values())},
+        'artifacts': entries,
+    })
+    return path
+
+
+def find_shard_manifests(location):
+    """
+    Locate shard manifests
+
+    Args:
+        location (str | Path): A manifest file, or the root of a downloaded
+            shard build containing .cache/shards/
+
+    Returns:
+        list: (manifest path, root the artifact paths are relative to)
+    """
+    location = Path(location)
+    if location.is_dir():
+        return [(path, location) for path in sorted((location / SHARD_DIR).glob('shard-*-of-*.json'))]
+    return [(location, Path('.'))]
+
+
+def merge_shards(locations, output_path):
+    """
+    Combine every shard's outputs and metrics into one manifest
+
+    Artifacts under a shard root other than the working directory are copied
+    into place. Every file is checked against the hash its shard recorded.
+
+    Args:
+        locations (list): Manifest files or shard roots, see find_shard_manifests()
+        output_path (str | Path): Merged manifest to write
+
+    Returns:
+        dict: Merged manifest
+
+    Raises:
+        ValueError: If the shards come from different plans, a shard is
+            missing or duplicated, or a file does not match its hash
+    """
+    import shutil
+
+    manifests = {}
+    for location in locations:
+        for path, root in find_shard_manifests(location):
+            with open(path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') != MANIFEST_VERSION:
+                raise ValueError(f'{path}: unsupported manifest version')
+            if manifest['shard'] in manifests:
+                raise ValueError(f'{path}: shard {manifest["shard"]} given twice')
+            manifests[manifest['shard']] = (manifest, root)
+    if not manifests:
+        raise ValueError('No shard manifests found')
+
+    first = next(iter(manifests.values()))[0]
+    count, digest = first['shards'], first['plan']
+    for manifest, _ in manifests.values():
+        if manifest['shards'] != count or manifest['plan'] != digest:
+            raise ValueError('Shard manifests come from different build plans')
+    missing = sorted(set(range(1, count + 1)) - set(manifests))
+    if missing:
+        raise ValueError(f'Missing shard(s): {", ".join(map(str, missing))} of {count}')
+
+    artifacts = {}
+    shard_metrics = []
+    for index in sorted(manifests):
+        manifest, root = manifests[index]
+        for name, entry in manifest['artifacts'].items():
+            source, target = root / name, Path(name)
+            if source.resolve() != target.resolve():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(source, target)
+            if hash_file(target) != entry['sha256']:
+                raise ValueError(f'{target} does not match shard {index}')
+            artifacts[name] = {**entry, 'shard': index}
+        shard_metrics.append({'shard': index, 'artifacts': len(manifest['artifacts']), **manifest['metrics']})
+
+    elapsed = [metrics['elapsed_ms'] for metrics in shard_metrics]
+    costs = [metrics['estimated_cost'] for metrics in shard_metrics]
+    merged = {
+        'version': MANIFEST_VERSION,
+        'plan': digest,
+        'shards': count,
+        'metrics': {
+            'artifacts': len(artifacts),
+            'bytes': sum(entry['bytes'] for entry in artifacts.values()),
+            'estimated_cost': sum(costs),
+            'elapsed_ms_total': round(sum(elapsed), 1),
+            'elapsed_ms_max': max(elapsed),
+            # 1.0 means perfectly even shards
+            'cost_imbalance': round(max(costs) * count / max(sum(costs), 1), 3),
+            'time_imbalance': round(max(elapsed) * count / max(sum(elapsed), 1), 3),
+            'per_shard': shard_metrics,
+        },
+        'artifacts': dict(sorted(artifacts.items())),
+    }
+    write_json_atomic(output_path, merged)
+    return merged
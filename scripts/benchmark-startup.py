@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+HeadForge Startup Benchmark
+Measures the import cost of each asset CLI with `python -X importtime` and
+asserts it stays within the startup budget
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Entry point -> import-time budget in milliseconds, on top of a bare interpreter
+STARTUP_BUDGETS_MS = {
+    'build-assets.py': 40,
+    'create-diagrams.py': 40,
+    'generate-assets.py': 40,
+    'generate-banner.py': 40,
+    'optimize-icons.py': 40,
+    'sync-store-assets.py': 40,
+    'analyze-bundle-size.py': 40,
+    'encode-image-variants.py': 40,
+    'subset-fonts.py': 40,
+    'dedupe-assets.py': 40,
+    'validate-store-assets.py': 40,
+    'visual-regression.py': 40,
+    'generate-fixtures.py': 40,
+}
+
+# Read-only incremental runs that find nothing to do on a built tree. They are
+# held to the same budget as --help: deciding that nothing changed must not
+# load the render stack either
+NOOP_COMMANDS = {
+    'generate-assets.py': ['--resume', '--dry-run'],
+    'sync-store-assets.py': ['--dry-run'],
+    'subset-fonts.py': ['--dry-run'],
+    'validate-store-assets.py': [],
+}
+
+# Modules that must only be imported on the render path
+HEAVY_MODULES = ['PIL', 'numpy', 'fontTools']
+
+
+def parse_importtime(stderr):
+    """
+    Parse `-X importtime` output
+
+    Args:
+        stderr (str): Captured stderr of the interpreter
+
+    Returns:
+        tuple: (total cumulative microseconds of top-level imports, set of module names)
+    """
+    total_us = 0
+    modules = set()
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules.add(name.strip())
+        # Nested imports are indented; only top-level ones add to the total
+        if not name[1:].startswith(' '):
+            total_us += int(cumulative)
+    return total_us, modules
+
+
+def measure(command, runs, cwd=None):
+    """
+    Run command repeatedly under -X importtime
+
+    Args:
+        command (list): Arguments after the interpreter
+        runs (int): Number of runs
+        cwd (Path): Working directory of the runs
+
+    Returns:
+        dict: Median wall time and import time in ms, imported modules and
+        the exit status of the last run
+    """
+    # Warm starts: the discarded first run leaves the scripts' bytecode in
+    # __pycache__ even where PYTHONDONTWRITEBYTECODE is set, as a developer's
+    # second invocation would find it; otherwise every run times the compiler
+    env = {key: value for key, value in os.environ.items() if key != 'PYTHONDONTWRITEBYTECODE'}
+    subprocess.run([sys.executable] + command, capture_output=True, cwd=cwd, env=env)
+
+    wall_times = []
+    import_times = []
+    modules = set()
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-X', 'importtime'] + command,
+                                capture_output=True, text=True, cwd=cwd, env=env)
+        wall_times.append((time.perf_counter() - start) * 1000)
+        total_us, modules = parse_importtime(result.stderr)
+        import_times.append(total_us / 1000)
+    return {
+        'wall_ms': statistics.median(wall_times),
+        'import_ms': statistics.median(import_times),
+        'modules': modules,
+        'returncode': result.returncode,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check the startup-time budget of the asset CLIs')
+    parser.add_argument('--runs', type=int, default=5,
+                       help='Runs per entry point, the median is reported (default: 5)')
+    parser.add_argument('--scale', type=float, default=1.0,
+                       help='Multiply every budget, e.g. on slow CI runners (default: 1.0)')
+    parser.add_argument('--help-only', action='store_true',
+                       help='Time only --help, not the no-op runs that need a built tree')
+
+    args = parser.parse_args()
+
+    script_dir = Path(__file__).resolve().parent
+
+    print("⏱️  Measuring CLI startup time...")
+    print("=" * 50)
+
+    baseline = measure(['-c', 'pass'], args.runs)
+    print(f"Interpreter baseline: {baseline['wall_ms']:.1f} ms wall, {baseline['import_ms']:.1f} ms imports\n")
+
+    runs = [(script, ['--help']) for script in STARTUP_BUDGETS_MS]
+    if not args.help_only:
+        runs += list(NOOP_COMMANDS.items())
+
+    failures = []
+    for script, script_args in runs:
+        script_path = script_dir / script
+        if not script_path.exists():
+            continue
+
+        # No-op runs resolve their paths from the repository root
+        result = measure([str(script_path)] + script_args, args.runs, cwd=script_dir.parent)
+        overhead_ms = max(result['import_ms'] - baseline['import_ms'], 0.0)
+        limit_ms = STARTUP_BUDGETS_MS[script] * args.scale
+        heavy = sorted(m for m in result['modules'] if m.split('.')[0] in HEAVY_MODULES)
+
+        label = ' '.join([script] + script_args)
+        ok = overhead_ms <= limit_ms and not heavy and result['returncode'] == 0
+        print(f"{'✅' if ok else '❌'} {label:<40} {overhead_ms:6.1f} ms imports "
+              f"(budget {limit_ms:.0f} ms), {result['wall_ms']:6.1f} ms wall")
+        if heavy:
+            print(f"   heavy modules imported: {', '.join(heavy[:5])}")
+        if result['returncode'] != 0:
+            print(f"   exited with status {result['returncode']}")
+        if not ok:
+            failures.append(label)
+
+    print("\n" + "=" * 50)
+    if failures:
+        print(f"❌ Startup budget exceeded: {', '.join(failures)}")
+        return False
+
+    print("✅ All entry points within their startup budget")
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -4,6 +4,7 @@ HeadForge Assets Builder
 Builds all assets (banners, icons) for the extension
 """
 
+import argparse
 import os
 import sys
 import subprocess
@@ -36,6 +37,9 @@ def run_script(script_path, args=None):
 def main():
     """Build all assets for the extension"""
     
+    parser = argparse.ArgumentParser(description='Build all HeadForge assets (banners, icons)')
+    parser.parse_args()
+    
     # Get the directory of this script
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
@@ -67,11 +71,37 @@ def main():
         print("❌ Icon script not found")
         return False
     
+    # Encode WebP/AVIF variants
+    print("\n🎞️  Encoding image variants...")
+    variants_script = script_dir / "encode-image-variants.py"
+    if variants_script.exists():
+        success = run_script(str(variants_script))
+        if not success:
+            print("❌ Image variant encoding failed")
+            return False
+    else:
+        print("❌ Image variant script not found")
+        return False
+    
+    # Subset bundled fonts to the characters each store tree uses
+    print("\n🔤 Subsetting fonts...")
+    fonts_script = script_dir / "subset-fonts.py"
+    if fonts_script.exists():
+        success = run_script(str(fonts_script))
+        if not success:
+            print("❌ Font subsetting failed")
+            return False
+    else:
+        print("❌ Font subsetting script not found")
+        return False
+    
     print("\n" + "=" * 50)
     print("✅ All assets built successfully!")
     print("\nGenerated files:")
     print("📸 Banners: src/assets/images/banner_*.png")
     print("🎨 Icons: src/assets/icons/icon-*.png")
+    print("🎞️  Variants: src/assets/images/*.webp, *.avif, image-variants.json")
+    print("🔤 Fonts: store/*/assets/fonts/*.woff2 (subset)")
     
     return True
 
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+HeadForge Build Journal
+Append-only record of the artifacts an asset build has finished, so a build
+that dies partway can resume with only the missing or corrupt ones
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+from file_index import hash_file
+
+JOURNAL_DIR = Path('.cache') / 'journal'
+JOURNAL_VERSION = 1
+
+
+class BuildJournal:
+    """
+    One JSON line per completed artifact after a header line naming the build.
+
+    An artifact is recorded only once its atomic rename is done, so every
+    entry names a complete file. Each line goes out in a single os.write() on
+    an O_APPEND descriptor, so the main process and the locale workers can
+    record side by side, and a kill leaves at most a torn last line, which
+    load() skips. The journal is picklable; a worker's copy opens its own
+    descriptor on its first record(). Sink threads record concurrently, so
+    the descriptor is opened and closed under a lock.
+    """
+
+    def __init__(self, path, build):
+        self.path = Path(path)
+        self.build = build
+        self._fd = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {'path': self.path, 'build': self.build}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._fd = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """
+        Entries of an existing journal of this build
+
+        Returns:
+            dict | None: Path -> {"sha256", "bytes"} (the last entry per path
+            wins), or None if there is no journal or it belongs to another build
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return None
+
+        try:
+            header = json.loads(lines[0])
+        except (IndexError, ValueError):
+            return None
+        if header.get('version') != JOURNAL_VERSION or header.get('build') != self.build:
+            return None
+
+        entries = {}
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            entries[entry['path']] = {'sha256': entry['sha256'], 'bytes': entry['bytes']}
+        return entries
+
+    def verify(self, entries):
+        """
+        Split journal entries into files still intact and files missing or changed
+
+        Returns:
+            tuple: (intact path -> entry, list of rejected paths)
+        """
+        intact, rejected = {}, []
+        for path, entry in entries.items():
+            try:
+                ok = os.path.getsize(path) == entry['bytes'] and hash_file(path) == entry['sha256']
+            except OSError:
+                ok = False
+            if ok:
+                intact[path] = entry
+            else:
+                rejected.append(path)
+        return intact, rejected
+
+    def rewrite(self, entries=None):
+        """Atomically replace the journal with a header and the given entries"""
+        self.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lines = [json.dumps({'version': JOURNAL_VERSION, 'build': self.build})]
+        lines.extend(json.dumps({'path': path, **entry}) for path, entry in sorted((entries or {}).items()))
+        tmp_path = self.path.with_name(f'{self.path.name}.{os.getpid()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        os.replace(tmp_path, self.path)
+
+    def record(self, path):
+        """Append a completed artifact with its content hash"""
+        line = json.dumps({'path': Path(path).as_posix(), 'sha256': hash_file(path),
+                           'bytes': os.path.getsize(path)}) + '\n'
+        with self._lock:
+            if self._fd is None:
+                self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            os.write(self._fd, line.encode('utf-8'))
+
+    def close(self):
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+
+def remove_partial_writes(paths):
+    """
+    Delete the temporary files interrupted atomic writes left next to paths
+
+    Returns:
+        int: Number of files removed
+    """
+    removed = 0
+    for path in paths:
+        path = Path(path)
+        if not path.parent.is_dir():
+            continue
+        for tmp_path in path.parent.glob(f'.{path.name}.*.tmp'):
+            tmp_path.unlink()
+            removed += 1
+    return removed
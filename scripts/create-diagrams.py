@@ -4,91 +4,159 @@ HeadForge Diagram Generator
 Creates architecture and user flow diagrams for the project
 """
 
+import argparse
+import hashlib
+import json
 import os
 import sys
+import time
 from pathlib import Path
 
-def create_architecture_diagram():
-    """Create architecture diagram using Mermaid syntax"""
-    
-    mermaid_content = """
-graph TB
-    subgraph "HeadForge Extension"
-        subgraph "User Interface"
-            A[Popup Interface<br/>- Form Input<br/>- Real-time Preview<br/>- Export Options]
-            B[Options Page<br/>- Settings<br/>- Preferences<br/>- Theme Config]
-        end
-        
-        subgraph "Core Logic"
-            C[Background Script<br/>- Service Worker<br/>- Message Handler<br/>- Storage Manager]
-            D[Content Scripts<br/>- Editor Integration<br/>- DOM Manipulation<br/>- Code Insertion]
-        end
-        
-        subgraph "Utilities"
-            E[Template Engine<br/>- Header Generation<br/>- Language Support<br/>- Formatting]
-            F[Validation<br/>- Input Validation<br/>- Data Sanitization<br/>- Error Handling]
-            G[Storage Utils<br/>- Local Storage<br/>- Settings Management<br/>- Preferences]
-        end
-        
-        subgraph "Data Layer"
-            H[Language Configs<br/>- 25+ Languages<br/>- Comment Syntax<br/>- Templates]
-            I[User Settings<br/>- Preferences<br/>- Theme<br/>- Defaults]
-            J[Header Data<br/>- Form Input<br/>- Generated Content<br/>- Export Options]
-        end
-    end
-    
-    subgraph "External Systems"
-        K[Browser APIs<br/>- Storage API<br/>- Clipboard API<br/>- File API]
-        L[Web Pages<br/>- Code Editors<br/>- Development Tools<br/>- IDEs]
-    end
-    
-    %% User interactions
-    A --> E
-    A --> F
-    A --> G
-    B --> G
-    B --> I
-    
-    %% Core logic connections
-    C --> E
-    C --> F
-    C --> G
-    D --> E
-    D --> L
-    
-    %% Data flow
-    E --> H
-    F --> J
-    G --> I
-    G --> J
-    
-    %% External connections
-    C --> K
-    D --> K
-    A --> K
-    
-    %% Styling
-    classDef ui fill:#e1f5fe,stroke:#01579b,stroke-width:2px
-    classDef core fill:#f3e5f5,stroke:#4a148c,stroke-width:2px
-    classDef utils fill:#e8f5e8,stroke:#1b5e20,stroke-width:2px
-    classDef data fill:#fff3e0,stroke:#e65100,stroke-width:2px
-    classDef external fill:#fce4ec,stroke:#880e4f,stroke-width:2px
-    
-    class A,B ui
-    class C,D core
-    class E,F,G utils
-    class H,I,J data
-    class K,L external
-"""
+DIAGRAM_FILES = [
+    "docs/assets/architecture-diagram.mmd",
+    "docs/assets/architecture-simple.mmd",
+    "docs/assets/user-flow.mmd",
+    "docs/assets/user-flow-simple.mmd",
+    "docs/assets/data-flow.mmd",
+    "docs/assets/component-diagram.mmd",
+    "docs/assets/deployment-diagram.mmd",
+]
+
+RENDER_MANIFEST = Path(".cache") / "diagrams" / "manifest.json"
+
+def write_diagram(diagram_path, content, title):
+    """
+    Write a diagram source, leaving the file untouched if its content is unchanged
+    
+    Args:
+        diagram_path (Path): Output .mmd file
+        content (str): Mermaid source
+        title (str): Human-readable diagram name for the log
+    
+    Returns:
+        bool: True if the file was written
+    """
+    data = content.strip().encode("utf-8")
+    if diagram_path.exists() and hashlib.sha256(diagram_path.read_bytes()).digest() == hashlib.sha256(data).digest():
+        print(f"⏭️  {title} unchanged: {diagram_path}")
+        return False
     
-    # Save to file
-    diagram_path = Path("docs/assets/architecture-diagram.mmd")
     diagram_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(diagram_path, "w", encoding="utf-8") as f:
-        f.write(mermaid_content.strip())
-    
-    print(f"✅ Architecture diagram created: {diagram_path}")
+    diagram_path.write_bytes(data)
+    print(f"✅ {title} created: {diagram_path}")
+    return True
+
+# Module path prefix -> (area id, label); most specific first
+SOURCE_AREAS = [
+    ("popup/components/", "popup_components", "Popup Components"),
+    ("popup/", "popup", "Popup Interface"),
+    ("options/pages/", "options_pages", "Options Pages"),
+    ("options/", "options", "Options Page"),
+    ("background/", "background", "Background Script"),
+    ("content/", "content", "Content Script"),
+    ("types/", "types", "Type Definitions"),
+]
+
+UI_AREAS = ["popup", "popup_components", "options", "options_pages"]
+CORE_AREAS = ["background", "content"]
+
+BROWSER_APIS = {
+    "storage": "Storage API<br/>chrome.storage",
+    "messaging": "Runtime Messaging<br/>sendMessage / onMessage",
+    "clipboard": "Clipboard API",
+    "downloads": "File Downloads<br/>Blob URLs",
+    "tabs": "Tabs API",
+}
+
+def node_id(name):
+    """Turn a module path or area name into a Mermaid node id"""
+    return "".join(c if c.isalnum() else "_" for c in name)
+
+def module_title(module):
+    """'utils/template-engine.ts' -> 'Template Engine'"""
+    stem = Path(module).stem
+    return " ".join(part.capitalize() for part in stem.replace("_", "-").split("-"))
+
+def area_of(module):
+    """Return the area id of a module; every utility module is its own area"""
+    for prefix, area, _ in SOURCE_AREAS:
+        if module.startswith(prefix):
+            return area
+    return node_id(module)
+
+def area_label(index, area):
+    """Area title followed by the modules it contains"""
+    title = next((label for _, a, label in SOURCE_AREAS if a == area), None)
+    modules = sorted(Path(m).name for m in index.modules if area_of(m) == area)
+    if title is None:
+        module = next(m for m in index.modules if area_of(m) == area)
+        return f"{module_title(module)}<br/>{Path(module).name}"
+    listed = [f"- {name}" for name in modules[:4]]
+    if len(modules) > 4:
+        listed.append(f"- +{len(modules) - 4} more")
+    return "<br/>".join([title] + listed)
+
+def area_edges(index):
+    """Import edges aggregated to areas, as sorted (src, dst, dynamic) tuples"""
+    edges = {}
+    for src, dst, dynamic in index.edges():
+        pair = (area_of(src), area_of(dst))
+        if pair[0] != pair[1]:
+            edges[pair] = edges.get(pair, True) and dynamic
+    return sorted((a, b, dynamic) for (a, b), dynamic in edges.items())
+
+def api_edges(index, areas=True):
+    """(source, api) pairs for every browser capability a module or area uses"""
+    pairs = set()
+    for module in index.modules:
+        for api in index.apis(module):
+            pairs.add((area_of(module) if areas else node_id(module), api))
+    return sorted(pairs)
+
+def edge_line(src, dst, dynamic=False):
+    return f"    {src} {'-.->' if dynamic else '-->'} {dst}"
+
+def class_line(ids, name):
+    return f"    class {','.join(ids)} {name}" if ids else None
+
+def create_architecture_diagram(index):
+    """Create architecture diagram from the import graph of src/"""
+    
+    util_areas = sorted({area_of(m) for m in index.modules if m.startswith("utils/")})
+    used_apis = sorted({api for _, api in api_edges(index)})
+    
+    def nodes(areas):
+        return [f"            {area}[{area_label(index, area)}]" for area in areas]
+    
+    lines = ["graph TB", '    subgraph "HeadForge Extension"']
+    lines += ['        subgraph "User Interface"'] + nodes(UI_AREAS) + ["        end"]
+    lines += ['        subgraph "Core Logic"'] + nodes(CORE_AREAS) + ["        end"]
+    lines += ['        subgraph "Utilities"'] + nodes(util_areas) + ["        end"]
+    lines += ['        subgraph "Data Layer"'] + nodes(["types"]) + ["        end"]
+    lines += ["    end", '    subgraph "External Systems"']
+    lines += [f"        api_{api}[{BROWSER_APIS[api]}]" for api in used_apis]
+    lines += ["    end", "", "    %% Module imports (dashed: dynamic import)"]
+    lines += [edge_line(src, dst, dynamic) for src, dst, dynamic in area_edges(index)]
+    lines += ["", "    %% Browser API usage"]
+    lines += [edge_line(area, f"api_{api}") for area, api in api_edges(index)]
+    lines += [
+        "",
+        "    %% Styling",
+        "    classDef ui fill:#e1f5fe,stroke:#01579b,stroke-width:2px",
+        "    classDef core fill:#f3e5f5,stroke:#4a148c,stroke-width:2px",
+        "    classDef utils fill:#e8f5e8,stroke:#1b5e20,stroke-width:2px",
+        "    classDef data fill:#fff3e0,stroke:#e65100,stroke-width:2px",
+        "    classDef external fill:#fce4ec,stroke:#880e4f,stroke-width:2px",
+        "",
+        class_line(UI_AREAS, "ui"),
+        class_line(CORE_AREAS, "core"),
+        class_line(util_areas, "utils"),
+        class_line(["types"], "data"),
+        class_line([f"api_{api}" for api in used_apis], "external"),
+    ]
+    mermaid_content = "\n".join(line for line in lines if line is not None)
+    
+    write_diagram(Path("docs/assets/architecture-diagram.mmd"), mermaid_content, "Architecture diagram")
     
     # Also create a simplified version
     simple_mermaid = """
@@ -115,11 +183,7 @@ graph LR
     class D,E,I,J data
 """
     
-    simple_path = Path("docs/assets/architecture-simple.mmd")
-    with open(simple_path, "w", encoding="utf-8") as f:
-        f.write(simple_mermaid.strip())
-    
-    print(f"✅ Simple architecture diagram created: {simple_path}")
+    write_diagram(Path("docs/assets/architecture-simple.mmd"), simple_mermaid, "Simple architecture diagram")
 
 def create_user_flow_diagram():
     """Create user flow diagram using Mermaid syntax"""
@@ -192,14 +256,7 @@ graph TD
     class T end
 """
     
-    # Save to file
-    diagram_path = Path("docs/assets/user-flow.mmd")
-    diagram_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(diagram_path, "w", encoding="utf-8") as f:
-        f.write(mermaid_content.strip())
-    
-    print(f"✅ User flow diagram created: {diagram_path}")
+    write_diagram(Path("docs/assets/user-flow.mmd"), mermaid_content, "User flow diagram")
     
     # Also create a simplified version
     simple_flow = """
@@ -224,166 +281,87 @@ graph LR
     class H end
 """
     
-    simple_path = Path("docs/assets/user-flow-simple.mmd")
-    with open(simple_path, "w", encoding="utf-8") as f:
-        f.write(simple_flow.strip())
-    
-    print(f"✅ Simple user flow diagram created: {simple_path}")
+    write_diagram(Path("docs/assets/user-flow-simple.mmd"), simple_flow, "Simple user flow diagram")
 
-def create_data_flow_diagram():
-    """Create data flow diagram"""
-    
-    mermaid_content = """
-graph TB
-    subgraph "Input Layer"
-        A[User Form Input]
-        B[Settings/Preferences]
-        C[Language Selection]
-    end
-    
-    subgraph "Processing Layer"
-        D[Input Validation]
-        E[Data Sanitization]
-        F[Template Processing]
-        G[Language Configuration]
-    end
-    
-    subgraph "Storage Layer"
-        H[Local Storage]
-        I[User Preferences]
-        J[Language Configs]
-    end
-    
-    subgraph "Output Layer"
-        K[Generated Header]
-        L[Preview Display]
-        M[Export Options]
-    end
-    
-    subgraph "External Layer"
-        N[Clipboard API]
-        O[File Download]
-        P[Editor Insertion]
-    end
-    
-    %% Data flow
-    A --> D
-    B --> I
-    C --> G
-    
-    D --> E
-    E --> F
-    F --> G
-    G --> J
-    
-    I --> H
-    J --> H
-    
-    F --> K
-    K --> L
-    K --> M
-    
-    M --> N
-    M --> O
-    M --> P
-    
-    %% Styling
-    classDef input fill:#e8f5e8,stroke:#2e7d32,stroke-width:2px
-    classDef process fill:#e3f2fd,stroke:#1565c0,stroke-width:2px
-    classDef storage fill:#fff3e0,stroke:#ef6c00,stroke-width:2px
-    classDef output fill:#f3e5f5,stroke:#7b1fa2,stroke-width:2px
-    classDef external fill:#fce4ec,stroke:#c2185b,stroke-width:2px
-    
-    class A,B,C input
-    class D,E,F,G process
-    class H,I,J storage
-    class K,L,M output
-    class N,O,P external
-"""
-    
-    diagram_path = Path("docs/assets/data-flow.mmd")
-    diagram_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(diagram_path, "w", encoding="utf-8") as f:
-        f.write(mermaid_content.strip())
-    
-    print(f"✅ Data flow diagram created: {diagram_path}")
+def create_data_flow_diagram(index):
+    """Create data flow diagram from the import graph and browser API usage in src/"""
+    
+    edges = area_edges(index)
+    ui_areas = [area for area in UI_AREAS if any(area_of(m) == area for m in index.modules)]
+    # Processing: utility modules that something actually imports
+    processing = sorted({dst for src, dst, _ in edges if dst.startswith("utils_")})
+    used_apis = {api for _, api in api_edges(index)}
+    storage = [api for api in ["storage", "messaging"] if api in used_apis]
+    output = [api for api in ["clipboard", "downloads", "tabs"] if api in used_apis]
+    
+    def nodes(areas):
+        return [f"        {area}[{area_label(index, area).split('<br/>')[0]}]" for area in areas]
+    
+    lines = ["graph TB"]
+    lines += ['    subgraph "Input Layer"'] + nodes(ui_areas) + ["    end"]
+    lines += ['    subgraph "Processing Layer"'] + nodes(processing) + ["    end"]
+    lines += ['    subgraph "Extension Runtime"'] + nodes(CORE_AREAS) + ["    end"]
+    lines += ['    subgraph "Storage Layer"'] + [f"        api_{api}[{BROWSER_APIS[api]}]" for api in storage] + ["    end"]
+    lines += ['    subgraph "Output Layer"'] + [f"        api_{api}[{BROWSER_APIS[api]}]" for api in output] + ["    end"]
+    
+    shown = set(ui_areas + processing + CORE_AREAS)
+    lines += ["", "    %% Data flow"]
+    lines += [edge_line(src, dst, dynamic) for src, dst, dynamic in edges if src in shown and dst in shown]
+    lines += [edge_line(area, f"api_{api}") for area, api in api_edges(index) if area in shown]
+    lines += [
+        "",
+        "    %% Styling",
+        "    classDef input fill:#e8f5e8,stroke:#2e7d32,stroke-width:2px",
+        "    classDef process fill:#e3f2fd,stroke:#1565c0,stroke-width:2px",
+        "    classDef storage fill:#fff3e0,stroke:#ef6c00,stroke-width:2px",
+        "    classDef output fill:#f3e5f5,stroke:#7b1fa2,stroke-width:2px",
+        "    classDef external fill:#fce4ec,stroke:#c2185b,stroke-width:2px",
+        "",
+        class_line(ui_areas, "input"),
+        class_line(processing, "process"),
+        class_line(CORE_AREAS, "external"),
+        class_line([f"api_{api}" for api in storage], "storage"),
+        class_line([f"api_{api}" for api in output], "output"),
+    ]
+    mermaid_content = "\n".join(line for line in lines if line is not None)
+    
+    write_diagram(Path("docs/assets/data-flow.mmd"), mermaid_content, "Data flow diagram")
 
-def create_component_diagram():
-    """Create component relationship diagram"""
-    
-    mermaid_content = """
-graph TB
-    subgraph "HeadForge Extension"
-        subgraph "UI Components"
-            A[Popup Interface]
-            B[Options Page]
-            C[Settings Pages]
-        end
-        
-        subgraph "Core Services"
-            D[Template Engine]
-            E[Validation Service]
-            F[Storage Service]
-            G[Theme Service]
-        end
-        
-        subgraph "Utilities"
-            H[Date Utils]
-            I[Clipboard Utils]
-            J[File Utils]
-            K[Language Utils]
-        end
-        
-        subgraph "Data Models"
-            L[Header Data]
-            M[Language Config]
-            N[User Settings]
-            O[Theme Config]
-        end
-    end
-    
-    %% Component relationships
-    A --> D
-    A --> E
-    A --> F
-    A --> G
-    
-    B --> F
-    B --> G
-    C --> F
-    
-    D --> K
-    D --> L
-    D --> M
-    
-    E --> L
-    F --> N
-    G --> O
-    
-    A --> H
-    A --> I
-    A --> J
-    
-    %% Styling
-    classDef ui fill:#e8f5e8,stroke:#2e7d32,stroke-width:2px
-    classDef service fill:#e3f2fd,stroke:#1565c0,stroke-width:2px
-    classDef util fill:#fff3e0,stroke:#ef6c00,stroke-width:2px
-    classDef data fill:#f3e5f5,stroke:#7b1fa2,stroke-width:2px
-    
-    class A,B,C ui
-    class D,E,F,G service
-    class H,I,J,K util
-    class L,M,N,O data
-"""
-    
-    diagram_path = Path("docs/assets/component-diagram.mmd")
-    diagram_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(diagram_path, "w", encoding="utf-8") as f:
-        f.write(mermaid_content.strip())
-    
-    print(f"✅ Component diagram created: {diagram_path}")
+def create_component_diagram(index):
+    """Create component relationship diagram with one node per module in src/"""
+    
+    groups = {}
+    for module in sorted(index.modules):
+        groups.setdefault(str(Path(module).parent.as_posix()), []).append(module)
+    
+    lines = ["graph TB", '    subgraph "HeadForge Extension"']
+    for directory, modules in groups.items():
+        lines.append(f'        subgraph "{directory}/"')
+        lines += [f"            {node_id(m)}[{module_title(m)}<br/>{Path(m).name}]" for m in modules]
+        lines.append("        end")
+    lines += ["    end", "", "    %% Component relationships (dashed: dynamic import)"]
+    lines += [edge_line(node_id(src), node_id(dst), dynamic)
+              for src, dst, dynamic in index.edges(include_types=False)]
+    
+    def ids(*prefixes):
+        return [node_id(m) for m in sorted(index.modules) if m.startswith(prefixes)]
+    
+    lines += [
+        "",
+        "    %% Styling",
+        "    classDef ui fill:#e8f5e8,stroke:#2e7d32,stroke-width:2px",
+        "    classDef service fill:#e3f2fd,stroke:#1565c0,stroke-width:2px",
+        "    classDef util fill:#fff3e0,stroke:#ef6c00,stroke-width:2px",
+        "    classDef data fill:#f3e5f5,stroke:#7b1fa2,stroke-width:2px",
+        "",
+        class_line(ids("popup/", "options/"), "ui"),
+        class_line(ids("background/", "content/"), "service"),
+        class_line(ids("utils/"), "util"),
+        class_line(ids("types/"), "data"),
+    ]
+    mermaid_content = "\n".join(line for line in lines if line is not None)
+    
+    write_diagram(Path("docs/assets/component-diagram.mmd"), mermaid_content, "Component diagram")
 
 def create_deployment_diagram():
     """Create deployment and CI/CD diagram"""
@@ -463,40 +441,122 @@ graph TB
     class Q,R,S,T user
 """
     
-    diagram_path = Path("docs/assets/deployment-diagram.mmd")
-    diagram_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(diagram_path, "w", encoding="utf-8") as f:
-        f.write(mermaid_content.strip())
-    
-    print(f"✅ Deployment diagram created: {diagram_path}")
+    write_diagram(Path("docs/assets/deployment-diagram.mmd"), mermaid_content, "Deployment diagram")
+
+def load_render_manifest():
+    try:
+        with open(RENDER_MANIFEST, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def save_render_manifest(manifest):
+    RENDER_MANIFEST.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = RENDER_MANIFEST.with_name(RENDER_MANIFEST.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, RENDER_MANIFEST)
+
+def render_diagrams(formats, scale=1.0, jobs=None, force=False):
+    """
+    Render changed .mmd files to SVG and/or PNG with the built-in renderer
+    
+    Each output is keyed by the hash of its diagram source, the renderer code
+    and the render settings; outputs whose key and file hash still match the
+    manifest are skipped, the rest are rendered in parallel.
+    """
+    import mermaid_render
+    from file_index import hash_file
+
+    start = time.perf_counter()
+    renderer_hash = hash_file(mermaid_render.__file__)
+    manifest = {} if force else load_render_manifest()
+    
+    pending = []
+    for diagram_file in DIAGRAM_FILES:
+        source_path = Path(diagram_file)
+        source_hash = hashlib.sha256(source_path.read_bytes()).hexdigest()
+        outputs = {}
+        for fmt in formats:
+            output_path = source_path.with_suffix(f".{fmt}")
+            key = hashlib.sha256(f"{source_hash}:{renderer_hash}:{fmt}:{scale}".encode()).hexdigest()
+            entry = manifest.get(output_path.as_posix())
+            if entry and entry["key"] == key and output_path.exists() and hash_file(output_path) == entry["sha256"]:
+                print(f"⏭️  Up to date {output_path}")
+                continue
+            outputs[fmt] = (output_path, key)
+        if outputs:
+            pending.append((source_path, outputs))
+    
+    def job_args(source_path, outputs):
+        svg_path = str(outputs["svg"][0]) if "svg" in outputs else None
+        png_path = str(outputs["png"][0]) if "png" in outputs else None
+        return str(source_path), svg_path, png_path, scale
+    
+    if len(pending) > 1 and jobs != 1:
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(mermaid_render.render_file, *job_args(*job)) for job in pending]
+            for future in futures:
+                future.result()
+    else:
+        for job in pending:
+            mermaid_render.render_file(*job_args(*job))
+    
+    for _, outputs in pending:
+        for output_path, key in outputs.values():
+            manifest[output_path.as_posix()] = {"key": key, "sha256": hash_file(output_path)}
+            print(f"🖼️  Rendered {output_path}")
+    if pending:
+        save_render_manifest(manifest)
+    
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"✅ Rendered {len(pending)} of {len(DIAGRAM_FILES)} diagrams in {elapsed_ms:.0f} ms")
 
 def main():
     """Main function to create all diagrams"""
+    parser = argparse.ArgumentParser(description="Create HeadForge Mermaid diagrams in docs/assets")
+    parser.add_argument("--render", action="store_true",
+                       help="Also render the diagrams offline with the built-in renderer")
+    parser.add_argument("--formats", nargs="+", choices=["svg", "png"], default=["svg", "png"],
+                       help="Output formats for --render (default: svg png)")
+    parser.add_argument("--scale", type=float, default=1.0,
+                       help="PNG pixels per diagram unit for --render (default: 1.0)")
+    parser.add_argument("--jobs", type=int, default=None,
+                       help="Parallel render processes for --render (default: CPU count)")
+    parser.add_argument("--force", action="store_true",
+                       help="Re-render every diagram even if its source is unchanged")
+    args = parser.parse_args()
+    
     print("🎨 Creating HeadForge diagrams...")
     print("=" * 40)
     
     try:
-        create_architecture_diagram()
+        from source_index import build_index
+        
+        index = build_index("src")
+        print(f"🔍 Indexed {len(index.modules)} modules in src/ ({index.reparsed} re-parsed)")
+        
+        create_architecture_diagram(index)
         create_user_flow_diagram()
-        create_data_flow_diagram()
-        create_component_diagram()
+        create_data_flow_diagram(index)
+        create_component_diagram(index)
         create_deployment_diagram()
         
         print("\n✅ All diagrams created successfully!")
         print("\n📋 Generated files:")
-        print("  • docs/assets/architecture-diagram.mmd")
-        print("  • docs/assets/architecture-simple.mmd")
-        print("  • docs/assets/user-flow.mmd")
-        print("  • docs/assets/user-flow-simple.mmd")
-        print("  • docs/assets/data-flow.mmd")
-        print("  • docs/assets/component-diagram.mmd")
-        print("  • docs/assets/deployment-diagram.mmd")
+        for diagram_file in DIAGRAM_FILES:
+            print(f"  • {diagram_file}")
         
-        print("\n💡 To convert to images, use:")
-        print("  • Mermaid CLI: mmdc -i diagram.mmd -o diagram.png")
-        print("  • Online: https://mermaid.live/")
-        print("  • VS Code: Mermaid Preview extension")
+        if args.render:
+            print()
+            render_diagrams(args.formats, args.scale, args.jobs, args.force)
+        else:
+            print("\n💡 To convert to images, use:")
+            print("  • Built-in offline renderer: python scripts/create-diagrams.py --render")
+            print("  • Mermaid CLI: mmdc -i diagram.mmd -o diagram.png")
+            print("  • Online: https://mermaid.live/")
         
     except Exception as error:
         print(f"❌ Error creating diagrams: {error}")
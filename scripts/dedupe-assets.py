@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+HeadForge Asset Deduplicator
+Finds near-duplicate images and asset files no page or manifest references in
+src/assets and the store trees, and optionally prunes them from the bundles
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import posixpath
+import re
+import sys
+import time
+from pathlib import Path
+
+from perceptual_hash import HASHABLE_SUFFIXES, clusters, hash_image, near_pairs
+from perceptual_hash import PerceptualHashIndex
+from store_layout import shipped_patterns
+
+STORE_TARGETS = ['chrome', 'edge', 'firefox']
+CACHE_DIR = Path('.cache') / 'phash'
+DEFAULT_DISTANCE = 10
+
+ASSET_SUFFIXES = HASHABLE_SUFFIXES | {'.svg', '.avif', '.woff', '.woff2', '.ttf', '.otf'}
+REFERENCING_SUFFIXES = {'.html', '.css', '.js', '.ts', '.json'}
+
+# A path-like token ending in an asset extension: src="...", url(...), string literals
+ASSET_REFERENCE = re.compile(
+    r'[\w@./-]*\.(?:' + '|'.join(sorted(suffix[1:] for suffix in ASSET_SUFFIXES)) + r')\b', re.I)
+
+# Paths loaded by the stores themselves rather than by any page; store trees
+# also keep their shipped_patterns(), which sync and the validators expect
+DEFAULT_KEEP = ['manifest.json']
+
+
+def list_tree(root):
+    """Relative POSIX path -> absolute path of every regular file under root"""
+    files = {}
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.is_file(follow_symlinks=False):
+                    files[Path(entry.path).relative_to(root).as_posix()] = Path(entry.path)
+    return files
+
+
+def referenced_paths(files):
+    """
+    Tree-relative paths referenced by the pages, styles, scripts and manifests of a tree
+
+    A reference is resolved both against the referencing file's directory and
+    against the tree root (where runtime.getURL() and manifest paths point).
+    Patterns under web_accessible_resources only expose files, so they do not
+    count as references.
+
+    Args:
+        files (dict): Output of list_tree()
+
+    Returns:
+        set: Relative POSIX paths
+    """
+    references = set()
+    for rel, path in files.items():
+        if Path(rel).suffix not in REFERENCING_SUFFIXES:
+            continue
+        text = path.read_text(encoding='utf-8', errors='replace')
+        if path.name == 'manifest.json':
+            try:
+                manifest = json.loads(text)
+                manifest.pop('web_accessible_resources', None)
+                text = json.dumps(manifest)
+            except ValueError:
+                pass
+
+        base = Path(rel).parent.as_posix()
+        for match in ASSET_REFERENCE.finditer(text):
+            reference = match.group(0)
+            references.add(posixpath.normpath(reference.lstrip('/')))
+            if not reference.startswith('/'):
+                references.add(posixpath.normpath(f'{base}/{reference}'))
+    return references
+
+
+def collect_trees(project_root):
+    """
+    Asset trees to scan
+
+    Returns:
+        list: (name, root, prunable) for src/ and every store/* directory
+    """
+    trees = [('src', project_root / 'src', False)]
+    store_root = project_root / 'store'
+    if store_root.is_dir():
+        for path in sorted(store_root.iterdir()):
+            if path.is_dir():
+                trees.append((f'store/{path.name}', path, path.name in STORE_TARGETS))
+    return trees
+
+
+def hash_images(paths, index, jobs):
+    """
+    Perceptual hashes of every distinct image content
+
+    Args:
+        paths (dict): Project-relative key -> absolute path of each image
+        index (PerceptualHashIndex): Content-hash and perceptual-hash cache
+        jobs (int): Worker processes for images not in the cache
+
+    Returns:
+        tuple: (content hash -> hashes, key -> content hash, images decoded)
+    """
+    content = {key: index.content_hash(path, key) for key, path in paths.items()}
+
+    pending = {}
+    for key, sha256 in content.items():
+        if index.lookup(sha256) is None and sha256 not in pending:
+            pending[sha256] = paths[key]
+
+    if jobs != 1 and len(pending) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = executor.map(hash_image_safe, pending.values(), chunksize=16)
+            for sha256, hashes in zip(pending, results):
+                index.record(sha256, hashes)
+    else:
+        for sha256, path in pending.items():
+            index.record(sha256, hash_image_safe(path))
+
+    hashes = {sha256: index.lookup(sha256) for sha256 in set(content.values())}
+    return {sha256: entry for sha256, entry in hashes.items() if entry}, content, len(pending)
+
+
+def split_key(key):
+    """Split a project-relative path into (tree name, tree-relative path)"""
+    parts = key.split('/')
+    depth = 2 if parts[0] == 'store' else 1
+    return '/'.join(parts[:depth]), '/'.join(parts[depth:])
+
+
+def hash_image_safe(path):
+    # Unreadable images are cached as an empty entry so they are not retried every run
+    try:
+        return hash_image(path)
+    except Exception:
+        return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find near-duplicate and unreferenced HeadForge assets')
+    parser.add_argument('--distance', type=int, default=DEFAULT_DISTANCE,
+                       help=f'Maximum dHash and pHash Hamming distance of near-duplicates (default: {DEFAULT_DISTANCE})')
+    parser.add_argument('--same-size', action='store_true',
+                       help='Only pair images with identical dimensions, ignoring scaled renditions')
+    parser.add_argument('--keep', nargs='+', default=[], metavar='PATTERN',
+                       help='Tree-relative glob patterns never reported as unreferenced, e.g. "icons/*.ico"')
+    parser.add_argument('--prune', action='store_true',
+                       help='Delete unreferenced assets from store/chrome, store/edge and store/firefox')
+    parser.add_argument('--jobs', type=int,
+                       help='Parallel hashing processes for uncached images (default: CPU count)')
+    parser.add_argument('--json', metavar='PATH',
+                       help='Write the clusters and unreferenced files to a JSON report')
+
+    args = parser.parse_args()
+
+    # Get the directory of this script
+    script_dir = Path(__file__).resolve().parent
+    project_root = script_dir.parent
+
+    print("🔍 Scanning assets...")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    images = {}
+    unreferenced = []
+    for name, root, prunable in collect_trees(project_root):
+        keep = DEFAULT_KEEP + (shipped_patterns(root.name) if name.startswith('store/') else []) + args.keep
+        files = list_tree(root)
+        references = referenced_paths(files)
+        for rel, path in sorted(files.items()):
+            suffix = path.suffix.lower()
+            if suffix not in ASSET_SUFFIXES:
+                continue
+            key = path.relative_to(project_root).as_posix()
+            if suffix in HASHABLE_SUFFIXES:
+                images[key] = path
+            if rel not in references and not any(fnmatch.fnmatch(rel, pattern) for pattern in keep):
+                unreferenced.append((name, rel, path, prunable))
+
+    index = PerceptualHashIndex(project_root / CACHE_DIR)
+    try:
+        hashes, content, decoded = hash_images(images, index, args.jobs or os.cpu_count() or 1)
+    finally:
+        index.save()
+
+    # Near-duplicates are found between distinct contents; copies of one file share an entry
+    if args.same_size:
+        by_size = {}
+        for sha256, entry in hashes.items():
+            by_size.setdefault((entry['width'], entry['height']), {})[sha256] = entry
+        pairs = set().union(*(near_pairs(group, args.distance) for group in by_size.values()))
+    else:
+        pairs = near_pairs(hashes, args.distance)
+
+    copies = {}
+    for key, sha256 in content.items():
+        copies.setdefault(sha256, []).append(key)
+    groups = sorted(sorted(((sha256, sorted(copies[sha256])) for sha256 in group), key=lambda item: item[1])
+                    for group in clusters(hashes, pairs))
+
+    for number, group in enumerate(groups, 1):
+        print(f"\n🖼️  Near-duplicate cluster {number}:")
+        for sha256, keys in group:
+            entry = hashes[sha256]
+            extra = f" (+{len(keys) - 1} identical cop{'y' if len(keys) == 2 else 'ies'})" if len(keys) > 1 else ""
+            print(f"   {keys[0]}  {entry['width']}x{entry['height']}, "
+                  f"{os.path.getsize(project_root / keys[0]) / 1024:.0f} KB{extra}")
+
+    # Identical files at several paths of one tree, grouped across the trees that repeat them
+    identical = {}
+    for keys in copies.values():
+        per_tree = {}
+        for key in keys:
+            tree, rel = split_key(key)
+            per_tree.setdefault(tree, []).append(rel)
+        for tree, rels in per_tree.items():
+            if len(rels) > 1:
+                identical.setdefault(tuple(sorted(rels)), []).append(tree)
+    if identical:
+        print("\n📑 Identical files within a tree:")
+        for rels, trees in sorted(identical.items()):
+            print(f"   {' = '.join(rels)}  in {', '.join(sorted(trees))}")
+
+    if unreferenced:
+        print("\n🗑️  Not referenced by any manifest, page, stylesheet or script:")
+        grouped = {}
+        for tree, rel, path, _ in unreferenced:
+            grouped.setdefault(rel, []).append((tree, path))
+        for rel, entries in sorted(grouped.items()):
+            print(f"   {rel} ({entries[0][1].stat().st_size / 1024:.0f} KB)  in "
+                  f"{', '.join(tree for tree, _ in entries)}")
+
+    pruned = []
+    if args.prune:
+        for tree, rel, path, prunable in unreferenced:
+            if prunable:
+                pruned.append((f'{tree}/{rel}', path.stat().st_size))
+                path.unlink()
+                # Drop directories the prune left empty
+                parent = path.parent
+                while parent != project_root / 'store' and not any(parent.iterdir()):
+                    parent.rmdir()
+                    parent = parent.parent
+        if pruned:
+            print(f"\n✂️  Pruned {len(pruned)} file(s), {sum(size for _, size in pruned) / 1024:.0f} KB "
+                  f"from the store bundles")
+
+    if args.json:
+        report = {
+            'clusters': [[{'paths': keys, **hashes[sha256]} for sha256, keys in group] for group in groups],
+            'unreferenced': [f'{tree}/{rel}' for tree, rel, _, _ in unreferenced],
+            'pruned': [key for key, _ in pruned],
+        }
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"\n✅ {len(images)} image(s), {len(hashes)} distinct, {decoded} decoded: {len(groups)} near-duplicate "
+          f"cluster(s), {len(unreferenced)} unreferenced file(s) in {elapsed_ms:.0f} ms")
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+HeadForge Display List
+Records drawing calls in layout units once and replays them onto rasters at
+any scale, so mockups stay crisp at 1x, 2x and every store size
+"""
+
+from text_layout import DEFAULT_FONT, draw_text, scale_shadow, text_width
+from theme import composite_linear
+
+RESAMPLE_FILTERS = ['lanczos', 'bicubic', 'bilinear', 'nearest']
+
+
+def _scale_box(box, scale, offset):
+    dx, dy = offset
+    return [round((box[0] + dx) * scale), round((box[1] + dy) * scale),
+            round((box[2] + dx) * scale), round((box[3] + dy) * scale)]
+
+
+def _scale_width(width, scale):
+    return max(1, round(width * scale)) if width else 0
+
+
+class DisplayList:
+    """
+    Ordered drawing operations in layout units.
+
+    Operations mirror ImageDraw (rectangle, ellipse, text) plus image pastes,
+    painted fills and nested layers. A layer is another DisplayList drawn at an
+    offset, so common chrome such as the app header is recorded once and shared
+    between mockups.
+    """
+
+    def __init__(self, width, height, background=None):
+        self.width = width
+        self.height = height
+        self.background = background
+        self.ops = []
+
+    def rectangle(self, box, fill=None, outline=None, width=1):
+        self.ops.append(('rectangle', list(box), fill, outline, width))
+
+    def ellipse(self, box, fill=None, outline=None, width=1):
+        self.ops.append(('ellipse', list(box), fill, outline, width))
+
+    def text(self, xy, text, fill=None, font_size=12, font=DEFAULT_FONT, align='left', shadow=None):
+        """Draw text at xy; with align='center', xy[0] is the horizontal center"""
+        self.ops.append(('text', tuple(xy), text, fill, font_size, font, align, shadow))
+
+    def paste(self, image, box, linear=False):
+        """
+        Paste an image resampled to box; keep the source at full resolution
+
+        Args:
+            image: Image, or callable(size, resample) returning the image
+                already resized, e.g. to serve resizes from the image cache
+            box (list): Target box in layout units
+            linear (bool): Alpha-composite in linear light (RGB canvases only)
+        """
+        self.ops.append(('paste', image, list(box), linear))
+
+    def paint(self, box, render):
+        """Fill box with render(size), called with the box size in output pixels"""
+        self.ops.append(('paint', render, list(box)))
+
+    def layer(self, display_list, offset=(0, 0)):
+        self.ops.append(('layer', display_list, tuple(offset)))
+
+    def replay(self, scale=1.0, mode='RGB', resample='lanczos'):
+        """
+        Rasterize the display list
+
+        Args:
+            scale (float): Output pixels per layout unit
+            mode (str): PIL image mode of the canvas
+            resample (str): Filter for image pastes, one of RESAMPLE_FILTERS
+
+        Returns:
+            Image: Canvas of round(width * scale) x round(height * scale)
+        """
+        from PIL import Image, ImageDraw
+
+        size = (round(self.width * scale), round(self.height * scale))
+        img = Image.new(mode, size, self.background or (0, 0, 0, 0))
+        self.draw_onto(img, ImageDraw.Draw(img), scale, resample=resample)
+        return img
+
+    def replay_sizes(self, sizes, mode='RGB', resample='lanczos'):
+        """
+        Rasterize once per output size, fitting the layout into each size
+
+        Args:
+            sizes (list): (width, height) targets; the layout is scaled to fit
+                and centered on the background color
+            mode (str): PIL image mode of the canvases
+            resample (str): Filter for image pastes, one of RESAMPLE_FILTERS
+
+        Returns:
+            list: One image per size
+        """
+        from PIL import Image, ImageDraw
+
+        images = []
+        for width, height in sizes:
+            scale = min(width / self.width, height / self.height)
+            img = Image.new(mode, (width, height), self.background or (0, 0, 0, 0))
+            offset = ((width / scale - self.width) / 2, (height / scale - self.height) / 2)
+            self.draw_onto(img, ImageDraw.Draw(img), scale, offset, resample)
+            images.append(img)
+        return images
+
+    def draw_onto(self, img, draw, scale, offset=(0, 0), resample='lanczos'):
+        """Replay every operation onto an existing canvas"""
+        from PIL import Image
+
+        resample_filter = Image.Resampling[resample.upper()]
+
+        for op in self.ops:
+            kind = op[0]
+            if kind == 'rectangle' or kind == 'ellipse':
+                _, box, fill, outline, width = op
+                getattr(draw, kind)(_scale_box(box, scale, offset), fill=fill,
+                                    outline=outline, width=_scale_width(width, scale))
+            elif kind == 'text':
+                _, (x, y), text, fill, font_size, font, align, shadow = op
+                size = max(1, round(font_size * scale))
+                x = (x + offset[0]) * scale
+                if align == 'center':
+                    x -= text_width(text, size, font) / 2
+                draw_text(img, (x, (y + offset[1]) * scale), text, fill, size, font,
+                          scale_shadow(shadow, scale))
+            elif kind == 'paste':
+                _, image, box, linear = op
+                x0, y0, x1, y1 = _scale_box(box, scale, offset)
+                size = (x1 - x0, y1 - y0)
+                if callable(image):
+                    resized = image(size, resample)
+                else:
+                    resized = image.resize(size, resample_filter)
+                if linear:
+                    composite_linear(img, resized, (x0, y0))
+                else:
+                    img.paste(resized, (x0, y0), resized if resized.mode == 'RGBA' else None)
+                resized.close()
+            elif kind == 'paint':
+                _, render, box = op
+                x0, y0, x1, y1 = _scale_box(box, scale, offset)
+                painted = render((x1 - x0, y1 - y0))
+                img.paste(painted, (x0, y0), painted if painted.mode == 'RGBA' else None)
+                painted.close()
+            elif kind == 'layer':
+                _, layer, (dx, dy) = op
+                layer.draw_onto(img, draw, scale, (offset[0] + dx, offset[1] + dy), resample)
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+HeadForge Image Variant Encoder
+Encodes WebP and AVIF variants of the store and extension images, keeps the
+smallest one that passes a quality threshold and writes a manifest the
+extension pages can pick formats from
+"""
+
+import argparse
+import io
+import json
+import math
+import os
+import sys
+import time
+from pathlib import Path
+
+from file_index import FileHashIndex
+from image_headers import read_png_header
+from memory_budget import DEFAULT_BUDGET_MB, MB, MemoryScheduler, estimate_peak
+
+DEFAULT_DIRS = ['src/assets/images', 'store/shared/promotional-images']
+MANIFEST_NAME = 'image-variants.json'
+CACHE_DIR = Path('.cache') / 'image-variants'
+
+# (format, mode, Pillow save options); lossless candidates always pass
+CANDIDATES = [
+    ('webp', 'lossless', {'lossless': True, 'quality': 90, 'method': 4}),
+    ('webp', 'lossy', {'quality': 95, 'alpha_quality': 100, 'method': 4}),
+    ('avif', 'lossy', {'quality': 90, 'speed': 6}),
+]
+
+# A larger candidate within this fraction of the smallest wins if it decodes faster
+SIZE_SLACK = 0.05
+DECODE_RUNS = 3
+
+# Full-size RGBA images alive at once while measuring a candidate: source,
+# decoded candidate, their premultiplied copies, the black backdrop and the diff
+ENCODE_COPIES = 6
+
+
+def psnr(reference, candidate):
+    """
+    Peak signal-to-noise ratio in dB, with color weighted by alpha
+
+    Args:
+        reference (Image): Source image
+        candidate (Image): Decoded variant
+
+    Returns:
+        float: PSNR, math.inf for identical images
+    """
+    from PIL import Image, ImageChops, ImageStat
+
+    def premultiplied(img):
+        if 'A' not in img.getbands():
+            return img.convert('RGB')
+        img = img.convert('RGBA')
+        # Color under transparent pixels is invisible; compare it over black plus alpha
+        black = Image.new('RGBA', img.size, (0, 0, 0, 255))
+        return Image.merge('RGBA', Image.alpha_composite(black, img).split()[:3] + (img.getchannel('A'),))
+
+    diff = ImageChops.difference(premultiplied(reference), premultiplied(candidate))
+    mse = sum(rms ** 2 for rms in ImageStat.Stat(diff).rms) / len(diff.getbands())
+    return math.inf if mse == 0 else 10 * math.log10(255 ** 2 / mse)
+
+
+def decode_ms(data):
+    """Median full-decode time of encoded image bytes"""
+    from PIL import Image
+
+    times = []
+    for _ in range(DECODE_RUNS):
+        start = time.perf_counter()
+        with Image.open(io.BytesIO(data)) as img:
+            img.load()
+        times.append((time.perf_counter() - start) * 1000)
+    return sorted(times)[len(times) // 2]
+
+
+def available_formats():
+    from PIL import features
+
+    return {fmt for fmt in ('webp', 'avif') if features.check(fmt)}
+
+
+def encode_variants(source_path, threshold, formats):
+    """
+    Encode every candidate for one image and measure it
+
+    Args:
+        source_path (str): PNG to encode
+        threshold (float): Minimum PSNR in dB for lossy candidates
+        formats (set): Formats to try
+
+    Returns:
+        dict: Manifest entry without the file names of the written variants,
+        plus "_data" with the encoded bytes of the best candidate per format
+    """
+    from PIL import Image
+
+    source_path = Path(source_path)
+    data = source_path.read_bytes()
+    source = Image.open(source_path)
+    source.load()
+    png = {'format': 'png', 'mode': 'lossless', 'bytes': len(data), 'psnr': None,
+           'encode_ms': None, 'decode_ms': round(decode_ms(data), 2)}
+
+    results = []
+    for fmt, mode, options in CANDIDATES:
+        if fmt not in formats:
+            continue
+        buffer = io.BytesIO()
+        start = time.perf_counter()
+        source.save(buffer, fmt.upper(), **options)
+        encode_time = (time.perf_counter() - start) * 1000
+        encoded = buffer.getvalue()
+        with Image.open(io.BytesIO(encoded)) as decoded:
+            quality = math.inf if mode == 'lossless' else psnr(source, decoded)
+        results.append(({
+            'format': fmt,
+            'mode': mode,
+            'bytes': len(encoded),
+            'psnr': None if math.isinf(quality) else round(quality, 2),
+            'encode_ms': round(encode_time, 2),
+            'decode_ms': round(decode_ms(encoded), 2),
+            'passed': quality >= threshold,
+        }, encoded))
+
+    # Best passing candidate of each format that beats the PNG
+    best = {}
+    for record, encoded in results:
+        if record['passed'] and record['bytes'] < png['bytes']:
+            if record['format'] not in best or record['bytes'] < best[record['format']][0]['bytes']:
+                best[record['format']] = (record, encoded)
+
+    # Smallest overall, unless a nearly-as-small option decodes faster
+    choices = [png] + [record for record, _ in best.values()]
+    smallest = min(choice['bytes'] for choice in choices)
+    selected = min((choice for choice in choices if choice['bytes'] <= smallest * (1 + SIZE_SLACK)),
+                   key=lambda choice: choice['decode_ms'])
+
+    width, height = source.size
+    source.close()
+
+    return {
+        'width': width,
+        'height': height,
+        'png': png,
+        'candidates': [record for record, _ in results],
+        'selected': selected['format'],
+        '_data': {fmt: encoded for fmt, (record, encoded) in best.items()},
+    }
+
+
+def load_manifest(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {'version': 1, 'images': {}}
+
+
+def write_atomic(path, data):
+    tmp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def estimate_bytes(png_path):
+    """Estimated peak memory of encoding one PNG, from its header"""
+    header = read_png_header(png_path)
+    size = (header['width'], header['height']) if header else (0, 0)
+    return estimate_peak(size, 'RGBA', ENCODE_COPIES)
+
+
+def process_directory(directory, index, args, formats, scheduler):
+    """Encode stale images of one directory and rewrite its manifest"""
+    manifest_path = directory / MANIFEST_NAME
+    manifest = load_manifest(manifest_path)
+    images = {}
+    pending = {}
+
+    for png_path in sorted(directory.glob('*.png')):
+        sha256 = index.digest(png_path)
+        entry = manifest['images'].get(png_path.name)
+        variant_files = [directory / variant['file'] for variant in (entry or {}).get('variants', {}).values()]
+        if (not args.force and entry and entry.get('sha256') == sha256
+                and entry.get('threshold') == args.threshold and set(entry.get('variants', {})) <= formats
+                and all(path.exists() for path in variant_files)):
+            print(f"⏭️  Up to date {png_path}")
+            images[png_path.name] = entry
+            continue
+        pending[png_path] = sha256
+
+    tasks = [(estimate_bytes(png_path), encode_variants, (str(png_path), args.threshold, formats))
+             for png_path in pending]
+    for (png_path, sha256), result in zip(pending.items(), scheduler.run(tasks)):
+        variants = {}
+        for fmt, encoded in result.pop('_data').items():
+            variant_path = png_path.with_suffix(f'.{fmt}')
+            write_atomic(variant_path, encoded)
+            record = next(r for r in result['candidates'] if r['format'] == fmt and r['bytes'] == len(encoded))
+            variants[fmt] = {'file': variant_path.name, **{k: v for k, v in record.items() if k != 'passed'}}
+
+        # Drop variants that no longer beat the PNG
+        for fmt in ('webp', 'avif'):
+            stale = png_path.with_suffix(f'.{fmt}')
+            if fmt not in variants and stale.exists() and png_path.name in manifest['images']:
+                stale.unlink()
+
+        selected = variants.get(result['selected'], {}).get('file', png_path.name)
+        images[png_path.name] = {'sha256': sha256, 'threshold': args.threshold,
+                                 'width': result['width'], 'height': result['height'],
+                                 'selected': selected, 'png': result['png'],
+                                 'variants': variants, 'candidates': result['candidates']}
+        print_result(png_path, images[png_path.name])
+
+    # Variants of PNGs deleted since the last run
+    for name, entry in manifest['images'].items():
+        if name not in images:
+            for variant in entry.get('variants', {}).values():
+                orphan = directory / variant['file']
+                if orphan.exists():
+                    print(f"🗑️  Removed orphaned {orphan}")
+                    orphan.unlink()
+
+    if not images:
+        if manifest_path.exists():
+            manifest_path.unlink()
+    elif images != manifest['images']:
+        content = json.dumps({'version': 1, 'images': images}, indent=2) + '\n'
+        write_atomic(manifest_path, content.encode('utf-8'))
+    return len(pending)
+
+
+def image_directories(root):
+    """The root and every subdirectory holding PNGs or a manifest, e.g. per-locale outputs"""
+    directories = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(name for name in dirnames if not name.startswith('.'))
+        if MANIFEST_NAME in filenames or any(name.endswith('.png') for name in filenames):
+            directories.append(Path(dirpath))
+    return directories
+
+
+def print_result(png_path, entry):
+    png_bytes = entry['png']['bytes']
+    print(f"🖼️  {png_path} ({png_bytes / 1024:.0f} KB PNG, decode {entry['png']['decode_ms']:.1f} ms)")
+    for candidate in entry['candidates']:
+        quality = 'lossless' if candidate['psnr'] is None else f"{candidate['psnr']:.1f} dB"
+        mark = '✅' if candidate['passed'] else '❌'
+        print(f"   {mark} {candidate['format']:<5} {candidate['mode']:<8} {candidate['bytes'] / 1024:7.0f} KB "
+              f"({candidate['bytes'] / png_bytes:4.0%})  {quality:>9}  "
+              f"encode {candidate['encode_ms']:7.1f} ms  decode {candidate['decode_ms']:6.1f} ms")
+    print(f"   → {entry['selected']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Encode WebP/AVIF variants of HeadForge images')
+    parser.add_argument('--dirs', nargs='+', default=DEFAULT_DIRS,
+                       help=f'Directories whose PNGs get variants, subdirectories included (default: {" ".join(DEFAULT_DIRS)})')
+    parser.add_argument('--threshold', type=float, default=45.0,
+                       help='Minimum PSNR in dB for lossy variants (default: 45)')
+    parser.add_argument('--no-avif', action='store_true',
+                       help='Skip AVIF even if Pillow supports it')
+    parser.add_argument('--jobs', type=int,
+                       help='Parallel encoder processes (default: CPU count)')
+    parser.add_argument('--force', action='store_true',
+                       help='Re-encode every image even if its PNG is unchanged')
+    parser.add_argument('--memory-budget', type=int, default=DEFAULT_BUDGET_MB, metavar='MB',
+                       help=f'Estimated image memory the encoder processes may hold at once (default: {DEFAULT_BUDGET_MB})')
+
+    args = parser.parse_args()
+
+    # Get the directory of this script
+    script_dir = Path(__file__).resolve().parent
+    project_root = script_dir.parent
+
+    formats = available_formats()
+    if args.no_avif:
+        formats.discard('avif')
+    if not formats:
+        print("❌ This Pillow build supports neither WebP nor AVIF")
+        return False
+
+    print(f"🎞️  Encoding image variants ({', '.join(sorted(formats))})...")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    index = FileHashIndex(project_root / CACHE_DIR / 'index.json')
+
+    encoded = 0
+    try:
+        with MemoryScheduler(args.memory_budget * MB, args.jobs) as scheduler:
+            for root in args.dirs:
+                for directory in image_directories(project_root / root):
+                    encoded += process_directory(directory, index, args, formats, scheduler)
+    finally:
+        index.save()
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"\n✅ Encoded {encoded} image(s) in {elapsed_ms:.0f} ms")
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
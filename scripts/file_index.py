@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+HeadForge File Index
+Content-hash index with a stat cache, shared by the asset build scripts
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+INDEX_VERSION = 1
+CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path):
+    """
+    Compute the SHA-256 digest of a file
+
+    Args:
+        path (str | Path): File to hash
+
+    Returns:
+        str: Hex digest of the file content
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FileHashIndex:
+    """
+    Maps relative paths to (size, mtime_ns, sha256) records.
+
+    Hashes are only recomputed when a file's size or mtime differs from the
+    recorded entry, so re-checking an unchanged tree costs one stat per file.
+    """
+
+    def __init__(self, index_path):
+        self.index_path = Path(index_path)
+        self.entries = {}
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        """Load the index from disk, starting empty if it is missing or stale"""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+
+        if data.get('version') == INDEX_VERSION:
+            self.entries = data.get('files', {})
+
+    def save(self):
+        """Write the index atomically if anything changed"""
+        if not self.dirty:
+            return
+
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        # Per-process name: pool workers sharing an index may save at the same time
+        tmp_path = self.index_path.with_name(f'{self.index_path.name}.{os.getpid()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': INDEX_VERSION, 'files': self.entries}, f,
+                      indent=1, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+        self.dirty = False
+
+    def lookup(self, key, stat):
+        """
+        Return the cached digest for key if its stat still matches
+
+        Args:
+            key (str): Index key (usually a relative POSIX path)
+            stat (os.stat_result): Current stat of the file
+
+        Returns:
+            str | None: Cached digest, or None when the entry is stale
+        """
+        entry = self.entries.get(key)
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            return entry['sha256']
+        return None
+
+    def record(self, key, stat, sha256):
+        """Store the digest for key along with the stat it was computed from"""
+        self.entries[key] = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': sha256,
+        }
+        self.dirty = True
+
+    def forget(self, key):
+        """Drop key from the index"""
+        if self.entries.pop(key, None) is not None:
+            self.dirty = True
+
+    def digest(self, path, key=None):
+        """
+        Return the digest of path, hashing only if the stat cache is stale
+
+        Args:
+            path (str | Path): File to hash
+            key (str): Index key, defaults to the path itself
+
+        Returns:
+            str: Hex digest of the file content
+        """
+        key = key or Path(path).as_posix()
+        stat = os.stat(path)
+        cached = self.lookup(key, stat)
+        if cached is not None:
+            return cached
+
+        sha256 = hash_file(path)
+        self.record(key, stat, sha256)
+        return sha256
+
+    def keys(self):
+        return list(self.entries)
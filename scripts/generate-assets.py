@@ -5,25 +5,87 @@ Generates icons, banners, and promotional images from the main logo
 """
 
 import os
+import re
 import sys
-from PIL import Image, ImageDraw, ImageFont, ImageFilter
+import json
 import argparse
+import time
+from functools import cached_property, partial
 from pathlib import Path
 
+# Pillow, the render helpers (display lists, text layout, theme, image cache
+# and sink), the vector tracer and the shard helpers are imported inside the
+# methods that use them so that --help, argument errors and no-op runs never
+# pay their import time
+
+STRINGS_PATH = "config/store-strings.json"
+PREVIEW_DIR = Path(".cache") / "preview"
+CATEGORIES = ["icons", "banners", "screenshots"]
+
+def load_strings(strings_path=STRINGS_PATH):
+    """
+    Load the store listing string table
+    
+    Args:
+        strings_path (str): JSON file with "default_locale" and "locales"
+    
+    Returns:
+        tuple: (default locale, {locale: strings}) with missing keys filled
+        in from the default locale
+    """
+    with open(strings_path, "r", encoding="utf-8") as f:
+        table = json.load(f)
+    
+    default_locale = table["default_locale"]
+    defaults = table["locales"][default_locale]
+    return default_locale, {locale: {**defaults, **strings} for locale, strings in table["locales"].items()}
+
 class HeadForgeAssetGenerator:
-    def __init__(self, logo_path="src/assets/images/logo.png"):
+    def __init__(self, logo_path="src/assets/images/logo.png", strings_path=STRINGS_PATH):
+        from icon_set import load_icon_sets
+        from memory_budget import DEFAULT_BUDGET_MB, MB
+        from text_layout import Shadow
+        from theme import Theme
+        
         self.logo_path = logo_path
+        self.default_locale, self.strings = load_strings(strings_path)
         self.output_dir = Path("src/assets")
         self.store_dir = Path("store")
         
+        # Draft mode: reduced scale, cheap resampling, uncompressed PNGs under PREVIEW_DIR
+        self.preview = False
+        self.preview_scale = 1.0
+        self.resample = "lanczos"
+        
+        # Artifact paths this run renders (a shard of the plan), or None for all
+        self.only = None
+        
+        # Locale jobs run side by side only while their estimated peak bytes fit
+        self.memory_budget = DEFAULT_BUDGET_MB * MB
+        
+        # BuildJournal recording every finished artifact, or None
+        self.journal = None
+        
         # Ensure output directories exist
         self.output_dir.mkdir(parents=True, exist_ok=True)
         (self.output_dir / "icons").mkdir(exist_ok=True)
         (self.output_dir / "images").mkdir(exist_ok=True)
         (self.store_dir / "shared" / "promotional-images").mkdir(parents=True, exist_ok=True)
         
-        # Icon sizes for browser extensions
-        self.icon_sizes = [16, 32, 48, 64, 96, 128, 256, 512]
+        # Icon files the target manifests reference, each rendered once for all targets
+        self.use_icon_set(set().union(*load_icon_sets(Path(".")).values()))
+        
+        # Mockup canvas sizes, known up front so planning needs no recording
+        self.screenshot_canvases = {
+            "popup-screenshot": (400, 600),
+            "options-screenshot": (800, 600),
+        }
+        
+        # Screenshot scale factors (1x for the listing, 2x for high-DPI)
+        self.screenshot_scales = [1, 2]
+        
+        # Fixed store listing sizes the mockups are fitted into (Chrome Web Store)
+        self.screenshot_sizes = [(1280, 800), (640, 400)]
         
         # Banner sizes for store listings
         self.banner_sizes = {
@@ -34,7 +96,7 @@ class HeadForgeAssetGenerator:
         }
         
         # BEAUTIFUL Color scheme - No more ugly colors!
-        self.colors = {
+        self.colors = Theme({
             "primary": "#667eea",
             "secondary": "#764ba2",
             "accent": "#f093fb",
@@ -49,20 +111,116 @@ class HeadForgeAssetGenerator:
             "gradient_start": "#667eea",
             "gradient_mid": "#764ba2",
             "gradient_end": "#f093fb"
+        })
+        
+        # Banner gradient: primary to secondary to accent and back to primary
+        self.gradient_stops = [
+            (0.0, "gradient_start"),
+            (0.33, "gradient_mid"),
+            (0.66, "gradient_end"),
+            (1.0, "gradient_start"),
+        ]
+        
+        # Full-size canvases alive at once in a locale job (canvas plus the
+        # resized paste or sprite layer being composited onto it), on top of
+        # the finished images waiting in the sink
+        self.peak_copies = {"banners": 2, "screenshots": 2}
+        
+        # Banner text shadows (offset, color, blur radius); baked into cached sprites
+        self.text_shadows = {
+            "title": Shadow(2, 2, self.colors["black"]),
+            "subtitle": Shadow(1, 1, self.colors["black"]),
         }
     
+    @cached_property
+    def image_cache(self):
+        """Shared cache of decoded and resized images, opened on first render"""
+        from image_cache import ImageCache
+        
+        return ImageCache()
+    
+    @cached_property
+    def sink(self):
+        """Background encoder every PNG artifact is written through"""
+        from image_sink import ImageSink
+        
+        return ImageSink()
+    
+    def close(self):
+        """
+        End the run: finish pending writes, close the journal, then save the
+        image cache's source hashes once and unmap released entries
+        """
+        try:
+            if "sink" in self.__dict__:
+                self.sink.close()
+        finally:
+            if self.journal is not None:
+                self.journal.close()
+            if "image_cache" in self.__dict__:
+                self.image_cache.close()
+    
     def load_logo(self):
-        """Load the main logo image"""
+        """Load the main logo image, decoded through the shared image cache"""
         try:
-            logo = Image.open(self.logo_path)
-            return logo.convert("RGBA")
+            return self.image_cache.decoded(self.logo_path)
         except FileNotFoundError:
             print(f"Logo not found at {self.logo_path}")
             print("Creating a placeholder logo...")
             return self.create_placeholder_logo()
     
+    def resize_logo(self, logo, size, resample=None):
+        """Resize the logo, reusing cached resizes of the logo file when it exists"""
+        from PIL import Image
+
+        resample = resample or self.resample
+        if os.path.exists(self.logo_path):
+            return self.image_cache.resized(self.logo_path, size, resample)
+        return logo.resize(size, Image.Resampling[resample.upper()])
+    
+    def enable_preview(self, scale=0.25, resample="bilinear"):
+        """Switch to draft rendering; outputs go under PREVIEW_DIR instead of the tree"""
+        import shutil
+
+        self.preview = True
+        self.preview_scale = scale
+        self.resample = resample
+        shutil.rmtree(PREVIEW_DIR, ignore_errors=True)
+    
+    def use_journal(self, journal):
+        """Record every artifact in journal once it is completely written"""
+        self.journal = journal
+        self.sink.on_written = journal.record
+    
+    def output_path(self, path):
+        """Where an artifact is written: its own path, or its mirror under PREVIEW_DIR"""
+        return PREVIEW_DIR / path if self.preview else Path(path)
+    
+    def save_image(self, image, path):
+        """
+        Hand a PNG artifact to the sink, which encodes and writes it in the background
+        
+        The sink takes ownership of the image and closes it once written; call
+        self.sink.flush() before reading the file back.
+        
+        Args:
+            image (Image): Rendered artifact
+            path (Path): Destination in the source tree
+        
+        Returns:
+            Path: File being written, under PREVIEW_DIR in preview mode
+        """
+        path = self.output_path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self.preview:
+            # Encode speed over size: drafts are viewed once and thrown away
+            return self.sink.submit(image, path, compress_level=0)
+        return self.sink.submit(image, path, optimize=True)
+    
     def create_placeholder_logo(self):
         """Create a placeholder logo if the main logo doesn't exist"""
+        from PIL import Image, ImageDraw, ImageFont
+
         size = 512
         img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
@@ -90,45 +248,65 @@ class HeadForgeAssetGenerator:
         
         return img
     
+    def use_icon_set(self, names):
+        """
+        Render exactly the given icon files
+        
+        Args:
+            names (set): File names such as "icon-48.png", "icon-16-square.png"
+                or "icon.svg" (see icon_set.py)
+        """
+        from icon_set import SVG_ICON, parse_icon_name
+        
+        specs = [parse_icon_name(name) for name in names]
+        self.icon_sizes = sorted(size for size, square in filter(None, specs) if not square)
+        # Square versions sit on a background for better visibility
+        self.square_icon_sizes = sorted(size for size, square in filter(None, specs) if square)
+        self.svg_icon = SVG_ICON in names
+    
     def generate_icons(self):
-        """Generate all required icon sizes"""
+        """Generate every icon size in the icon set"""
+        from PIL import Image
+
         print("Generating icons...")
         logo = self.load_logo()
         
-        for size in self.icon_sizes:
-            # Resize logo maintaining aspect ratio
-            resized = logo.resize((size, size), Image.Resampling.LANCZOS)
+        for size in sorted(set(self.icon_sizes) | set(self.square_icon_sizes)):
+            icon_path = self.icon_path(size) if size in self.icon_sizes else None
+            square_path = self.icon_path(size, square=True) if size in self.square_icon_sizes else None
+            if not (icon_path and self.wanted(icon_path)) and not (square_path and self.wanted(square_path)):
+                continue
             
-            # Save as PNG
-            icon_path = self.output_dir / "icons" / f"icon-{size}.png"
-            resized.save(icon_path, "PNG", optimize=True)
-            print(f"Generated {icon_path}")
+            # Resize logo maintaining aspect ratio
+            pixels = max(16, round(size * self.preview_scale))
+            resized = self.resize_logo(logo, (pixels, pixels))
             
-            # Also create a square version with background for better visibility
-            if size <= 48:
-                square_img = Image.new("RGBA", (size, size), self.colors["primary"])
+            # Composite the square version before the plain icon is handed to the sink
+            square_img = None
+            if square_path and self.wanted(square_path):
+                square_img = Image.new("RGBA", (pixels, pixels), self.colors["primary"])
                 square_img.paste(resized, (0, 0), resized)
-                square_path = self.output_dir / "icons" / f"icon-{size}-square.png"
-                square_img.save(square_path, "PNG", optimize=True)
-                print(f"Generated {square_path}")
+            
+            # Save as PNG
+            if icon_path and self.wanted(icon_path):
+                print(f"Generated {self.save_image(resized, icon_path)}")
+            else:
+                resized.close()
+            if square_img is not None:
+                print(f"Generated {self.save_image(square_img, square_path)}")
     
     def generate_svg_icon(self):
         """Generate SVG icon based on the real logo"""
+        if not self.svg_icon or not self.wanted(self.svg_path()):
+            return
+        
+        from vector_trace import trace_file
+
         try:
-            # Load the real logo
-            logo = Image.open(self.logo_path)
-            logo = logo.convert("RGBA")
-            
-            # Resize to 128x128 for SVG
-            logo_resized = logo.resize((128, 128), Image.Resampling.LANCZOS)
-            
-            # Convert to base64 for embedding in SVG
-            import base64
-            from io import BytesIO
-            
-            buffer = BytesIO()
-            logo_resized.save(buffer, format="PNG")
-            logo_base64 = base64.b64encode(buffer.getvalue()).decode()
+            # Trace the real logo into vector paths (cached by logo content hash)
+            traced = trace_file(self.logo_path, self.image_cache)
+            scale = 128 / max(traced["width"], traced["height"])
+            paths = "\n".join(f'    <path fill="{layer["fill"]}" d="{layer["d"]}"/>' for layer in traced["layers"])
             
             svg_content = f'''<?xml version="1.0" encoding="UTF-8"?>
 <svg width="128" height="128" viewBox="0 0 128 128" xmlns="http://www.w3.org/2000/svg">
@@ -143,8 +321,10 @@ class HeadForgeAssetGenerator:
   <!-- Background with gradient -->
   <rect width="128" height="128" rx="20" fill="url(#gradient)"/>
   
-  <!-- Real logo embedded -->
-  <image x="0" y="0" width="128" height="128" href="data:image/png;base64,{logo_base64}"/>
+  <!-- Real logo, traced to vector paths -->
+  <g transform="scale({scale:g})">
+{paths}
+  </g>
 </svg>'''
             
         except Exception as e:
@@ -177,39 +357,73 @@ class HeadForgeAssetGenerator:
   <circle cx="96" cy="96" r="3" fill="#ffffff" opacity="0.6"/>
 </svg>'''
         
-        svg_path = self.output_dir / "icons" / "icon.svg"
-        with open(svg_path, "w", encoding="utf-8") as f:
+        svg_path = self.output_path(self.svg_path())
+        svg_path.parent.mkdir(parents=True, exist_ok=True)
+        # Renamed into place like the PNGs, so a killed build never leaves half an SVG
+        tmp_path = svg_path.with_name(f".{svg_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
             f.write(svg_content)
+        os.replace(tmp_path, svg_path)
+        if self.journal is not None:
+            self.journal.record(svg_path)
         print(f"Generated {svg_path}")
     
-    def generate_banners(self):
-        """Generate banners for different store platforms"""
+    def generate_banners(self, locales=None, jobs=None):
+        """Generate banners for different store platforms in every locale"""
         print("Generating banners...")
         logo = self.load_logo()
         
-        for platform, (width, height) in self.banner_sizes.items():
-            banner = self.create_banner(logo, width, height, platform)
-            
-            if platform == "promotional":
-                banner_path = self.store_dir / "shared" / "promotional-images" / f"banner-{platform}.png"
-            else:
-                banner_path = self.store_dir / platform / f"banner-{platform}.png"
-                banner_path.parent.mkdir(parents=True, exist_ok=True)
+        # Gradient, logo and decorations do not depend on the locale; render them
+        # once and only composite the text per locale
+        locales = self.resolve_locales(locales)
+        platforms = [platform for platform in self.banner_sizes
+                     if any(self.wanted(self.banner_path(platform, locale)) for locale in locales)]
+        bases = {platform: self.create_banner_base(logo, *self.banner_sizes[platform]).replay(self.preview_scale,
+                                                                                              resample=self.resample)
+                 for platform in platforms}
+        locales = [locale for locale in locales
+                   if any(self.wanted(self.banner_path(platform, locale)) for platform in platforms)]
+        self.run_locales("banners", self.render_locale_banners, bases, locales, jobs)
+        for base in bases.values():
+            base.close()
+    
+    def render_locale_banners(self, locale, bases):
+        """Composite one locale's text onto the shared banner backgrounds"""
+        from PIL import ImageDraw
+
+        paths = []
+        for platform, base in bases.items():
+            banner_path = self.banner_path(platform, locale)
+            if not self.wanted(banner_path):
+                continue
             
-            banner.save(banner_path, "PNG", optimize=True)
-            print(f"Generated {banner_path}")
+            banner = base.copy()
+            width, height = self.banner_sizes[platform]
+            text = self.create_banner_text(width, height, self.strings[locale])
+            text.draw_onto(banner, ImageDraw.Draw(banner), self.preview_scale)
+            paths.append(self.save_image(banner, banner_path))
+        
+        # Every file is on disk before the job reports it
+        self.sink.flush()
+        return paths
     
-    def create_banner(self, logo, width, height, platform):
+    def create_banner(self, logo, width, height, platform, strings=None):
         """Create a banner for a specific platform"""
-        banner = Image.new("RGB", (width, height), self.colors["light"])
-        draw = ImageDraw.Draw(banner)
+        banner = self.create_banner_base(logo, width, height)
+        banner.layer(self.create_banner_text(width, height, strings or self.strings[self.default_locale]))
+        return banner.replay(self.preview_scale, resample=self.resample)
+    
+    def create_banner_base(self, logo, width, height):
+        """Record the locale-independent part of a banner"""
+        from display_list import DisplayList
+
+        banner = DisplayList(width, height, self.colors["light"])
         
         # Create gradient background
         self.create_gradient_background(banner, width, height)
         
         # Resize logo for banner
         logo_size = min(width, height) // 4
-        logo_resized = logo.resize((logo_size, logo_size), Image.Resampling.LANCZOS)
         
         # Position logo
         logo_x = (width - logo_size) // 2
@@ -221,264 +435,593 @@ class HeadForgeAssetGenerator:
         circle_x = logo_x - circle_margin // 2
         circle_y = logo_y - circle_margin // 2
         
-        draw.ellipse([circle_x, circle_y, circle_x + circle_size, circle_y + circle_size],
-                    fill=self.colors["white"], outline=self.colors["primary"], width=3)
-        
-        # Paste logo
-        banner.paste(logo_resized, (logo_x, logo_y), logo_resized)
+        banner.ellipse([circle_x, circle_y, circle_x + circle_size, circle_y + circle_size],
+                       fill=self.colors["white"], outline=self.colors["primary"], width=3)
         
-        # Add text
-        self.add_banner_text(draw, width, height, platform)
+        # Paste logo, resized at replay time through the image cache
+        banner.paste(partial(self.resize_logo, logo), [logo_x, logo_y, logo_x + logo_size, logo_y + logo_size],
+                     linear=True)
         
         # Add decorative elements
-        self.add_decorative_elements(draw, width, height)
+        self.add_decorative_elements(banner, width, height)
         
         return banner
     
-    def create_gradient_background(self, img, width, height):
-        """Create a BEAUTIFUL gradient background"""
-        for y in range(height):
-            ratio = y / height
-            # Create a beautiful multi-color gradient
-            if ratio < 0.33:
-                # First third: primary to secondary
-                local_ratio = ratio / 0.33
-                r = int(self.colors["gradient_start"][1:3], 16) * (1 - local_ratio) + int(self.colors["gradient_mid"][1:3], 16) * local_ratio
-                g = int(self.colors["gradient_start"][3:5], 16) * (1 - local_ratio) + int(self.colors["gradient_mid"][3:5], 16) * local_ratio
-                b = int(self.colors["gradient_start"][5:7], 16) * (1 - local_ratio) + int(self.colors["gradient_mid"][5:7], 16) * local_ratio
-            elif ratio < 0.66:
-                # Second third: secondary to accent
-                local_ratio = (ratio - 0.33) / 0.33
-                r = int(self.colors["gradient_mid"][1:3], 16) * (1 - local_ratio) + int(self.colors["gradient_end"][1:3], 16) * local_ratio
-                g = int(self.colors["gradient_mid"][3:5], 16) * (1 - local_ratio) + int(self.colors["gradient_end"][3:5], 16) * local_ratio
-                b = int(self.colors["gradient_mid"][5:7], 16) * (1 - local_ratio) + int(self.colors["gradient_end"][5:7], 16) * local_ratio
-            else:
-                # Last third: accent to primary (circular)
-                local_ratio = (ratio - 0.66) / 0.34
-                r = int(self.colors["gradient_end"][1:3], 16) * (1 - local_ratio) + int(self.colors["gradient_start"][1:3], 16) * local_ratio
-                g = int(self.colors["gradient_end"][3:5], 16) * (1 - local_ratio) + int(self.colors["gradient_start"][3:5], 16) * local_ratio
-                b = int(self.colors["gradient_end"][5:7], 16) * (1 - local_ratio) + int(self.colors["gradient_start"][5:7], 16) * local_ratio
-            
-            color = (int(r), int(g), int(b))
-            for x in range(width):
-                img.putpixel((x, y), color)
+    def create_gradient_background(self, banner, width, height):
+        """Create a BEAUTIFUL gradient background, blended in linear light"""
+        banner.paint([0, 0, width, height], partial(self.colors.gradient, stops=self.gradient_stops))
     
-    def add_banner_text(self, draw, width, height, platform):
-        """Add text to banner"""
-        try:
-            title_font = ImageFont.truetype("arial.ttf", 48)
-            subtitle_font = ImageFont.truetype("arial.ttf", 24)
-        except:
-            title_font = ImageFont.load_default()
-            subtitle_font = ImageFont.load_default()
+    def create_banner_text(self, width, height, strings):
+        """Record the banner text for one locale"""
+        from display_list import DisplayList
+
+        text = DisplayList(width, height)
+        title_size, subtitle_size = 48, 24
         
-        # Title
-        title = "HeadForge"
-        title_bbox = draw.textbbox((0, 0), title, font=title_font)
-        title_width = title_bbox[2] - title_bbox[0]
-        title_x = (width - title_width) // 2
+        # Title; text and shadow come from one cached sprite
         title_y = height // 2 + 60
-        
-        # Add text shadow
-        draw.text((title_x + 2, title_y + 2), title, fill=self.colors["black"], font=title_font)
-        draw.text((title_x, title_y), title, fill=self.colors["white"], font=title_font)
+        text.text((width / 2, title_y), strings["title"], fill=self.colors["white"], font_size=title_size,
+                  align="center", shadow=self.text_shadows["title"])
         
         # Subtitle
-        subtitle = "Professional Code Header Generator"
-        subtitle_bbox = draw.textbbox((0, 0), subtitle, font=subtitle_font)
-        subtitle_width = subtitle_bbox[2] - subtitle_bbox[0]
-        subtitle_x = (width - subtitle_width) // 2
         subtitle_y = title_y + 60
+        text.text((width / 2, subtitle_y), strings["tagline"], fill=self.colors["white"], font_size=subtitle_size,
+                  align="center", shadow=self.text_shadows["subtitle"])
         
-        draw.text((subtitle_x + 1, subtitle_y + 1), subtitle, fill=self.colors["black"], font=subtitle_font)
-        draw.text((subtitle_x, subtitle_y), subtitle, fill=self.colors["white"], font=subtitle_font)
+        return text
     
-    def add_decorative_elements(self, draw, width, height):
+    def add_decorative_elements(self, banner, width, height):
         """Add decorative elements to banner"""
         # Add some geometric shapes
         for i in range(5):
             x = (width // 6) * (i + 1)
             y = height // 8
             size = 8
-            draw.ellipse([x - size, y - size, x + size, y + size], 
-                        fill=self.colors["white"], outline=self.colors["primary"], width=2)
+            banner.ellipse([x - size, y - size, x + size, y + size], 
+                           fill=self.colors["white"], outline=self.colors["primary"], width=2)
         
         for i in range(5):
             x = (width // 6) * (i + 1)
             y = height - height // 8
             size = 8
-            draw.ellipse([x - size, y - size, x + size, y + size], 
-                        fill=self.colors["white"], outline=self.colors["primary"], width=2)
+            banner.ellipse([x - size, y - size, x + size, y + size], 
+                           fill=self.colors["white"], outline=self.colors["primary"], width=2)
     
-    def generate_screenshots(self):
-        """Generate mockup screenshots for store listings"""
+    def generate_screenshots(self, locales=None, jobs=None):
+        """Generate mockup screenshots for store listings in every locale"""
         print("Generating screenshots...")
+        locales = [locale for locale in self.resolve_locales(locales)
+                   if any(self.wanted(self.screenshot_path(name, variant, locale))
+                          for name in self.screenshot_canvases
+                          for variant in self.screenshot_scales + self.screenshot_sizes)]
+        self.run_locales("screenshots", self.render_locale_screenshots, None, locales, jobs)
+    
+    def create_screenshots(self, strings):
+        """Record every mockup for one locale's strings"""
+        return {
+            "popup-screenshot": self.create_popup_screenshot(strings),
+            "options-screenshot": self.create_options_screenshot(strings),
+        }
+    
+    def render_locale_screenshots(self, locale, _=None):
+        """Record one locale's mockups and replay them at every scale and size"""
+        paths = []
         
-        # Create popup screenshot
-        popup_screenshot = self.create_popup_screenshot()
-        popup_path = self.store_dir / "shared" / "promotional-images" / "popup-screenshot.png"
-        popup_screenshot.save(popup_path, "PNG", optimize=True)
-        print(f"Generated {popup_path}")
-        
-        # Create options screenshot
-        options_screenshot = self.create_options_screenshot()
-        options_path = self.store_dir / "shared" / "promotional-images" / "options-screenshot.png"
-        options_screenshot.save(options_path, "PNG", optimize=True)
-        print(f"Generated {options_path}")
-    
-    def create_popup_screenshot(self):
-        """Create a mockup of the popup interface"""
-        width, height = 400, 600
-        img = Image.new("RGB", (width, height), self.colors["light"])
-        draw = ImageDraw.Draw(img)
+        # Layout is recorded once and replayed at every scale
+        for name, display_list in self.create_screenshots(self.strings[locale]).items():
+            for scale in self.screenshot_scales:
+                screenshot_path = self.screenshot_path(name, scale, locale)
+                if self.wanted(screenshot_path):
+                    image = display_list.replay(scale * self.preview_scale, resample=self.resample)
+                    paths.append(self.save_image(image, screenshot_path))
+            
+            # One size at a time, so only one canvas is rendering while the sink
+            # holds at most max_pending finished ones
+            for width, height in self.screenshot_sizes:
+                screenshot_path = self.screenshot_path(name, (width, height), locale)
+                if self.wanted(screenshot_path):
+                    size = (round(width * self.preview_scale), round(height * self.preview_scale))
+                    image = display_list.replay_sizes([size], resample=self.resample)[0]
+                    paths.append(self.save_image(image, screenshot_path))
         
-        # Header
-        header_height = 60
-        draw.rectangle([0, 0, width, header_height], fill=self.colors["primary"])
+        # Every file is on disk before the job reports it
+        self.sink.flush()
+        return paths
+    
+    def icon_path(self, size, square=False):
+        return self.output_dir / "icons" / f"icon-{size}{'-square' if square else ''}.png"
+    
+    def svg_path(self):
+        return self.output_dir / "icons" / "icon.svg"
+    
+    def banner_path(self, platform, locale):
+        if platform == "promotional":
+            banner_path = self.store_dir / "shared" / "promotional-images" / f"banner-{platform}.png"
+        else:
+            banner_path = self.store_dir / platform / f"banner-{platform}.png"
+        return self.localized_path(banner_path, locale)
+    
+    def screenshot_path(self, name, variant, locale):
+        """Path of a screenshot at a scale factor (int) or a fixed (width, height)"""
+        if isinstance(variant, tuple):
+            suffix = f"-{variant[0]}x{variant[1]}"
+        else:
+            suffix = "" if variant == 1 else f"@{variant}x"
+        output_dir = self.localized_path(self.store_dir / "shared" / "promotional-images", locale)
+        return output_dir / f"{name}{suffix}.png"
+    
+    def wanted(self, path):
+        """Whether this run renders the artifact at path"""
+        return self.only is None or path in self.only
+    
+    def plan_artifacts(self, categories=CATEGORIES, locales=None):
+        """
+        List every file the given categories produce, with its size and encode profile
+        
+        Args:
+            categories (list): Subset of CATEGORIES
+            locales (list): Locales for banners and screenshots (default: all)
+        
+        Returns:
+            list: Artifact tuples, in render order
+        """
+        from asset_shards import Artifact
+
+        artifacts = []
+        if "icons" in categories:
+            for size in sorted(set(self.icon_sizes) | set(self.square_icon_sizes)):
+                if size in self.icon_sizes:
+                    artifacts.append(Artifact(self.icon_path(size), "icons", (size, size), "png-rgba"))
+                if size in self.square_icon_sizes:
+                    artifacts.append(Artifact(self.icon_path(size, square=True), "icons", (size, size), "png-rgba"))
+            if self.svg_icon:
+                artifacts.append(Artifact(self.svg_path(), "icons", (256, 256), "svg"))
+        
+        for locale in self.resolve_locales(locales):
+            if "banners" in categories:
+                for platform, size in self.banner_sizes.items():
+                    artifacts.append(Artifact(self.banner_path(platform, locale), "banners", size, "png-rgb"))
+            if "screenshots" in categories:
+                for name, (width, height) in self.screenshot_canvases.items():
+                    for scale in self.screenshot_scales:
+                        size = (width * scale, height * scale)
+                        artifacts.append(Artifact(self.screenshot_path(name, scale, locale), "screenshots",
+                                                  size, "png-rgb"))
+                    for size in self.screenshot_sizes:
+                        artifacts.append(Artifact(self.screenshot_path(name, size, locale), "screenshots",
+                                                  size, "png-rgb"))
+        return artifacts
+    
+    def localized_path(self, path, locale):
+        """Default-locale assets keep their path; others go to promotional-images/<locale>/"""
+        if locale == self.default_locale:
+            return path
+        locale_dir = self.store_dir / "shared" / "promotional-images" / locale
+        return locale_dir if path.suffix == "" else locale_dir / path.name
+    
+    def resolve_locales(self, locales=None):
+        """Requested locales, or every locale in the string table"""
+        locales = locales or list(self.strings)
+        unknown = [locale for locale in locales if locale not in self.strings]
+        if unknown:
+            raise ValueError(f"Unknown locale(s): {', '.join(unknown)}")
+        return locales
+    
+    def estimate_locale_bytes(self, category, locale, payload):
+        """
+        Estimated peak memory of one locale job
+        
+        Args:
+            category (str): "banners" or "screenshots"
+            locale (str): Locale the job renders
+            payload: Locale-independent images shipped to the job
+        
+        Returns:
+            int: Shared payload plus the largest canvas times its intermediate
+            copies and the finished images the sink may hold
+        """
+        from memory_budget import estimate_peak, image_bytes
+
+        sizes = [artifact.size for artifact in self.plan_artifacts([category], [locale]) if self.wanted(artifact.path)]
+        width, height = max(sizes, key=lambda size: size[0] * size[1], default=(0, 0))
+        largest = (round(width * self.preview_scale), round(height * self.preview_scale))
+        payload_bytes = sum(image_bytes(image.size, image.mode) for image in (payload or {}).values())
+        copies = self.peak_copies[category] + self.sink.max_pending
+        return payload_bytes + estimate_peak(largest, "RGB", copies)
+    
+    def run_locales(self, category, render, payload, locales, jobs=None):
+        """
+        Run render(locale, payload) for each locale, spread across worker processes
+        
+        Args:
+            category (str): Category being rendered, for the memory estimate
+            render: Bound method returning the paths it wrote
+            payload: Locale-independent input shared by every locale
+            locales (list): Locales to render, from resolve_locales()
+            jobs (int): Worker processes (default: CPU count)
+        """
+        from memory_budget import MemoryScheduler
+
+        tasks = [(self.estimate_locale_bytes(category, locale, payload), render, (locale, payload))
+                 for locale in locales]
+        with MemoryScheduler(self.memory_budget, jobs) as scheduler:
+            for paths in scheduler.run(tasks):
+                for path in paths:
+                    print(f"Generated {path}")
+    
+    def create_app_header(self, width, header_height, logo_size, title, title_size,
+                          subtitle=None, subtitle_size=14):
+        """Record the header bar shared by the popup and options mockups"""
+        from display_list import DisplayList
+
+        header = DisplayList(width, header_height)
+        header.rectangle([0, 0, width, header_height], fill=self.colors["primary"])
         
         # Logo
-        logo_size = 32
         logo_x = 20
         logo_y = (header_height - logo_size) // 2
-        draw.ellipse([logo_x, logo_y, logo_x + logo_size, logo_y + logo_size], 
-                    fill=self.colors["white"])
+        header.ellipse([logo_x, logo_y, logo_x + logo_size, logo_y + logo_size], 
+                      fill=self.colors["white"])
         
         # Title
-        try:
-            font = ImageFont.truetype("arial.ttf", 20)
-        except:
-            font = ImageFont.load_default()
+        text_x = logo_x + logo_size + (15 if subtitle else 10)
+        header.text((text_x, logo_y + (0 if subtitle else 5)), title,
+                    fill=self.colors["white"], font_size=title_size)
+        if subtitle:
+            header.text((text_x, logo_y + 30), subtitle,
+                        fill=self.colors["white"], font_size=subtitle_size)
         
-        draw.text((logo_x + logo_size + 10, logo_y + 5), "HeadForge", 
-                 fill=self.colors["white"], font=font)
+        return header
+    
+    def create_popup_screenshot(self, strings):
+        """Record a mockup of the popup interface"""
+        from display_list import DisplayList
+
+        width, height = self.screenshot_canvases["popup-screenshot"]
+        font_size = 20
+        screen = DisplayList(width, height, self.colors["light"])
+        
+        # Header
+        header_height = 60
+        screen.layer(self.create_app_header(width, header_height, 32, strings["title"], font_size))
         
         # Form fields
         y_offset = header_height + 20
         field_height = 40
         field_spacing = 10
         
-        fields = ["File Name", "Project", "Author", "Version", "Language"]
-        for field in fields:
+        for field in strings["popup_fields"]:
             # Field background
-            draw.rectangle([20, y_offset, width - 20, y_offset + field_height], 
-                          fill=self.colors["white"], outline=self.colors["secondary"], width=1)
+            screen.rectangle([20, y_offset, width - 20, y_offset + field_height], 
+                            fill=self.colors["white"], outline=self.colors["secondary"], width=1)
             
             # Field label
-            draw.text((25, y_offset + 5), field, fill=self.colors["dark"], font=font)
+            screen.text((25, y_offset + 5), field, fill=self.colors["dark"], font_size=font_size)
             
             y_offset += field_height + field_spacing
         
         # Preview section
         preview_y = y_offset + 20
-        draw.rectangle([20, preview_y, width - 20, height - 80], 
-                      fill=self.colors["dark"], outline=self.colors["primary"], width=2)
+        screen.rectangle([20, preview_y, width - 20, height - 80], 
+                        fill=self.colors["dark"], outline=self.colors["primary"], width=2)
         
         # Preview text
         preview_text = "/*\n * sample-file.js\n * My Project\n * @author Developer\n */"
-        draw.text((25, preview_y + 10), preview_text, fill=self.colors["white"], font=font)
+        screen.text((25, preview_y + 10), preview_text, fill=self.colors["white"], font_size=font_size)
         
         # Buttons
         button_y = height - 60
-        draw.rectangle([20, button_y, width - 20, button_y + 40], 
-                      fill=self.colors["success"], outline=self.colors["success"])
-        draw.text((width // 2 - 50, button_y + 10), "Generate Header", 
-                 fill=self.colors["white"], font=font)
+        screen.rectangle([20, button_y, width - 20, button_y + 40], 
+                        fill=self.colors["success"], outline=self.colors["success"])
+        screen.text((width // 2, button_y + 10), strings["generate_button"], 
+                    fill=self.colors["white"], font_size=font_size, align="center")
         
-        return img
+        return screen
     
-    def create_options_screenshot(self):
-        """Create a mockup of the options interface"""
-        width, height = 800, 600
-        img = Image.new("RGB", (width, height), self.colors["light"])
-        draw = ImageDraw.Draw(img)
+    def create_options_screenshot(self, strings):
+        """Record a mockup of the options interface"""
+        from display_list import DisplayList
+
+        width, height = self.screenshot_canvases["options-screenshot"]
+        title_size, subtitle_size = 24, 14
+        screen = DisplayList(width, height, self.colors["light"])
         
         # Header
         header_height = 80
-        draw.rectangle([0, 0, width, header_height], fill=self.colors["primary"])
-        
-        # Logo and title
-        logo_size = 48
-        logo_x = 20
-        logo_y = (header_height - logo_size) // 2
-        draw.ellipse([logo_x, logo_y, logo_x + logo_size, logo_y + logo_size], 
-                    fill=self.colors["white"])
-        
-        try:
-            title_font = ImageFont.truetype("arial.ttf", 24)
-            subtitle_font = ImageFont.truetype("arial.ttf", 14)
-        except:
-            title_font = ImageFont.load_default()
-            subtitle_font = ImageFont.load_default()
-        
-        draw.text((logo_x + logo_size + 15, logo_y), "HeadForge Settings", 
-                 fill=self.colors["white"], font=title_font)
-        draw.text((logo_x + logo_size + 15, logo_y + 30), "Configure your preferences", 
-                 fill=self.colors["white"], font=subtitle_font)
+        screen.layer(self.create_app_header(width, header_height, 48, strings["settings_title"], title_size,
+                                            strings["settings_subtitle"], subtitle_size))
         
         # Settings sections
         y_offset = header_height + 20
         section_height = 120
         
-        sections = ["General Settings", "Behavior Settings", "Export Settings", "Theme Settings"]
-        for section in sections:
+        for section in strings["settings_sections"]:
             # Section background
-            draw.rectangle([20, y_offset, width - 20, y_offset + section_height], 
-                          fill=self.colors["white"], outline=self.colors["secondary"], width=1)
+            screen.rectangle([20, y_offset, width - 20, y_offset + section_height], 
+                            fill=self.colors["white"], outline=self.colors["secondary"], width=1)
             
             # Section title
-            draw.text((30, y_offset + 10), section, fill=self.colors["dark"], font=title_font)
+            screen.text((30, y_offset + 10), section, fill=self.colors["dark"], font_size=title_size)
             
             # Settings items
             item_y = y_offset + 40
             for i in range(3):
-                draw.rectangle([30, item_y, width - 30, item_y + 20], 
-                              fill=self.colors["light"], outline=self.colors["secondary"], width=1)
-                draw.text((35, item_y + 2), f"Setting {i+1}", fill=self.colors["dark"], font=subtitle_font)
+                screen.rectangle([30, item_y, width - 30, item_y + 20], 
+                                fill=self.colors["light"], outline=self.colors["secondary"], width=1)
+                screen.text((35, item_y + 2), strings["setting_item"].format(n=i + 1), fill=self.colors["dark"],
+                            font_size=subtitle_size)
                 item_y += 25
             
             y_offset += section_height + 20
         
-        return img
+        return screen
+    
+    def create_contact_sheet(self, paths, cell=(240, 150), label_height=32):
+        """
+        Record a grid of labeled thumbnails
+        
+        Args:
+            paths (list): Images to tile, in order
+            cell (tuple): Thumbnail area of each tile
+            label_height (int): Space under each thumbnail for its file name
+        
+        Returns:
+            DisplayList: Contact sheet layout
+        """
+        from PIL import Image
+        from display_list import DisplayList
+
+        margin = 10
+        columns = max(1, min(len(paths), round(len(paths) ** 0.5 * 1.5)))
+        rows = -(-len(paths) // columns)
+        tile_width, tile_height = cell[0] + margin, cell[1] + label_height + margin
+        sheet = DisplayList(columns * tile_width + margin, rows * tile_height + margin, self.colors["dark"])
+        
+        for index, path in enumerate(paths):
+            x = margin + (index % columns) * tile_width
+            y = margin + (index // columns) * tile_height
+            with Image.open(path) as img:
+                # Fit the thumbnail into the cell, keeping its aspect ratio; only
+                # the thumbnail is kept until the sheet is replayed
+                fit = min(cell[0] / img.width, cell[1] / img.height, 1)
+                width, height = max(1, round(img.width * fit)), max(1, round(img.height * fit))
+                thumbnail = img.resize((width, height), Image.Resampling[self.resample.upper()])
+            left, top = x + (cell[0] - width) // 2, y + (cell[1] - height) // 2
+            sheet.rectangle([x, y, x + cell[0], y + cell[1]], fill=self.colors["black"])
+            sheet.paste(thumbnail, [left, top, left + width, top + height])
+            
+            label = f"{path.name}\n{path.parent.relative_to(PREVIEW_DIR)}"
+            sheet.text((x + cell[0] / 2, y + cell[1] + 4), label, fill=self.colors["light"],
+                       font_size=11, align="center")
+        
+        return sheet
     
-    def generate_all(self):
+    def write_contact_sheet(self):
+        """Tile every preview PNG into PREVIEW_DIR/contact-sheet.png"""
+        sheet_path = PREVIEW_DIR / "contact-sheet.png"
+        # Natural order, so icon-16 comes before icon-128
+        paths = sorted((path for path in PREVIEW_DIR.rglob("*.png") if path != sheet_path),
+                       key=lambda path: (str(path.parent), [int(part) if part.isdigit() else part
+                                                             for part in re.split(r"(\d+)", path.name)]))
+        if not paths:
+            return None
+        
+        with self.create_contact_sheet(paths).replay(resample=self.resample) as sheet:
+            sheet.save(sheet_path, "PNG", compress_level=0)
+        print(f"Contact sheet: {sheet_path} ({len(paths)} images)")
+        return sheet_path
+    
+    def generate(self, categories, locales=None, jobs=None):
+        """
+        Generate the given categories
+        
+        Args:
+            categories (list): Subset of CATEGORIES
+            locales (list): Locales for banners and screenshots (default: all)
+            jobs (int): Worker processes for locale rendering
+        
+        Returns:
+            dict: Wall time in milliseconds per category
+        """
+        timings = {}
+        for category in categories:
+            start = time.perf_counter()
+            if category == "icons":
+                self.generate_icons()
+                self.generate_svg_icon()
+            elif category == "banners":
+                self.generate_banners(locales, jobs)
+            elif category == "screenshots":
+                self.generate_screenshots(locales, jobs)
+            # Timings include the encodes still in flight
+            self.sink.flush()
+            timings[category] = round((time.perf_counter() - start) * 1000, 1)
+        return timings
+    
+    def generate_all(self, locales=None, jobs=None):
         """Generate all assets"""
         print("HeadForge Asset Generator")
         print("=" * 40)
         
-        self.generate_icons()
-        self.generate_svg_icon()
-        self.generate_banners()
-        self.generate_screenshots()
+        timings = self.generate(CATEGORIES, locales, jobs)
         
         print("\nAsset generation complete!")
-        print(f"Icons saved to: {self.output_dir / 'icons'}")
-        print(f"Banners saved to: {self.store_dir}")
-        print(f"Screenshots saved to: {self.store_dir / 'shared' / 'promotional-images'}")
+        print(f"Icons saved to: {self.output_path(self.output_dir / 'icons')}")
+        print(f"Banners saved to: {self.output_path(self.store_dir)}")
+        print(f"Screenshots saved to: {self.output_path(self.store_dir / 'shared' / 'promotional-images')}")
+        return timings
+
+def shard_arg(value):
+    from asset_shards import parse_shard
+
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+def start_journal(generator, categories, args):
+    """
+    Journal this build's artifacts, and with --resume skip those an earlier
+    run of the same build already completed
+    
+    The journal is keyed by the plan digest and the logo and string table
+    hashes, so a resume after changing arguments or inputs starts over.
+    """
+    from asset_shards import plan_digest
+    from build_journal import JOURNAL_DIR, BuildJournal, remove_partial_writes
+    from file_index import hash_file
+    
+    plan = [artifact for artifact in generator.plan_artifacts(categories, args.locales)
+            if generator.only is None or artifact.path in generator.only]
+    inputs = [hash_file(path)[:16] if os.path.exists(path) else "none" for path in (args.logo, args.strings)]
+    build = "-".join([plan_digest(plan)] + inputs)
+    name = f"shard-{args.shard[0]}-of-{args.shard[1]}" if args.shard else "build"
+    journal = BuildJournal(JOURNAL_DIR / f"{name}.jsonl", build)
+    
+    entries = journal.load() if args.resume else None
+    if entries is None:
+        if args.resume:
+            print("No journal of this build to resume; rendering everything")
+    else:
+        intact, rejected = journal.verify(entries)
+        generator.only = {artifact.path for artifact in plan
+                          if generator.output_path(artifact.path).as_posix() not in intact}
+        print(f"Resuming: {len(plan) - len(generator.only)} of {len(plan)} artifacts complete, "
+              f"{len(rejected)} missing or corrupt")
+    
+    # A dry run only reports what the journal leaves to render
+    if args.dry_run:
+        return
+    if entries is None:
+        journal.rewrite()
+    else:
+        removed = remove_partial_writes(generator.output_path(artifact.path) for artifact in plan)
+        if removed:
+            print(f"Removed {removed} partial write(s)")
+        journal.rewrite(intact)
+    generator.use_journal(journal)
 
 def main():
+    # Only os: cheap enough for the --memory-budget default
+    from memory_budget import DEFAULT_BUDGET_MB, MB
+    
     parser = argparse.ArgumentParser(description="Generate HeadForge assets")
     parser.add_argument("--logo", default="src/assets/images/logo.png", 
                        help="Path to the main logo file")
     parser.add_argument("--icons-only", action="store_true", 
                        help="Generate only icons")
+    parser.add_argument("--all-icons", action="store_true",
+                       help="Render every icon size, square variant and the SVG, not only those the manifests reference")
     parser.add_argument("--banners-only", action="store_true", 
                        help="Generate only banners")
     parser.add_argument("--screenshots-only", action="store_true", 
                        help="Generate only screenshots")
+    parser.add_argument("--strings", default=STRINGS_PATH,
+                       help=f"Store listing string table (default: {STRINGS_PATH})")
+    parser.add_argument("--locales", type=lambda value: value.split(","),
+                       help="Comma-separated locales for banners and screenshots (default: all)")
+    parser.add_argument("--jobs", type=int,
+                       help="Worker processes for locale rendering (default: CPU count, 1 with --preview)")
+    parser.add_argument("--memory-budget", type=int, default=DEFAULT_BUDGET_MB, metavar="MB",
+                       help=f"Estimated image memory the locale jobs may hold at once (default: {DEFAULT_BUDGET_MB})")
+    parser.add_argument("--preview", action="store_true",
+                       help=f"Draft render at reduced scale into {PREVIEW_DIR} plus a contact sheet")
+    parser.add_argument("--preview-scale", type=float, default=0.25,
+                       help="Scale of --preview renders (default: 0.25)")
+    parser.add_argument("--shard", type=shard_arg, metavar="I/N",
+                       help="Render only shard I of N of the artifacts, balanced by estimated cost")
+    parser.add_argument("--resume", action="store_true",
+                       help="Continue an interrupted build: keep the artifacts its journal lists intact, render the rest")
+    parser.add_argument("--dry-run", action="store_true",
+                       help="List the artifacts this run would render and exit, without writing anything")
+    parser.add_argument("--merge-shards", nargs="+", metavar="PATH",
+                       help="Merge shard manifests (files, or roots of downloaded shard builds) and exit")
+    parser.add_argument("--manifest", default=".cache/shards/asset-manifest.json",
+                       help="Merged manifest written by --merge-shards (default: .cache/shards/asset-manifest.json)")
     
     args = parser.parse_args()
     
-    generator = HeadForgeAssetGenerator(args.logo)
+    if args.merge_shards:
+        from asset_shards import merge_shards
+        
+        try:
+            merged = merge_shards(args.merge_shards, args.manifest)
+        except (OSError, ValueError) as e:
+            print(f"❌ Merge failed: {e}")
+            return False
+        metrics = merged["metrics"]
+        print(f"✅ Merged {merged['shards']} shard(s), {metrics['artifacts']} artifacts into {args.manifest} "
+              f"(slowest shard {metrics['elapsed_ms_max']:.0f} ms, cost imbalance {metrics['cost_imbalance']:.2f})")
+        return True
+    
+    if args.resume and args.preview:
+        parser.error("--resume applies to tree builds; previews always start over")
+    
+    generator = HeadForgeAssetGenerator(args.logo, args.strings)
+    generator.memory_budget = args.memory_budget * MB
+    if args.all_icons:
+        from icon_set import ALL_ICONS
+        
+        generator.use_icon_set(ALL_ICONS)
+    if args.preview:
+        generator.enable_preview(args.preview_scale)
+        # Draft renders are too small to pay for worker start-up
+        args.jobs = args.jobs or 1
     
     if args.icons_only:
-        generator.generate_icons()
-        generator.generate_svg_icon()
+        categories = ["icons"]
     elif args.banners_only:
-        generator.generate_banners()
+        categories = ["banners"]
     elif args.screenshots_only:
-        generator.generate_screenshots()
+        categories = ["screenshots"]
     else:
-        generator.generate_all()
+        categories = CATEGORIES
+    
+    if args.shard:
+        from asset_shards import partition, plan_digest, write_shard_manifest
+        
+        index, count = args.shard
+        plan = generator.plan_artifacts(categories, args.locales)
+        shard = partition(plan, count)[index - 1]
+        generator.only = {artifact.path for artifact in shard}
+        print(f"Shard {index}/{count}: {len(shard)} of {len(plan)} artifacts")
+    
+    try:
+        if not args.preview:
+            start_journal(generator, categories, args)
+        
+        if args.dry_run:
+            pending = [artifact for artifact in generator.plan_artifacts(categories, args.locales)
+                       if generator.wanted(artifact.path)]
+            for artifact in pending:
+                print(f"Would render {generator.output_path(artifact.path)}")
+            print(f"{len(pending)} artifact(s) to render")
+            return True
+        
+        start = time.perf_counter()
+        if generator.only is not None and not generator.only:
+            # Nothing left to render: the no-op path never loads Pillow
+            print("Nothing to render; every artifact of this build is complete")
+            timings = None
+        elif categories == CATEGORIES:
+            timings = generator.generate_all(args.locales, args.jobs)
+        else:
+            timings = generator.generate(categories, args.locales, args.jobs)
+        
+        if args.shard:
+            # An empty or already complete shard still writes its manifest, or
+            # --merge-shards reports it missing
+            metrics = {"elapsed_ms": round((time.perf_counter() - start) * 1000, 1), "category_ms": timings or {}}
+            outputs = {artifact.path: generator.output_path(artifact.path) for artifact in shard}
+            manifest_path = write_shard_manifest(index, count, plan_digest(plan), shard, outputs, metrics)
+            print(f"Shard manifest: {manifest_path}")
+        
+        if args.preview and timings is not None:
+            generator.write_contact_sheet()
+    finally:
+        generator.close()
+    return True
 
 if __name__ == "__main__":
-    main()
+    success = main()
+    sys.exit(0 if success else 1)
@@ -6,9 +6,10 @@ Creates a banner image from the logo for the extension header
 
 import os
 import sys
-from PIL import Image, ImageDraw, ImageFont
 import argparse
 
+from image_cache import ImageCache
+
 def create_banner(logo_path, output_path, width=600, height=100, background_color=(255, 255, 255, 0)):
     """
     Create a banner image from the logo
@@ -26,45 +27,45 @@ def create_banner(logo_path, output_path, width=600, height=100, background_colo
         print(f"Error: Logo file not found at {logo_path}")
         return False
     
+    # Imported here so --help and argument errors stay fast
+    from PIL import Image
+    
     try:
-        # Open the logo
-        logo = Image.open(logo_path)
-        
-        # Convert to RGBA if not already
-        if logo.mode != 'RGBA':
-            logo = logo.convert('RGBA')
+        # Decode the logo through the shared image cache
+        with ImageCache() as image_cache:
+            logo = image_cache.decoded(logo_path)
         
-        # Calculate logo size (keep aspect ratio, fit within banner)
-        logo_max_width = width - 60  # 30px margin on each side
-        logo_max_height = height - 20  # 10px margin on top and bottom
+            # Calculate logo size (keep aspect ratio, fit within banner)
+            logo_max_width = width - 60  # 30px margin on each side
+            logo_max_height = height - 20  # 10px margin on top and bottom
         
-        # Calculate scaling factor
-        scale_w = logo_max_width / logo.width
-        scale_h = logo_max_height / logo.height
-        scale = min(scale_w, scale_h)
+            # Calculate scaling factor
+            scale_w = logo_max_width / logo.width
+            scale_h = logo_max_height / logo.height
+            scale = min(scale_w, scale_h)
         
-        # Resize logo
-        new_width = int(logo.width * scale)
-        new_height = int(logo.height * scale)
-        logo = logo.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            # Resize logo
+            new_width = int(logo.width * scale)
+            new_height = int(logo.height * scale)
+            logo = image_cache.resized(logo_path, (new_width, new_height))
         
-        # Create banner canvas
-        banner = Image.new('RGBA', (width, height), background_color)
+            # Create banner canvas
+            banner = Image.new('RGBA', (width, height), background_color)
         
-        # Calculate logo position (centered)
-        logo_x = (width - new_width) // 2
-        logo_y = (height - new_height) // 2
+            # Calculate logo position (centered)
+            logo_x = (width - new_width) // 2
+            logo_y = (height - new_height) // 2
         
-        # Paste logo onto banner
-        banner.paste(logo, (logo_x, logo_y), logo)
+            # Paste logo onto banner
+            banner.paste(logo, (logo_x, logo_y), logo)
         
-        # Save the banner
-        banner.save(output_path, 'PNG')
-        print(f"Banner created successfully: {output_path}")
-        print(f"Banner dimensions: {width}x{height}")
-        print(f"Logo dimensions: {new_width}x{new_height}")
+            # Save the banner
+            banner.save(output_path, 'PNG')
+            print(f"Banner created successfully: {output_path}")
+            print(f"Banner dimensions: {width}x{height}")
+            print(f"Logo dimensions: {new_width}x{new_height}")
         
-        return True
+            return True
         
     except Exception as e:
         print(f"Error creating banner: {e}")
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+HeadForge Fixture Generator
+Streams deterministic template and header data fixtures for every supported
+language and comment style, from a few hundred records up to stress scale
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+FIXTURES_VERSION = 1
+DEFAULT_SEED = 1337
+LANGUAGE_CONFIGS = Path('src') / 'utils' / 'language-configs.ts'
+
+# Committed fixtures are the small preset; larger ones stay out of the tree
+FIXTURES_DIR = Path('tests') / 'fixtures'
+CACHE_DIR = Path('.cache') / 'fixtures'
+TEMPLATES_FILE = 'sample-templates.json'
+HEADERS_FILE = 'test-data.json'
+
+# Record counts and a multiplier on free-text length, so the performance
+# suite can time the engine against both more and longer headers
+PRESETS = {
+    'small': {'templates': 60, 'headers': 240, 'text_scale': 1},
+    'medium': {'templates': 1_000, 'headers': 10_000, 'text_scale': 2},
+    'large': {'templates': 10_000, 'headers': 100_000, 'text_scale': 4},
+    'stress': {'templates': 100_000, 'headers': 1_000_000, 'text_scale': 8},
+}
+
+# Mirrors LICENSES and STATUS_OPTIONS in src/utils/constants.ts
+LICENSES = ['MIT', 'GPL-3.0', 'Apache-2.0', 'BSD-3-Clause', 'ISC', 'Unlicense', 'Custom']
+STATUSES = ['Development', 'Stable', 'Beta', 'Deprecated', 'Maintenance']
+HEADER_TYPES = ['simple', 'complete']
+
+# HeaderData fields that may be left blank; generateHeader() drops their lines
+OPTIONAL_FIELDS = ['description', 'dependencies', 'usage', 'notes', 'todo']
+
+# Non-ASCII names on purpose: headers are copied into files of any encoding
+AUTHORS = [
+    'Satoshiba', 'Ada Okafor', 'José Martínez', 'Zoë Lindqvist', 'Rin Takahashi', 'Mateusz Wójcik',
+    'Priya Raman', 'Björn Åberg', 'Leïla Haddad', 'Chen Wei', '山田 太郎', 'Noa Ben-David',
+    'Olusegun Bello', 'Aino Mäkelä', 'Dmitri Sokolov', 'Camille Dubois',
+]
+PROJECTS = [
+    'SYNCLY - YouTube PVR Extension', 'HeadForge', 'Orbit CLI', 'Tidepool Analytics', 'Lumen UI Kit',
+    'Quarry Search', 'Nimbus Deploy', 'Fernwood CMS', 'Atlas Maps SDK', 'Pulse Monitor',
+]
+WORDS = (
+    'parse render cache stream buffer header template config session token request response queue '
+    'worker schedule retry timeout payload schema migrate index query cursor batch export import '
+    'validate format encode decode resolve fetch sync merge filter transform locale theme storage '
+    'listener handler adapter service module component utility runtime bundle manifest clipboard '
+    'option preview history metadata extension browser popup content background message'
+).split()
+PACKAGES = [
+    'lodash', 'react', 'vue', 'express', 'axios', 'zod', 'dayjs', 'rxjs', 'numpy', 'pandas', 'requests',
+    'flask', 'serde', 'tokio', 'gson', 'junit', 'spring-core', 'newtonsoft.json', 'boost', 'fmt',
+    'laravel/framework', 'rails', 'alamofire', 'ktor', 'postcss', 'sass', 'pg', 'jq', 'pester', 'yq',
+]
+EXTRA_TAGS = ['copyright', 'see', 'since', 'maintainer', 'reviewed', 'changelog']
+
+# One frame line per HeaderData field: "<prefix>@tag {{var}}" or the JSON
+# template's '<prefix>"key": "{{var}}",'
+FIELD_LINE = re.compile(r'^(?P<prefix>.*?)(?P<label>@\w+ |"\w+": ")\{\{(?P<var>\w+)\}\}(?P<suffix>.*)$')
+# An entry ends at the "  }" followed by the next entry or the end of the table,
+# not at the "  }" inside the JSON template
+LANGUAGE_ENTRY = re.compile(r'^  (\w+): \{\n(.*?)^  \},?\n(?=  \w+: \{|\};)', re.MULTILINE | re.DOTALL)
+STRING_FIELD = re.compile(r"^    (\w+): '([^']*)'", re.MULTILINE)
+TEMPLATE_FIELD = re.compile(r'^    (template|templateComplete): `(.*?)`', re.MULTILINE | re.DOTALL)
+
+
+def load_languages(project_root):
+    """
+    Read the language table the extension ships
+
+    The configs are plain object literals with single-quoted strings and
+    backtick templates without interpolation, so a regex is enough.
+
+    Args:
+        project_root (Path): Repository root
+
+    Returns:
+        list: Language dicts with id, name, extension, commentStart,
+        commentEnd, commentLine, category, template and, where defined,
+        templateComplete, in declaration order
+    """
+    with open(project_root / LANGUAGE_CONFIGS, 'r', encoding='utf-8') as f:
+        source = f.read()
+
+    languages = []
+    for _, body in LANGUAGE_ENTRY.findall(source):
+        language = dict(STRING_FIELD.findall(body))
+        language.update(TEMPLATE_FIELD.findall(body))
+        languages.append(language)
+    return languages
+
+
+def comment_style(language):
+    """(commentStart, commentEnd, commentLine, opening line of the template)"""
+    return (language['commentStart'], language.get('commentEnd', ''), language['commentLine'],
+            language['template'].split('\n', 1)[0])
+
+
+def split_frame(template):
+    """
+    Split a language template into its comment frame and field lines
+
+    Returns:
+        tuple: (lines before the first field, field line matches, lines after
+        the last field)
+    """
+    lines = template.split('\n')
+    indices = [i for i, line in enumerate(lines) if FIELD_LINE.match(line)]
+    return lines[:indices[0]], [FIELD_LINE.match(lines[i]) for i in indices], lines[indices[-1] + 1:]
+
+
+def words(rng, count):
+    # choices() draws all words in one call, several times faster than choice() per word
+    return ' '.join(rng.choices(WORDS, k=count))
+
+
+def sentence(rng, count):
+    text = words(rng, count)
+    return text[0].upper() + text[1:] + '.'
+
+
+def iso_timestamp(rng, start=date(2019, 1, 1), days=2400):
+    day = start + timedelta(days=rng.randrange(days))
+    return f'{day.isoformat()}T{rng.randrange(24):02d}:{rng.randrange(60):02d}:{rng.randrange(60):02d}.000Z'
+
+
+def extra_line(rng, prefix, label, text_scale):
+    """A free-text line in the frame's own style, e.g. " * @see ..." """
+    tag = rng.choice(EXTRA_TAGS)
+    text = sentence(rng, rng.randint(4, 10) * text_scale)
+    if label.startswith('"'):
+        return f'{prefix}"{tag}": "{text}"'
+    return f'{prefix}@{tag} {text}'
+
+
+def make_template(rng, index, language, text_scale):
+    """
+    One TemplateData record (src/types/storage.ts) for a language
+
+    Defaults are the language's own templates. Custom ones keep its comment
+    frame but drop, reorder and pad the field lines, and sometimes add the
+    {{language}} variable the engine also fills in.
+    """
+    kind = rng.choice(['template', 'templateComplete']) if 'templateComplete' in language else 'template'
+    is_default = rng.random() < 0.2
+    if is_default:
+        content = language[kind]
+    else:
+        head, fields, tail = split_frame(language[kind])
+        chosen = rng.sample(fields, rng.randint(3, len(fields)))
+        if rng.random() < 0.5:
+            chosen.sort(key=fields.index)
+        sample = fields[0]
+        lines = [f"{m['prefix']}{m['label']}{{{{{m['var']}}}}}" for m in chosen]
+        if rng.random() < 0.3:
+            label = '"language": "' if sample['label'].startswith('"') else '@language '
+            lines.insert(rng.randrange(len(lines) + 1), f"{sample['prefix']}{label}{{{{language}}}}")
+        for _ in range(rng.randint(0, 3) * text_scale):
+            lines.insert(rng.randrange(len(lines) + 1),
+                         extra_line(rng, sample['prefix'], sample['label'], text_scale))
+        if sample['suffix'].endswith('",'):
+            # JSON: every member but the last takes a comma
+            lines = [line + '",' if '{{' in line else line + ',' for line in lines]
+            lines[-1] = lines[-1][:-1]
+        else:
+            lines = [line + sample['suffix'] for line in lines]
+        content = '\n'.join(head + lines + tail)
+
+    created = iso_timestamp(rng)
+    return {
+        'id': f"{language['id']}-{index:07d}",
+        'name': f"{language['name']} {'default' if is_default else words(rng, 2)} header",
+        'language': language['id'],
+        'content': content,
+        'variables': list(dict.fromkeys(re.findall(r'\{\{(\w+)\}\}', content))),
+        'isDefault': is_default,
+        'isCustom': not is_default,
+        'createdAt': created,
+        'updatedAt': max(created, iso_timestamp(rng)),
+        'usageCount': int(rng.paretovariate(1.2)) - 1,
+        **({'lastUsed': iso_timestamp(rng, start=date(2025, 1, 1), days=365)} if rng.random() < 0.7 else {}),
+    }
+
+
+def make_header(rng, index, language, header_type, text_scale):
+    """One HeaderData record (src/types/index.ts) for a language and header type"""
+    created = date(2019, 1, 1) + timedelta(days=rng.randrange(2400))
+    record = {
+        'fileName': f"{rng.choice(WORDS)}-{rng.choice(WORDS)}-{index}{language['extension']}",
+        'project': rng.choice(PROJECTS),
+        'author': rng.choice(AUTHORS),
+        'creationDate': created.isoformat(),
+        'lastUpdated': (created + timedelta(days=rng.randrange(720))).isoformat(),
+        'version': f'{rng.randrange(4)}.{rng.randrange(20)}.{rng.randrange(50)}',
+        'description': ' '.join(sentence(rng, rng.randint(6, 14)) for _ in range(rng.randint(1, 2) * text_scale)),
+        'dependencies': ', '.join(rng.sample(PACKAGES, rng.randint(1, 4 + text_scale))),
+        'license': rng.choice(LICENSES),
+        'status': rng.choice(STATUSES),
+        'language': language['id'],
+        'usage': f"{rng.choice(['Import', 'Run', 'Call', 'Include'])} {words(rng, rng.randint(3, 8))}",
+        'notes': ' '.join(sentence(rng, rng.randint(5, 12)) for _ in range(rng.randint(0, 2) * text_scale)),
+        'todo': '; '.join(words(rng, rng.randint(3, 6)) for _ in range(rng.randint(0, 3))),
+        'headerType': header_type,
+    }
+    for field in OPTIONAL_FIELDS:
+        if rng.random() < 0.15:
+            record[field] = ''
+    return record
+
+
+def iter_records(kind, languages, count, seed, text_scale):
+    """
+    Yield fixture records one at a time
+
+    Records cycle through the languages in a seeded order, and headers switch
+    header type every full cycle, so the first 2 x len(languages) records
+    already cover every language, comment style and header type. Each kind
+    draws from its own generator, so the two files are independent of each
+    other's counts.
+    """
+    rng = random.Random(f'{seed}:{kind}')
+    order = languages[:]
+    rng.shuffle(order)
+    for index in range(count):
+        language = order[index % len(order)]
+        if kind == 'templates':
+            yield make_template(rng, index, language, text_scale)
+        else:
+            header_type = HEADER_TYPES[(index // len(order)) % len(HEADER_TYPES)]
+            yield make_header(rng, index, language, header_type, text_scale)
+
+
+def write_fixture(path, kind, records, meta):
+    """
+    Stream records into a JSON document, one record per line
+
+    Only the record being serialized is in memory, so stress-sized fixtures
+    write in constant space. The file is renamed into place when complete.
+
+    Returns:
+        int: File size in bytes
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(json.dumps(meta, ensure_ascii=False)[:-1] + f', "{kind}": [')
+            separator = '\n'
+            for record in records:
+                f.write(separator)
+                f.write(json.dumps(record, ensure_ascii=False))
+                separator = ',\n'
+            f.write('\n]}\n')
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return path.stat().st_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate deterministic HeadForge test fixtures')
+    parser.add_argument('--preset', choices=PRESETS, default='small',
+                       help='Fixture size (default: small, the fixtures committed in tests/fixtures)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED,
+                       help=f'Random seed; the same seed and preset give byte-identical files (default: {DEFAULT_SEED})')
+    parser.add_argument('--output-dir',
+                       help=f'Output directory (default: {FIXTURES_DIR} for small, {CACHE_DIR}/<preset> otherwise)')
+
+    args = parser.parse_args()
+
+    # Get the directory of this script
+    script_dir = Path(__file__).resolve().parent
+    project_root = script_dir.parent
+
+    if args.output_dir:
+        output_dir = Path(args.output_dir)
+    else:
+        output_dir = project_root / (FIXTURES_DIR if args.preset == 'small' else CACHE_DIR / args.preset)
+
+    preset = PRESETS[args.preset]
+    print(f"🧪 Generating {args.preset} fixtures (seed {args.seed})...")
+    print("=" * 50)
+
+    languages = load_languages(project_root)
+    if not languages:
+        print(f"❌ No languages found in {LANGUAGE_CONFIGS}")
+        return False
+    styles = {comment_style(language) for language in languages}
+
+    start = time.perf_counter()
+    for kind, filename in (('templates', TEMPLATES_FILE), ('headers', HEADERS_FILE)):
+        count = preset[kind]
+        meta = {'version': FIXTURES_VERSION, 'seed': args.seed, 'preset': args.preset, 'count': count,
+                'languages': [language['id'] for language in languages]}
+        records = iter_records(kind, languages, count, args.seed, preset['text_scale'])
+        size = write_fixture(output_dir / filename, kind, records, meta)
+        print(f"   📝 {output_dir / filename}: {count:,} {kind}, {size / 1024:,.0f} KB")
+
+    elapsed = time.perf_counter() - start
+    print(f"\n✅ {len(languages)} languages, {len(styles)} comment styles covered in {elapsed:.1f} s")
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
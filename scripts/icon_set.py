@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+HeadForge Icon Set
+Derives the icon files each build target needs from its manifest.json, so
+icons are only rendered and shipped at the sizes something references
+"""
+
+import json
+import posixpath
+import re
+from pathlib import Path
+
+STORE_TARGETS = ['chrome', 'edge', 'firefox']
+
+# icon-<size>.png and icon-<size>-square.png, plus the traced vector icon
+ICON_FILE = re.compile(r'icon-(\d+)(-square)?\.png$')
+SVG_ICON = 'icon.svg'
+
+# Icons read by something other than a manifest, with their consumer
+EXTRA_ICONS = {
+    'icon-32.png': 'favicon.ico (convert-to-ico.js)',
+    'icon-96.png': 'Firefox high-DPI icon (recommended by validate-store-assets.py)',
+    'icon-128.png': 'store listing icon and *-store-icon.ico (convert-to-ico.js)',
+    'icon-256.png': 'app-icon.ico (convert-to-ico.js)',
+    SVG_ICON: 'scalable icon shipped in every store tree',
+}
+
+# Every icon the generator can render, for --all-icons
+ALL_ICONS = ({f'icon-{size}.png' for size in (16, 32, 48, 64, 96, 128, 256, 512)}
+             | {f'icon-{size}-square.png' for size in (16, 32, 48)} | {SVG_ICON})
+
+
+def manifest_icons(manifest):
+    """
+    Every icon path a manifest declares
+
+    Args:
+        manifest (dict): Parsed manifest.json
+
+    Returns:
+        list: (field, declared size or None, tree-relative path)
+    """
+    icons = []
+    for size, path in (manifest.get('icons') or {}).items():
+        icons.append(('icons', size, path))
+    for key in ('action', 'browser_action', 'page_action'):
+        default_icon = (manifest.get(key) or {}).get('default_icon')
+        if isinstance(default_icon, str):
+            icons.append((f'{key}.default_icon', None, default_icon))
+        elif isinstance(default_icon, dict):
+            for size, path in default_icon.items():
+                icons.append((f'{key}.default_icon', size, path))
+    return [(field, int(size) if size is not None and str(size).isdigit() else None, path.lstrip('/'))
+            for field, size, path in icons if isinstance(path, str)]
+
+
+def web_accessible_paths(manifest):
+    """
+    Literal paths listed under web_accessible_resources
+
+    Both the Manifest V2 list of strings and the V3 list of {"resources": [...]}
+    objects are read. Glob patterns such as "assets/*" only expose files, so
+    they are skipped.
+    """
+    paths = []
+    for entry in manifest.get('web_accessible_resources') or []:
+        resources = entry.get('resources', []) if isinstance(entry, dict) else [entry]
+        paths.extend(resource.lstrip('/') for resource in resources
+                     if isinstance(resource, str) and not any(char in resource for char in '*?['))
+    return paths
+
+
+def referenced_icons(manifest):
+    """
+    Icon file names a manifest references
+
+    Args:
+        manifest (dict): Parsed manifest.json
+
+    Returns:
+        set: File names such as "icon-48.png" or "icon.svg"
+    """
+    paths = [path for _, _, path in manifest_icons(manifest)] + web_accessible_paths(manifest)
+    names = {posixpath.basename(path) for path in paths}
+    return {name for name in names if ICON_FILE.fullmatch(name) or name == SVG_ICON}
+
+
+def load_icon_sets(project_root):
+    """
+    Icon file names each target needs: its manifest's references plus EXTRA_ICONS
+
+    Args:
+        project_root (Path): Repository root
+
+    Returns:
+        dict: Target ("src" or a store name) -> set of file names, for every
+        target whose manifest.json exists
+    """
+    manifests = {'src': Path(project_root) / 'src' / 'manifest.json'}
+    manifests.update({target: Path(project_root) / 'store' / target / 'manifest.json' for target in STORE_TARGETS})
+
+    icon_sets = {}
+    for target, manifest_path in manifests.items():
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            continue
+        icon_sets[target] = referenced_icons(manifest) | set(EXTRA_ICONS)
+    return icon_sets
+
+
+def parse_icon_name(name):
+    """
+    Size and variant of an icon file name
+
+    Returns:
+        tuple | None: (size, square) for PNG icons, None for icon.svg
+    """
+    match = ICON_FILE.fullmatch(name)
+    return (int(match.group(1)), bool(match.group(2))) if match else None
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+HeadForge Image Cache
+On-disk cache of decoded and derived images shared by the asset scripts,
+stored as raw pixels that are memory-mapped back without decoding or copying
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+
+from file_index import FileHashIndex
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / '.cache' / 'images'
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# magic, width, height, mode (padded to 4 bytes); pixel rows follow, unpadded
+HEADER = struct.Struct('<4sII4s')
+MAGIC = b'HFIC'
+CACHEABLE_MODES = {'RGBA', 'RGB', 'L', 'LA'}
+
+
+class ImageCache:
+    """
+    Derived images keyed by (source content hash, operation, parameters).
+
+    Entries are single files written atomically, so concurrent scripts and
+    pool workers can share one cache directory. A hit updates the entry's
+    mtime and eviction removes the least recently used entries once the
+    directory exceeds max_bytes.
+
+    close() (or leaving a with block) saves the source hash index once for
+    the run and unmaps cache files whose images are gone. Mappings still
+    backing a live image are unmapped when that image is freed.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hashes = FileHashIndex(self.cache_dir / 'sources.json')
+        self.hits = 0
+        self.misses = 0
+        self._mappings = []
+
+    def __getstate__(self):
+        # Mappings belong to this process; a worker's copy maps its own
+        state = self.__dict__.copy()
+        state['_mappings'] = []
+        return state
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def key(self, source_path, operation, params=None):
+        source = Path(source_path).resolve()
+        sha256 = self.hashes.digest(source, str(source))
+        spec = json.dumps([sha256, operation, params], sort_keys=True)
+        return hashlib.sha256(spec.encode('utf-8')).hexdigest()
+
+    def entry_path(self, key):
+        return self.cache_dir / key[:2] / f'{key}.raw'
+
+    def load(self, key):
+        """
+        Memory-map a cached image
+
+        Returns:
+            Image | None: Read-only image backed by the cache file, or None on a miss
+        """
+        from PIL import Image
+
+        self.release_mappings()
+        path = self.entry_path(key)
+        try:
+            with open(path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            return None
+
+        # A truncated or foreign file is a miss, like a missing one
+        try:
+            magic, width, height, mode = HEADER.unpack_from(mapped)
+            mode = mode.rstrip(b'\0').decode('ascii')
+        except (struct.error, UnicodeDecodeError):
+            mapped.close()
+            return None
+        if magic != MAGIC or len(mapped) != HEADER.size + width * height * len(mode):
+            mapped.close()
+            return None
+
+        os.utime(path)
+        self._mappings.append(mapped)
+        # frombuffer shares the mapping; Pillow copies on the first write
+        return Image.frombuffer(mode, (width, height), memoryview(mapped)[HEADER.size:], 'raw', mode, 0, 1)
+
+    def release_mappings(self):
+        """Unmap cache files whose images no longer exist"""
+        still_mapped = []
+        for mapped in self._mappings:
+            try:
+                mapped.close()
+            except BufferError:
+                # An image still reads from it
+                still_mapped.append(mapped)
+        self._mappings = still_mapped
+
+    def save(self):
+        """Write the source hash index if any source was hashed"""
+        self.hashes.save()
+
+    def close(self):
+        self.save()
+        self.release_mappings()
+
+    def store(self, key, image):
+        """Write an image to the cache atomically and evict old entries"""
+        if image.mode not in CACHEABLE_MODES:
+            image = image.convert('RGBA')
+
+        path = self.entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, image.width, image.height, image.mode.encode('ascii')))
+            f.write(image.tobytes())
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes"""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob('*/*.raw'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total += stat.st_size
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def derive(self, source_path, operation, params, compute):
+        """
+        Return a cached derived image, computing and storing it on a miss
+
+        Args:
+            source_path (str | Path): Source image file the result depends on
+            operation (str): Operation name, part of the cache key
+            params: JSON-serializable operation parameters, part of the cache key
+            compute (callable): Returns the image when it is not cached
+
+        Returns:
+            Image: Cached (read-only, memory-mapped) or freshly computed image
+        """
+        key = self.key(source_path, operation, params)
+        image = self.load(key)
+        if image is not None:
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        image = compute()
+        self.store(key, image)
+        return image
+
+    def decoded(self, source_path):
+        """Source image decoded to RGBA"""
+        from PIL import Image
+
+        def decode():
+            with Image.open(source_path) as img:
+                return img.convert('RGBA')
+
+        return self.derive(source_path, 'decode', {'mode': 'RGBA'}, decode)
+
+    def resized(self, source_path, size, resample='lanczos'):
+        """Source image decoded to RGBA and resized to (width, height)"""
+        from PIL import Image
+
+        filters = {'lanczos': Image.Resampling.LANCZOS, 'bicubic': Image.Resampling.BICUBIC,
+                   'bilinear': Image.Resampling.BILINEAR, 'nearest': Image.Resampling.NEAREST}
+        size = (int(size[0]), int(size[1]))
+        return self.derive(source_path, 'resize', {'size': size, 'resample': resample},
+                           lambda: self.decoded(source_path).resize(size, filters[resample]))
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+HeadForge Image Headers
+Reads image dimensions and formats from file headers without decoding pixels
+"""
+
+import re
+import struct
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# PNG IHDR color type -> (PIL-style mode name, channels)
+PNG_COLOR_TYPES = {
+    0: ('L', 1),
+    2: ('RGB', 3),
+    3: ('P', 1),
+    4: ('LA', 2),
+    6: ('RGBA', 4),
+}
+
+# Signature (8) + IHDR length/type (8) + IHDR data (13)
+PNG_HEADER_SIZE = 33
+
+
+def parse_png_header(data):
+    """
+    Parse the IHDR chunk of a PNG
+
+    Args:
+        data (bytes): At least the first 33 bytes of the file
+
+    Returns:
+        dict | None: width, height, bit_depth, color_type, mode, interlaced,
+        or None if data is not a PNG
+    """
+    if len(data) < PNG_HEADER_SIZE or not data.startswith(PNG_SIGNATURE):
+        return None
+    if data[12:16] != b'IHDR':
+        return None
+
+    width, height, bit_depth, color_type, _, _, interlace = struct.unpack('>IIBBBBB', data[16:29])
+    mode, channels = PNG_COLOR_TYPES.get(color_type, ('unknown', 0))
+    return {
+        'format': 'PNG',
+        'width': width,
+        'height': height,
+        'bit_depth': bit_depth,
+        'color_type': color_type,
+        'mode': mode,
+        'channels': channels,
+        'interlaced': bool(interlace),
+    }
+
+
+def read_png_header(path):
+    """Read the IHDR of the PNG at path, or None if it is not a PNG"""
+    with open(path, 'rb') as f:
+        return parse_png_header(f.read(PNG_HEADER_SIZE))
+
+
+def parse_ico_entries(data):
+    """
+    Parse the directory of an ICO file
+
+    Args:
+        data (bytes): The ICO header and directory (6 + 16 * count bytes)
+
+    Returns:
+        list | None: One dict per embedded image (width, height, bit_count,
+        size, offset), or None if data is not an ICO
+    """
+    if len(data) < 6:
+        return None
+    reserved, kind, count = struct.unpack('<HHH', data[:6])
+    if reserved != 0 or kind != 1:
+        return None
+
+    entries = []
+    for i in range(count):
+        start = 6 + i * 16
+        if len(data) < start + 16:
+            break
+        width, height, _, _, _, bit_count, size, offset = struct.unpack('<BBBBHHII', data[start:start + 16])
+        entries.append({
+            'width': width or 256,
+            'height': height or 256,
+            'bit_count': bit_count,
+            'size': size,
+            'offset': offset,
+        })
+    return entries
+
+
+def read_ico_entries(path):
+    """Read the directory of the ICO at path, or None if it is not an ICO"""
+    with open(path, 'rb') as f:
+        head = f.read(6)
+        if len(head) < 6:
+            return None
+        count = struct.unpack('<H', head[4:6])[0]
+        return parse_ico_entries(head + f.read(16 * count))
+
+
+# The root element sits after the XML declaration, a doctype and maybe a comment
+SVG_HEADER_SIZE = 4096
+SVG_ROOT = re.compile(r'<svg\b([^>]*)>', re.S)
+SVG_ATTRIBUTE = re.compile(r'([\w:-]+)\s*=\s*(["\'])(.*?)\2', re.S)
+# Lengths in px or without a unit; relative units have no intrinsic size
+SVG_LENGTH = re.compile(r'\s*([0-9]*\.?[0-9]+)\s*(px)?\s*$')
+
+
+def _number(value):
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+def parse_svg_length(value):
+    match = SVG_LENGTH.match(value or '')
+    return _number(match.group(1)) if match else None
+
+
+def parse_svg_header(data):
+    """
+    Parse the attributes of the root <svg> element
+
+    Args:
+        data (bytes): The start of the file, up to and including the root tag
+
+    Returns:
+        dict | None: width, height (from the width/height attributes, else the
+        viewBox), view_box (4 numbers or None), or None if no root tag is found
+    """
+    match = SVG_ROOT.search(data.decode('utf-8', errors='replace'))
+    if not match:
+        return None
+
+    attributes = {name: value for name, _, value in SVG_ATTRIBUTE.findall(match.group(1))}
+    view_box = None
+    try:
+        values = [_number(v) for v in re.split(r'[\s,]+', attributes.get('viewBox', '').strip())]
+        if len(values) == 4:
+            view_box = values
+    except ValueError:
+        pass
+
+    width = parse_svg_length(attributes.get('width'))
+    height = parse_svg_length(attributes.get('height'))
+    if width is None and view_box:
+        width = view_box[2]
+    if height is None and view_box:
+        height = view_box[3]
+    return {
+        'format': 'SVG',
+        'width': width,
+        'height': height,
+        'view_box': view_box,
+    }
+
+
+def read_svg_header(path):
+    """Read the root attributes of the SVG at path, or None if it has no <svg> root"""
+    with open(path, 'rb') as f:
+        return parse_svg_header(f.read(SVG_HEADER_SIZE))
+
+
+def read_image_header(path):
+    """
+    Read header information for any supported image type
+
+    Args:
+        path (str | Path): Image file
+
+    Returns:
+        dict | None: Header information, or None for unsupported files
+    """
+    suffix = str(path).lower().rsplit('.', 1)[-1]
+    if suffix == 'png':
+        return read_png_header(path)
+    if suffix == 'ico':
+        entries = read_ico_entries(path)
+        if entries is None:
+            return None
+        largest = max(entries, key=lambda e: e['width'] * e['height'], default=None)
+        return {
+            'format': 'ICO',
+            'width': largest['width'] if largest else 0,
+            'height': largest['height'] if largest else 0,
+            'entries': entries,
+        }
+    if suffix == 'svg':
+        return read_svg_header(path)
+    return None
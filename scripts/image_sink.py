@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+HeadForge Image Sink
+Encodes and writes rendered images on a small thread pool, so the next render
+starts while the previous one is still being compressed and written
+"""
+
+import os
+import threading
+
+DEFAULT_MAX_PENDING = 2
+
+
+class ImageSink:
+    """
+    Bounded queue of images waiting to be encoded and written.
+
+    submit() hands an image over and returns at once, unless max_pending
+    images are already queued or being encoded; then it blocks until one is
+    written, which bounds the memory renders ahead of the encoder can hold.
+    Pillow releases the GIL while compressing, so encoding overlaps with the
+    next render. Files are written to a temporary name and renamed into
+    place, so a killed build never leaves a truncated PNG behind.
+
+    flush() is the barrier: it returns once everything submitted is on disk
+    and re-raises the first encode or write error. on_written, if set, is
+    called with each path right after its rename, e.g. to journal it. A sink
+    is picklable; the copy in a worker process starts empty with the same
+    settings.
+    """
+
+    def __init__(self, workers=None, max_pending=DEFAULT_MAX_PENDING, on_written=None):
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.max_pending = max_pending
+        self.on_written = on_written
+        self._init_state()
+
+    def _init_state(self):
+        self._executor = None
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._errors = []
+
+    def __getstate__(self):
+        return {'workers': self.workers, 'max_pending': self.max_pending, 'on_written': self.on_written}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_state()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def submit(self, image, path, format='PNG', **options):
+        """
+        Queue an image for writing
+
+        The sink takes ownership: the caller must not modify or close the
+        image afterwards, and the sink closes it once written.
+
+        Args:
+            image (Image): Rendered image
+            path (Path): Destination
+            format (str): Pillow format name
+            **options: Pillow save options, e.g. optimize=True
+
+        Returns:
+            Path: path, complete on disk after the next flush()
+        """
+        self._slots.acquire()
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='image-sink')
+        future = self._executor.submit(self._write, image, path, format, options)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+        return path
+
+    def _write(self, image, path, format, options):
+        tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        try:
+            image.save(tmp_path, format, **options)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+        finally:
+            image.close()
+        if self.on_written is not None:
+            self.on_written(path)
+
+    def _done(self, future):
+        with self._lock:
+            self._pending.discard(future)
+            if future.exception() is not None:
+                self._errors.append(future.exception())
+        self._slots.release()
+
+    def flush(self):
+        """Wait until every submitted image is written; raise the first error"""
+        from concurrent.futures import wait
+
+        while True:
+            with self._lock:
+                pending = list(self._pending)
+            if not pending:
+                break
+            wait(pending)
+
+        with self._lock:
+            errors, self._errors = self._errors, []
+        if errors:
+            raise errors[0]
+
+    def close(self):
+        """Flush, then stop the encoder threads"""
+        try:
+            self.flush()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
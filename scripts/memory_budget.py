@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+HeadForge Memory Budget
+Peak-memory estimates for image jobs and a process-pool scheduler that only
+runs jobs side by side while their estimates fit under a byte budget
+"""
+
+import os
+
+MB = 1024 * 1024
+DEFAULT_BUDGET_MB = 1024
+
+# Bytes per pixel of Pillow's in-memory images; RGB and LA are padded to 4 bytes
+MODE_BYTES = {'1': 1, 'L': 1, 'P': 1, 'I;16': 2, 'LA': 4, 'RGB': 4, 'RGBA': 4, 'I': 4, 'F': 4}
+
+
+def image_bytes(size, mode='RGBA'):
+    """In-memory size of a (width, height) image of the given mode"""
+    width, height = size
+    return width * height * MODE_BYTES.get(mode, 4)
+
+
+def estimate_peak(size, mode='RGBA', copies=1):
+    """
+    Estimated peak bytes of a job whose largest image is size
+
+    Args:
+        size (tuple): (width, height) of the largest image the job holds
+        mode (str): Mode of that image
+        copies (int): Images of that size alive at once (canvas, resized
+            copies, band splits, decoded round trips)
+
+    Returns:
+        int: Bytes
+    """
+    return image_bytes(size, mode) * copies
+
+
+class MemoryScheduler:
+    """
+    Runs (estimated bytes, function, args) jobs on a process pool.
+
+    Jobs start in order while the estimates of the running jobs, plus the
+    next one, fit in budget_bytes and a worker is free. A job estimated
+    above the budget still runs, but only once nothing else is running.
+    Results are returned in job order. With jobs=1 everything runs in this
+    process, one job at a time.
+
+    Use as a context manager so the pool, created on first use, is shut
+    down deterministically.
+    """
+
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_MB * MB, jobs=None):
+        self.budget_bytes = budget_bytes
+        self.jobs = jobs
+        self.in_flight = 0
+        self.peak_bytes = 0
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    @property
+    def workers(self):
+        return self.jobs or os.cpu_count() or 1
+
+    def run(self, tasks):
+        """
+        Run jobs under the budget
+
+        Args:
+            tasks (list): (estimated bytes, picklable callable, args tuple)
+
+        Yields:
+            Each job's return value, in job order
+        """
+        tasks = list(tasks)
+        if self.workers == 1 or len(tasks) <= 1:
+            for cost, function, args in tasks:
+                self.peak_bytes = max(self.peak_bytes, cost)
+                yield function(*args)
+            return
+
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        running = {}
+        results = {}
+        next_task = next_result = 0
+        while next_result < len(tasks):
+            # Admit jobs in order while the next one fits next to those running
+            while next_task < len(tasks) and len(running) < self.workers:
+                cost, function, args = tasks[next_task]
+                if running and self.in_flight + cost > self.budget_bytes:
+                    break
+                running[self._executor.submit(function, *args)] = (next_task, cost)
+                self.in_flight += cost
+                self.peak_bytes = max(self.peak_bytes, self.in_flight)
+                next_task += 1
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, cost = running.pop(future)
+                self.in_flight -= cost
+                results[index] = future.result()
+
+            while next_result in results:
+                yield results.pop(next_result)
+                next_result += 1
@@ -0,0 +1,865 @@
+#!/usr/bin/env python3
+"""
+HeadForge Mermaid Renderer
+Offline renderer for the subset of Mermaid flowcharts used by
+create-diagrams.py: graph TB/TD/BT/LR/RL, subgraph, node shapes, edge labels,
+classDef/class and style. Layout is a layered (Sugiyama-style) graph layout;
+output is SVG (pure Python) or PNG (via Pillow).
+"""
+
+import re
+from html import escape
+
+FONT_SIZE = 14
+LINE_HEIGHT = 18
+NODE_PAD_X = 15
+NODE_PAD_Y = 10
+NODE_GAP = 30
+RANK_GAP = 50
+CLUSTER_PAD = 14
+CLUSTER_TITLE = 22
+MARGIN = 20
+
+DEFAULT_NODE_STYLE = {'fill': '#ECECFF', 'stroke': '#9370DB', 'stroke-width': '1px', 'color': '#333333'}
+DEFAULT_CLUSTER_STYLE = {'fill': '#ffffde', 'stroke': '#aaaa33', 'stroke-width': '1px', 'color': '#333333'}
+EDGE_COLOR = '#333333'
+EDGE_LABEL_BG = '#e8e8e8'
+FONT_FAMILY = '"trebuchet ms", verdana, arial, sans-serif'
+
+# Candidate TrueType fonts for PNG output, first match wins
+PNG_FONTS = ['DejaVuSans.ttf', 'arial.ttf', 'Arial.ttf', 'LiberationSans-Regular.ttf']
+
+NODE_PATTERN = re.compile(
+    r'([A-Za-z0-9_]+)\s*'
+    r'(\(\((?P<circle>.*?)\)\)|\[(?P<rect>.*?)\]|\((?P<round>.*?)\)|\{(?P<rhombus>.*?)\})?'
+    r'(?::::(?P<cls>[A-Za-z0-9_-]+))?'
+)
+EDGE_PATTERN = re.compile(r'\s*(-->|---|-\.->|==>)\s*(?:\|(?P<label>[^|]*)\|)?\s*')
+DIRECTIONS = {'TB', 'TD', 'BT', 'LR', 'RL'}
+
+
+class MermaidSyntaxError(ValueError):
+    """Raised for statements outside the supported Mermaid subset"""
+
+
+class Node:
+    def __init__(self, node_id):
+        self.id = node_id
+        self.label = node_id
+        self.shape = 'rect'
+        self.classes = []
+        self.style = {}
+        self.cluster = None
+        self.layer = 0
+        self.order = 0.0
+        self.pos = 0.0
+        self.width = 0.0
+        self.height = 0.0
+        self.x = 0.0
+        self.y = 0.0
+
+
+class Edge:
+    def __init__(self, src, dst, kind, label):
+        self.src = src
+        self.dst = dst
+        self.kind = kind
+        self.label = label
+        self.reversed = False
+
+
+class Cluster:
+    def __init__(self, cluster_id, title, parent=None):
+        self.id = cluster_id
+        self.title = title
+        self.parent = parent
+        self.children = []
+        self.nodes = []
+        self.classes = []
+        self.style = {}
+        self.index = len(parent.children) if parent else 0
+        self.depth = parent.depth + 1 if parent else 0
+        self.box = None
+
+
+class Diagram:
+    def __init__(self, direction):
+        self.direction = direction
+        self.nodes = {}
+        self.edges = []
+        self.root = Cluster('__root__', '')
+        self.clusters = {}
+        self.class_defs = {}
+        self.width = 0.0
+        self.height = 0.0
+
+    @property
+    def horizontal(self):
+        return self.direction in ('LR', 'RL')
+
+
+# ---------------------------------------------------------------------------
+# Parsing
+# ---------------------------------------------------------------------------
+
+def parse_style(text):
+    """Parse 'fill:#fff,stroke:#000,stroke-width:2px' into a dict"""
+    style = {}
+    for part in text.split(','):
+        if ':' in part:
+            key, value = part.split(':', 1)
+            style[key.strip()] = value.strip()
+    return style
+
+
+def clean_label(text):
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] == '"':
+        text = text[1:-1]
+    return re.sub(r'<br\s*/?>', '\n', text)
+
+
+def parse(source):
+    """
+    Parse Mermaid flowchart source
+
+    Args:
+        source (str): Mermaid text starting with `graph <DIR>` or `flowchart <DIR>`
+
+    Returns:
+        Diagram: Parsed diagram (not yet laid out)
+    """
+    lines = [line.strip().rstrip(';') for line in source.splitlines()]
+    lines = [line for line in lines if line and not line.startswith('%%')]
+    if not lines:
+        raise MermaidSyntaxError('empty diagram')
+
+    header = lines[0].split()
+    if header[0] not in ('graph', 'flowchart') or len(header) < 2 or header[1] not in DIRECTIONS:
+        raise MermaidSyntaxError(f'unsupported diagram header: {lines[0]!r}')
+    diagram = Diagram('TB' if header[1] == 'TD' else header[1])
+
+    stack = [diagram.root]
+    for line in lines[1:]:
+        keyword = line.split(None, 1)[0]
+
+        if keyword == 'subgraph':
+            spec = line[len('subgraph'):].strip()
+            match = re.match(r'^([A-Za-z0-9_-]+)\s*\[(.*)\]$', spec)
+            if match:
+                cluster_id, title = match.group(1), clean_label(match.group(2))
+            else:
+                title = clean_label(spec)
+                cluster_id = spec if re.match(r'^[A-Za-z0-9_-]+$', spec) else f'cluster{len(diagram.clusters)}'
+            cluster = Cluster(cluster_id, title, stack[-1])
+            stack[-1].children.append(cluster)
+            diagram.clusters[cluster_id] = cluster
+            stack.append(cluster)
+        elif line == 'end':
+            if len(stack) == 1:
+                raise MermaidSyntaxError('"end" without matching subgraph')
+            stack.pop()
+        elif keyword == 'classDef':
+            _, name, props = line.split(None, 2)
+            diagram.class_defs[name] = parse_style(props)
+        elif keyword == 'class':
+            _, targets, name = line.split(None, 2)
+            for target in targets.split(','):
+                target = target.strip()
+                if target in diagram.clusters:
+                    diagram.clusters[target].classes.append(name)
+                else:
+                    get_node(diagram, target, stack[-1]).classes.append(name)
+        elif keyword == 'style':
+            _, target, props = line.split(None, 2)
+            owner = diagram.clusters.get(target) or get_node(diagram, target, stack[-1])
+            owner.style.update(parse_style(props))
+        elif keyword in ('linkStyle', 'click', 'direction'):
+            continue
+        else:
+            parse_statement(diagram, line, stack[-1])
+
+    if len(stack) != 1:
+        raise MermaidSyntaxError('unterminated subgraph')
+    return diagram
+
+
+def get_node(diagram, node_id, cluster):
+    node = diagram.nodes.get(node_id)
+    if node is None:
+        node = Node(node_id)
+        diagram.nodes[node_id] = node
+    # A node belongs to the first subgraph it appears in
+    if node.cluster is None or (node.cluster is diagram.root and cluster is not diagram.root):
+        if node.cluster is not None:
+            node.cluster.nodes.remove(node)
+        node.cluster = cluster
+        cluster.nodes.append(node)
+    return node
+
+
+def parse_node(diagram, line, pos, cluster):
+    match = NODE_PATTERN.match(line, pos)
+    if not match or match.end() == pos:
+        raise MermaidSyntaxError(f'cannot parse node at {line[pos:]!r}')
+
+    node = get_node(diagram, match.group(1), cluster)
+    for shape in ('circle', 'rect', 'round', 'rhombus'):
+        label = match.group(shape)
+        if label is not None:
+            node.shape = shape
+            node.label = clean_label(label)
+    if match.group('cls'):
+        node.classes.append(match.group('cls'))
+    return node, match.end()
+
+
+def parse_statement(diagram, line, cluster):
+    node, pos = parse_node(diagram, line, 0, cluster)
+    while pos < len(line):
+        match = EDGE_PATTERN.match(line, pos)
+        if not match:
+            raise MermaidSyntaxError(f'cannot parse edge at {line[pos:]!r}')
+        target, pos = parse_node(diagram, line, match.end(), cluster)
+        label = clean_label(match.group('label')) if match.group('label') else ''
+        diagram.edges.append(Edge(node, target, match.group(1), label))
+        node = target
+
+
+# ---------------------------------------------------------------------------
+# Layout
+# ---------------------------------------------------------------------------
+
+def text_width(text, font_size=FONT_SIZE):
+    """Estimate the rendered width of one line of sans-serif text"""
+    width = 0.0
+    for char in text:
+        if char in 'il.,:;|!\'`':
+            width += 0.3
+        elif char in 'mwMW@':
+            width += 0.85
+        elif char.isupper():
+            width += 0.68
+        elif char == ' ':
+            width += 0.3
+        else:
+            width += 0.55
+    return width * font_size
+
+
+def text_size(text):
+    lines = text.split('\n')
+    return max(text_width(line) for line in lines), len(lines) * LINE_HEIGHT
+
+
+def size_nodes(diagram):
+    for node in diagram.nodes.values():
+        tw, th = text_size(node.label)
+        if node.shape == 'rhombus':
+            half_h = th / 2 + 12
+            half_w = (tw / 2) / (1 - (th / 2) / half_h) + 8
+            node.width, node.height = 2 * half_w, 2 * half_h
+        elif node.shape == 'circle':
+            node.width = node.height = max(tw, th) + 2 * NODE_PAD_Y
+        else:
+            node.width, node.height = tw + 2 * NODE_PAD_X, th + 2 * NODE_PAD_Y
+
+
+def assign_layers(diagram):
+    """Break cycles by DFS and assign longest-path layers"""
+    nodes = list(diagram.nodes.values())
+    successors = {node.id: [] for node in nodes}
+    for edge in diagram.edges:
+        if edge.src is not edge.dst:
+            successors[edge.src.id].append(edge)
+
+    state = {}
+    for root in nodes:
+        if root.id in state:
+            continue
+        state[root.id] = 'active'
+        stack = [(root, iter(successors[root.id]))]
+        while stack:
+            node, edges = stack[-1]
+            edge = next(edges, None)
+            if edge is None:
+                state[node.id] = 'done'
+                stack.pop()
+                continue
+            target_state = state.get(edge.dst.id)
+            if target_state == 'active':
+                edge.reversed = True
+            elif target_state is None:
+                state[edge.dst.id] = 'active'
+                stack.append((edge.dst, iter(successors[edge.dst.id])))
+
+    preds = {node.id: [] for node in nodes}
+    succs = {node.id: [] for node in nodes}
+    for edge in diagram.edges:
+        if edge.src is edge.dst:
+            continue
+        src, dst = (edge.dst, edge.src) if edge.reversed else (edge.src, edge.dst)
+        preds[dst.id].append(src)
+        succs[src.id].append(dst)
+
+    # Kahn's algorithm in declaration order keeps the layout stable
+    indegree = {node.id: len(preds[node.id]) for node in nodes}
+    queue = [node for node in nodes if indegree[node.id] == 0]
+    for node in queue:
+        for succ in succs[node.id]:
+            succ.layer = max(succ.layer, node.layer + 1)
+            indegree[succ.id] -= 1
+            if indegree[succ.id] == 0:
+                queue.append(succ)
+
+    # Pull sources down next to their first successor
+    for node in nodes:
+        if not preds[node.id] and succs[node.id]:
+            node.layer = min(succ.layer for succ in succs[node.id]) - 1
+
+    return preds, succs
+
+
+def cluster_path(node):
+    path = []
+    cluster = node.cluster
+    while cluster is not None and cluster.parent is not None:
+        path.append((0, cluster.index))
+        cluster = cluster.parent
+    return path[::-1]
+
+
+def order_layers(diagram, preds, succs, sweeps=4):
+    """Order nodes within layers by barycenter, keeping clusters contiguous"""
+    layers = {}
+    for node in diagram.nodes.values():
+        layers.setdefault(node.layer, []).append(node)
+    for layer_nodes in layers.values():
+        for i, node in enumerate(layer_nodes):
+            node.order = float(i)
+
+    paths = {node.id: cluster_path(node) for node in diagram.nodes.values()}
+    keys = sorted(layers)
+    for sweep in range(sweeps):
+        downward = sweep % 2 == 0
+        for layer in (keys if downward else keys[::-1]):
+            layer_nodes = layers[layer]
+            for node in layer_nodes:
+                neighbors = preds[node.id] if downward else succs[node.id]
+                if neighbors:
+                    node.order = sum(n.order for n in neighbors) / len(neighbors)
+            layer_nodes.sort(key=lambda n: paths[n.id] + [(1, n.order)])
+            for i, node in enumerate(layer_nodes):
+                node.order = float(i)
+    return layers
+
+
+def breadth(diagram, node):
+    return node.height if diagram.horizontal else node.width
+
+
+def depth(diagram, node):
+    return node.width if diagram.horizontal else node.height
+
+
+def all_nodes(cluster):
+    nodes = list(cluster.nodes)
+    for child in cluster.children:
+        nodes.extend(all_nodes(child))
+    return nodes
+
+
+def cluster_extent(diagram, cluster):
+    """Return (low, high, min_layer, max_layer) of a cluster along the order axis"""
+    low = min((n.pos - breadth(diagram, n) / 2 for n in cluster.nodes), default=None)
+    high = max((n.pos + breadth(diagram, n) / 2 for n in cluster.nodes), default=None)
+    layers = [n.layer for n in cluster.nodes]
+    for child in cluster.children:
+        extent = cluster_extent(diagram, child)
+        if extent is None:
+            continue
+        c_low, c_high, c_min, c_max = extent
+        low = c_low if low is None else min(low, c_low)
+        high = c_high if high is None else max(high, c_high)
+        layers.extend([c_min, c_max])
+    if low is None:
+        return None
+
+    title = CLUSTER_TITLE if diagram.horizontal and cluster.parent is not None else 0
+    pad = CLUSTER_PAD if cluster.parent is not None else 0
+    return low - pad - title, high + pad, min(layers), max(layers)
+
+
+def shift_cluster(cluster, delta):
+    for node in all_nodes(cluster):
+        node.pos += delta
+
+
+def compact_cluster(diagram, cluster):
+    """Pack each layer of a cluster's own nodes tightly around a shared center"""
+    center = sum(n.pos for n in cluster.nodes) / len(cluster.nodes)
+    by_layer = {}
+    for node in cluster.nodes:
+        by_layer.setdefault(node.layer, []).append(node)
+    for layer_nodes in by_layer.values():
+        layer_nodes.sort(key=lambda n: n.pos)
+        total = sum(breadth(diagram, n) for n in layer_nodes) + NODE_GAP * (len(layer_nodes) - 1)
+        cursor = center - total / 2
+        for node in layer_nodes:
+            node.pos = cursor + breadth(diagram, node) / 2
+            cursor += breadth(diagram, node) + NODE_GAP
+
+
+def resolve_clusters(diagram, cluster):
+    """Push sibling clusters and loose nodes apart wherever their layers overlap"""
+    for child in cluster.children:
+        resolve_clusters(diagram, child)
+
+    if cluster.parent is not None and cluster.nodes:
+        compact_cluster(diagram, cluster)
+
+    placed = []
+    for child in cluster.children:
+        extent = cluster_extent(diagram, child)
+        if extent is None:
+            continue
+        need = 0.0
+        for p_low, p_high, p_min, p_max in placed:
+            if p_min <= extent[3] and extent[2] <= p_max:
+                need = max(need, p_high + NODE_GAP - extent[0])
+        if need > 0:
+            shift_cluster(child, need)
+            extent = cluster_extent(diagram, child)
+        placed.append(extent)
+
+    loose = sorted(cluster.nodes, key=lambda n: (n.layer, n.pos))
+    previous = {}
+    for node in loose:
+        half = breadth(diagram, node) / 2
+        low = node.pos - half
+        for p_low, p_high, p_min, p_max in placed:
+            if p_min <= node.layer <= p_max:
+                low = max(low, p_high + NODE_GAP)
+        if node.layer in previous:
+            low = max(low, previous[node.layer] + NODE_GAP)
+        node.pos = low + half
+        previous[node.layer] = node.pos + half
+
+
+def separate_layer(diagram, layer_nodes):
+    layer_nodes.sort(key=lambda n: n.order)
+    for left, right in zip(layer_nodes, layer_nodes[1:]):
+        min_pos = left.pos + (breadth(diagram, left) + breadth(diagram, right)) / 2 + NODE_GAP
+        if right.pos < min_pos:
+            right.pos = min_pos
+
+
+def position_nodes(diagram, layers, preds, succs, iterations=6):
+    """Assign order-axis positions by barycentric refinement, then rank-axis positions"""
+    for layer_nodes in layers.values():
+        cursor = 0.0
+        for node in sorted(layer_nodes, key=lambda n: n.order):
+            node.pos = cursor + breadth(diagram, node) / 2
+            cursor += breadth(diagram, node) + NODE_GAP
+
+    keys = sorted(layers)
+    for iteration in range(iterations):
+        downward = iteration % 2 == 0
+        for layer in (keys if downward else keys[::-1]):
+            for node in layers[layer]:
+                neighbors = preds[node.id] if downward else succs[node.id]
+                if neighbors:
+                    node.pos = sum(n.pos for n in neighbors) / len(neighbors)
+            separate_layer(diagram, layers[layer])
+
+    # Cluster constraints only ever push right, so apply them once at the end
+    # rather than letting every refinement pass accumulate drift
+    resolve_clusters(diagram, diagram.root)
+
+    max_depth = max((c.depth for c in diagram.clusters.values()), default=0)
+    rank_gap = RANK_GAP + (CLUSTER_TITLE if not diagram.horizontal and max_depth else 0) + 2 * CLUSTER_PAD * max_depth
+
+    rank_pos = {}
+    cursor = 0.0
+    for layer in keys:
+        layer_depth = max(depth(diagram, n) for n in layers[layer])
+        rank_pos[layer] = cursor + layer_depth / 2
+        cursor += layer_depth + rank_gap
+
+    offset = -min(n.pos - breadth(diagram, n) / 2 for n in diagram.nodes.values())
+    for node in diagram.nodes.values():
+        order_coord = node.pos + offset
+        rank_coord = rank_pos[node.layer]
+        if diagram.horizontal:
+            node.x, node.y = rank_coord, order_coord
+        else:
+            node.x, node.y = order_coord, rank_coord
+
+
+def compute_cluster_boxes(diagram, cluster):
+    """Compute (x0, y0, x1, y1) boxes for every cluster, innermost first"""
+    boxes = [(n.x - n.width / 2, n.y - n.height / 2, n.x + n.width / 2, n.y + n.height / 2)
+             for n in cluster.nodes]
+    for child in cluster.children:
+        box = compute_cluster_boxes(diagram, child)
+        if box:
+            boxes.append(box)
+    if not boxes:
+        cluster.box = None
+        return None
+    cluster.box = (min(b[0] for b in boxes) - CLUSTER_PAD,
+                   min(b[1] for b in boxes) - CLUSTER_PAD - CLUSTER_TITLE,
+                   max(b[2] for b in boxes) + CLUSTER_PAD,
+                   max(b[3] for b in boxes) + CLUSTER_PAD)
+    return cluster.box
+
+
+def layout(diagram):
+    """
+    Lay out a parsed diagram in place
+
+    Args:
+        diagram (Diagram): Output of parse()
+
+    Returns:
+        Diagram: The same diagram with node coordinates, cluster boxes and size set
+    """
+    if not diagram.nodes:
+        diagram.width = diagram.height = 2 * MARGIN
+        return diagram
+
+    size_nodes(diagram)
+    preds, succs = assign_layers(diagram)
+    layers = order_layers(diagram, preds, succs)
+    position_nodes(diagram, layers, preds, succs)
+
+    if diagram.direction in ('BT', 'RL'):
+        max_x = max(n.x for n in diagram.nodes.values())
+        max_y = max(n.y for n in diagram.nodes.values())
+        for node in diagram.nodes.values():
+            if diagram.direction == 'BT':
+                node.y = max_y - node.y
+            else:
+                node.x = max_x - node.x
+
+    for child in diagram.root.children:
+        compute_cluster_boxes(diagram, child)
+
+    boxes = [(n.x - n.width / 2, n.y - n.height / 2, n.x + n.width / 2, n.y + n.height / 2)
+             for n in diagram.nodes.values()]
+    boxes.extend(c.box for c in diagram.clusters.values() if c.box)
+    min_x = min(b[0] for b in boxes) - MARGIN
+    min_y = min(b[1] for b in boxes) - MARGIN
+    for node in diagram.nodes.values():
+        node.x -= min_x
+        node.y -= min_y
+    for cluster in diagram.clusters.values():
+        if cluster.box:
+            x0, y0, x1, y1 = cluster.box
+            cluster.box = (x0 - min_x, y0 - min_y, x1 - min_x, y1 - min_y)
+    diagram.width = max(b[2] for b in boxes) - min_x + MARGIN
+    diagram.height = max(b[3] for b in boxes) - min_y + MARGIN
+    return diagram
+
+
+# ---------------------------------------------------------------------------
+# Geometry shared by the SVG and PNG back ends
+# ---------------------------------------------------------------------------
+
+def resolved_style(diagram, owner, default):
+    style = dict(default)
+    for name in owner.classes:
+        style.update(diagram.class_defs.get(name, {}))
+    style.update(owner.style)
+    return style
+
+
+def stroke_width(style):
+    try:
+        return float(style.get('stroke-width', '1px').rstrip('px'))
+    except ValueError:
+        return 1.0
+
+
+def edge_geometry(diagram, edge):
+    """
+    Return the cubic Bezier control points of an edge
+
+    Forward edges leave the far side of the source and enter the near side of
+    the target; edges pointing backwards along the flow loop around the side.
+    """
+    src, dst = edge.src, edge.dst
+    if diagram.horizontal:
+        forward = (dst.x > src.x) == (diagram.direction == 'LR')
+        if dst.layer == src.layer:
+            start = (src.x, src.y + src.height / 2 * (1 if dst.y > src.y else -1))
+            end = (dst.x, dst.y - dst.height / 2 * (1 if dst.y > src.y else -1))
+            return [start, (start[0], (start[1] + end[1]) / 2), (end[0], (start[1] + end[1]) / 2), end]
+        sign = 1 if dst.x > src.x else -1
+        start = (src.x + sign * src.width / 2, src.y)
+        end = (dst.x - sign * dst.width / 2, dst.y)
+        mid = (start[0] + end[0]) / 2
+        if not forward:
+            bend = max(src.height, dst.height) / 2 + NODE_GAP
+            return [start, (mid, start[1] + bend), (mid, end[1] + bend), end]
+        return [start, (mid, start[1]), (mid, end[1]), end]
+
+    if dst.layer == src.layer:
+        sign = 1 if dst.x > src.x else -1
+        start = (src.x + sign * src.width / 2, src.y)
+        end = (dst.x - sign * dst.width / 2, dst.y)
+        return [start, ((start[0] + end[0]) / 2, start[1]), ((start[0] + end[0]) / 2, end[1]), end]
+
+    sign = 1 if dst.y > src.y else -1
+    if edge.reversed:
+        # Loop around the right-hand side so the edge does not cut through the column
+        start = (src.x + src.width / 2, src.y)
+        end = (dst.x + dst.width / 2, dst.y)
+        bend = max(start[0], end[0]) + NODE_GAP * 1.5
+        return [start, (bend, start[1]), (bend, end[1]), end]
+    start = (src.x, src.y + sign * src.height / 2)
+    end = (dst.x, dst.y - sign * dst.height / 2)
+    mid = (start[1] + end[1]) / 2
+    return [start, (start[0], mid), (end[0], mid), end]
+
+
+def bezier_point(points, t):
+    (x0, y0), (x1, y1), (x2, y2), (x3, y3) = points
+    u = 1 - t
+    return (u ** 3 * x0 + 3 * u * u * t * x1 + 3 * u * t * t * x2 + t ** 3 * x3,
+            u ** 3 * y0 + 3 * u * u * t * y1 + 3 * u * t * t * y2 + t ** 3 * y3)
+
+
+def arrow_head(points, size=9):
+    """Triangle at the end of an edge, pointing along the final tangent"""
+    (x2, y2), (x3, y3) = points[2], points[3]
+    if (x2, y2) == (x3, y3):
+        x2, y2 = points[1]
+    dx, dy = x3 - x2, y3 - y2
+    length = (dx * dx + dy * dy) ** 0.5 or 1.0
+    ux, uy = dx / length, dy / length
+    base = (x3 - ux * size, y3 - uy * size)
+    return [(x3, y3), (base[0] - uy * size / 2, base[1] + ux * size / 2),
+            (base[0] + uy * size / 2, base[1] - ux * size / 2)]
+
+
+def node_outline(node):
+    x0, y0 = node.x - node.width / 2, node.y - node.height / 2
+    x1, y1 = node.x + node.width / 2, node.y + node.height / 2
+    if node.shape == 'rhombus':
+        return [(node.x, y0), (x1, node.y), (node.x, y1), (x0, node.y)]
+    return [(x0, y0), (x1, y1)]
+
+
+def clusters_outer_first(cluster):
+    for child in cluster.children:
+        yield child
+        yield from clusters_outer_first(child)
+
+
+# ---------------------------------------------------------------------------
+# SVG
+# ---------------------------------------------------------------------------
+
+def svg_text(x, y, text, color, anchor='middle', weight='normal'):
+    lines = text.split('\n')
+    first = y - (len(lines) - 1) * LINE_HEIGHT / 2
+    spans = ''.join(
+        f'<tspan x="{x:.1f}" y="{first + i * LINE_HEIGHT:.1f}">{escape(line)}</tspan>'
+        for i, line in enumerate(lines)
+    )
+    return (f'<text text-anchor="{anchor}" dominant-baseline="central" fill="{color}" '
+            f'font-weight="{weight}">{spans}</text>')
+
+
+def render_svg(diagram):
+    """
+    Render a laid-out diagram as an SVG document
+
+    Args:
+        diagram (Diagram): Output of layout()
+
+    Returns:
+        str: SVG markup
+    """
+    width, height = diagram.width, diagram.height
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.0f}" height="{height:.0f}" '
+        f'viewBox="0 0 {width:.0f} {height:.0f}">',
+        f'<style>text{{font-family:{FONT_FAMILY};font-size:{FONT_SIZE}px}}</style>',
+        f'<rect width="100%" height="100%" fill="#ffffff"/>',
+    ]
+
+    for cluster in clusters_outer_first(diagram.root):
+        if not cluster.box:
+            continue
+        style = resolved_style(diagram, cluster, DEFAULT_CLUSTER_STYLE)
+        x0, y0, x1, y1 = cluster.box
+        parts.append(f'<rect x="{x0:.1f}" y="{y0:.1f}" width="{x1 - x0:.1f}" height="{y1 - y0:.1f}" '
+                     f'fill="{style["fill"]}" stroke="{style["stroke"]}" stroke-width="{stroke_width(style)}"/>')
+        # Left-aligned so edges entering at the top center do not cross the title
+        parts.append(svg_text(x0 + CLUSTER_PAD / 2, y0 + CLUSTER_TITLE / 2 + 2, cluster.title, style['color'],
+                              anchor='start'))
+
+    labels = []
+    for edge in diagram.edges:
+        points = edge_geometry(diagram, edge)
+        (x0, y0), (x1, y1), (x2, y2), (x3, y3) = points
+        dash = ' stroke-dasharray="4 3"' if edge.kind == '-.->' else ''
+        width_attr = 3 if edge.kind == '==>' else 1.5
+        parts.append(f'<path d="M{x0:.1f},{y0:.1f} C{x1:.1f},{y1:.1f} {x2:.1f},{y2:.1f} {x3:.1f},{y3:.1f}" '
+                     f'fill="none" stroke="{EDGE_COLOR}" stroke-width="{width_attr}"{dash}/>')
+        if edge.kind != '---':
+            head = ' '.join(f'{x:.1f},{y:.1f}' for x, y in arrow_head(points))
+            parts.append(f'<polygon points="{head}" fill="{EDGE_COLOR}"/>')
+        if edge.label:
+            labels.append((bezier_point(points, 0.5), edge.label))
+
+    for (x, y), label in labels:
+        tw, th = text_size(label)
+        parts.append(f'<rect x="{x - tw / 2 - 4:.1f}" y="{y - th / 2 - 2:.1f}" width="{tw + 8:.1f}" '
+                     f'height="{th + 4:.1f}" fill="{EDGE_LABEL_BG}"/>')
+        parts.append(svg_text(x, y, label, EDGE_COLOR))
+
+    for node in diagram.nodes.values():
+        style = resolved_style(diagram, node, DEFAULT_NODE_STYLE)
+        paint = f'fill="{style["fill"]}" stroke="{style["stroke"]}" stroke-width="{stroke_width(style)}"'
+        outline = node_outline(node)
+        if node.shape == 'rhombus':
+            points = ' '.join(f'{x:.1f},{y:.1f}' for x, y in outline)
+            parts.append(f'<polygon points="{points}" {paint}/>')
+        elif node.shape == 'circle':
+            parts.append(f'<circle cx="{node.x:.1f}" cy="{node.y:.1f}" r="{node.width / 2:.1f}" {paint}/>')
+        else:
+            (x0, y0), (x1, y1) = outline
+            radius = 5 if node.shape == 'round' else 0
+            parts.append(f'<rect x="{x0:.1f}" y="{y0:.1f}" width="{x1 - x0:.1f}" height="{y1 - y0:.1f}" '
+                         f'rx="{radius}" {paint}/>')
+        parts.append(svg_text(node.x, node.y, node.label, style['color']))
+
+    parts.append('</svg>')
+    return '\n'.join(parts) + '\n'
+
+
+# ---------------------------------------------------------------------------
+# PNG
+# ---------------------------------------------------------------------------
+
+_font_cache = {}
+
+
+def load_font(size):
+    from PIL import ImageFont
+
+    if size not in _font_cache:
+        font = None
+        for name in PNG_FONTS:
+            try:
+                font = ImageFont.truetype(name, size)
+                break
+            except OSError:
+                continue
+        if font is None:
+            try:
+                font = ImageFont.load_default(size)
+            except TypeError:
+                font = ImageFont.load_default()
+        _font_cache[size] = font
+    return _font_cache[size]
+
+
+def render_png(diagram, scale=1.0):
+    """
+    Render a laid-out diagram to a Pillow image
+
+    Args:
+        diagram (Diagram): Output of layout()
+        scale (float): Pixels per layout unit
+
+    Returns:
+        PIL.Image.Image: RGB image
+    """
+    from PIL import Image, ImageDraw
+
+    def s(point):
+        return (point[0] * scale, point[1] * scale)
+
+    image = Image.new('RGB', (max(1, round(diagram.width * scale)), max(1, round(diagram.height * scale))), '#ffffff')
+    draw = ImageDraw.Draw(image)
+    font = load_font(round(FONT_SIZE * scale))
+
+    def text(center, value, color, anchor='mm'):
+        lines = value.split('\n')
+        top = center[1] - (len(lines) - 1) * LINE_HEIGHT * scale / 2
+        for i, line in enumerate(lines):
+            draw.text((center[0], top + i * LINE_HEIGHT * scale), line, fill=color, font=font, anchor=anchor)
+
+    for cluster in clusters_outer_first(diagram.root):
+        if not cluster.box:
+            continue
+        style = resolved_style(diagram, cluster, DEFAULT_CLUSTER_STYLE)
+        x0, y0, x1, y1 = cluster.box
+        draw.rectangle([s((x0, y0)), s((x1, y1))], fill=style['fill'], outline=style['stroke'],
+                       width=max(1, round(stroke_width(style) * scale)))
+        text(s((x0 + CLUSTER_PAD / 2, y0 + CLUSTER_TITLE / 2 + 2)), cluster.title, style['color'], anchor='lm')
+
+    labels = []
+    for edge in diagram.edges:
+        points = edge_geometry(diagram, edge)
+        curve = [s(bezier_point(points, i / 16)) for i in range(17)]
+        line_width = max(1, round((3 if edge.kind == '==>' else 1.5) * scale))
+        draw.line(curve, fill=EDGE_COLOR, width=line_width, joint='curve')
+        if edge.kind != '---':
+            draw.polygon([s(p) for p in arrow_head(points)], fill=EDGE_COLOR)
+        if edge.label:
+            labels.append((bezier_point(points, 0.5), edge.label))
+
+    for (x, y), label in labels:
+        tw, th = text_size(label)
+        draw.rectangle([s((x - tw / 2 - 4, y - th / 2 - 2)), s((x + tw / 2 + 4, y + th / 2 + 2))], fill=EDGE_LABEL_BG)
+        text(s((x, y)), label, EDGE_COLOR)
+
+    for node in diagram.nodes.values():
+        style = resolved_style(diagram, node, DEFAULT_NODE_STYLE)
+        width = max(1, round(stroke_width(style) * scale))
+        outline = [s(p) for p in node_outline(node)]
+        if node.shape == 'rhombus':
+            draw.polygon(outline, fill=style['fill'], outline=style['stroke'], width=width)
+        elif node.shape == 'circle':
+            draw.ellipse(outline, fill=style['fill'], outline=style['stroke'], width=width)
+        elif node.shape == 'round':
+            draw.rounded_rectangle(outline, radius=5 * scale, fill=style['fill'], outline=style['stroke'], width=width)
+        else:
+            draw.rectangle(outline, fill=style['fill'], outline=style['stroke'], width=width)
+        text(s((node.x, node.y)), node.label, style['color'])
+
+    return image
+
+
+def render(source, svg_path=None, png_path=None, scale=1.0):
+    """
+    Parse, lay out and write a Mermaid diagram
+
+    Args:
+        source (str): Mermaid source
+        svg_path (str | Path): Where to write the SVG, if any
+        png_path (str | Path): Where to write the PNG, if any
+        scale (float): PNG pixels per layout unit
+
+    Returns:
+        Diagram: The laid-out diagram
+    """
+    diagram = layout(parse(source))
+    if svg_path:
+        with open(svg_path, 'w', encoding='utf-8') as f:
+            f.write(render_svg(diagram))
+    if png_path:
+        render_png(diagram, scale).save(png_path, 'PNG')
+    return diagram
+
+
+def render_file(source_path, svg_path=None, png_path=None, scale=1.0):
+    """Render a .mmd file; a top-level function so it can run in a process pool"""
+    with open(source_path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    render(source, svg_path, png_path, scale)
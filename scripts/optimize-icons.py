@@ -6,10 +6,12 @@ Optimizes and resizes icons for the extension
 
 import os
 import sys
-from PIL import Image
 import argparse
 
-def optimize_icon(input_path, output_path, size):
+from icon_set import load_icon_sets, parse_icon_name
+from image_cache import ImageCache
+
+def optimize_icon(input_path, output_path, size, image_cache=None):
     """
     Optimize and resize an icon
     
@@ -17,22 +19,20 @@ def optimize_icon(input_path, output_path, size):
         input_path (str): Path to input icon
         output_path (str): Path to output icon
         size (tuple): Target size (width, height)
+        image_cache (ImageCache): Shared decoded/resized image cache
     """
     
     if not os.path.exists(input_path):
         print(f"Error: Input file not found at {input_path}")
         return False
     
+    if image_cache is None:
+        with ImageCache() as image_cache:
+            return optimize_icon(input_path, output_path, size, image_cache)
+    
     try:
-        # Open the image
-        img = Image.open(input_path)
-        
-        # Convert to RGBA if not already
-        if img.mode != 'RGBA':
-            img = img.convert('RGBA')
-        
-        # Resize with high quality
-        img_resized = img.resize(size, Image.Resampling.LANCZOS)
+        # Decode to RGBA and resize with LANCZOS, reusing cached results
+        img_resized = image_cache.resized(input_path, size)
         
         # Save as PNG
         img_resized.save(output_path, 'PNG', optimize=True)
@@ -44,34 +44,33 @@ def optimize_icon(input_path, output_path, size):
         print(f"Error optimizing icon: {e}")
         return False
 
-def create_all_icon_sizes(source_icon, output_dir):
+def create_all_icon_sizes(source_icon, output_dir, project_root='.'):
     """
-    Create all required icon sizes from a source icon
+    Create every plain icon size the target manifests reference from a source icon
     
     Args:
         source_icon (str): Path to source icon
         output_dir (str): Output directory for icons
+        project_root (str): Repository root holding src/ and store/*/manifest.json
     """
     
-    # Required icon sizes for Chrome extension
-    icon_sizes = {
-        'icon-16.png': (16, 16),
-        'icon-32.png': (32, 32),
-        'icon-48.png': (48, 48),
-        'icon-128.png': (128, 128),
-        'icon-256.png': (256, 256),
-        'icon-512.png': (512, 512)
-    }
+    # Plain PNG icons only; square variants and the SVG come from generate-assets.py
+    icon_sizes = {}
+    for name in set().union(*load_icon_sets(project_root).values()):
+        spec = parse_icon_name(name)
+        if spec and not spec[1]:
+            icon_sizes[name] = (spec[0], spec[0])
+    icon_sizes = dict(sorted(icon_sizes.items(), key=lambda item: item[1]))
     
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
     
     success_count = 0
-    
-    for filename, size in icon_sizes.items():
-        output_path = os.path.join(output_dir, filename)
-        if optimize_icon(source_icon, output_path, size):
-            success_count += 1
+    with ImageCache() as image_cache:
+        for filename, size in icon_sizes.items():
+            output_path = os.path.join(output_dir, filename)
+            if optimize_icon(source_icon, output_path, size, image_cache):
+                success_count += 1
     
     print(f"\nSuccessfully created {success_count}/{len(icon_sizes)} icons")
     return success_count == len(icon_sizes)
@@ -103,7 +102,7 @@ def main():
         sys.exit(0 if success else 1)
     else:
         # Create all icon sizes
-        success = create_all_icon_sizes(source_path, output_dir)
+        success = create_all_icon_sizes(source_path, output_dir, project_root)
         sys.exit(0 if success else 1)
 
 if __name__ == '__main__':
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+HeadForge Perceptual Hash
+64-bit difference (dHash) and DCT (pHash) hashes of images, computed on small
+grayscale thumbnails and cached by file content hash
+"""
+
+import json
+import math
+import os
+import warnings
+from pathlib import Path
+
+from file_index import FileHashIndex
+
+HASH_VERSION = 1
+THUMBNAIL_SIZE = 32
+HASH_SIZE = 8
+
+# Formats Pillow decodes without plugins; SVG has no pixels to hash
+HASHABLE_SUFFIXES = {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp', '.ico'}
+
+# cos((2x + 1) u pi / 2N) for the low-frequency DCT terms pHash keeps
+_DCT = [[math.cos((2 * x + 1) * u * math.pi / (2 * THUMBNAIL_SIZE)) for x in range(THUMBNAIL_SIZE)]
+        for u in range(HASH_SIZE)]
+
+
+def thumbnail(image):
+    """
+    Grayscale THUMBNAIL_SIZE square thumbnail of an image
+
+    Transparent pixels are composited onto white first, so icons hash by what
+    they look like rather than by the color hidden under their alpha.
+    """
+    from PIL import Image
+
+    image.draft('L', (THUMBNAIL_SIZE * 2, THUMBNAIL_SIZE * 2))
+    if 'A' in image.getbands() or 'transparency' in image.info:
+        rgba = image.convert('RGBA')
+        image = Image.alpha_composite(Image.new('RGBA', rgba.size, (255, 255, 255, 255)), rgba)
+    return image.convert('L').resize((THUMBNAIL_SIZE, THUMBNAIL_SIZE), Image.Resampling.BOX)
+
+
+def dhash(thumb):
+    """Gradient hash: one bit per horizontal neighbour pair of a 9x8 downsample"""
+    from PIL import Image
+
+    pixels = list(thumb.resize((HASH_SIZE + 1, HASH_SIZE), Image.Resampling.BOX).getdata())
+    value = 0
+    for row in range(HASH_SIZE):
+        cells = pixels[row * (HASH_SIZE + 1):(row + 1) * (HASH_SIZE + 1)]
+        for left, right in zip(cells, cells[1:]):
+            value = (value << 1) | (right > left)
+    return value
+
+
+def phash(thumb):
+    """DCT hash: the 8x8 lowest frequencies, each compared with their median"""
+    pixels = list(thumb.getdata())
+    rows = [pixels[y * THUMBNAIL_SIZE:(y + 1) * THUMBNAIL_SIZE] for y in range(THUMBNAIL_SIZE)]
+
+    # Separable 2-D DCT-II, keeping only the first HASH_SIZE frequencies per axis
+    partial = [[sum(c * p for c, p in zip(basis, row)) for basis in _DCT] for row in rows]
+    coefficients = [sum(basis[y] * partial[y][u] for y in range(THUMBNAIL_SIZE))
+                    for basis in _DCT for u in range(HASH_SIZE)]
+
+    # The DC term (the first, most significant bit) only says how bright the image is
+    median = sorted(coefficients[1:])[(len(coefficients) - 1) // 2]
+    value = 0
+    for coefficient in coefficients[1:]:
+        value = (value << 1) | (coefficient > median)
+    return value
+
+
+def hash_image(path):
+    """
+    Perceptual hashes of one image file
+
+    Returns:
+        dict: {"width", "height", "dhash", "phash"} with the hashes as 16-digit hex
+    """
+    from PIL import Image
+
+    with warnings.catch_warnings():
+        # ICO entries whose PNG payload disagrees with the directory size still hash fine
+        warnings.simplefilter('ignore')
+        with Image.open(path) as image:
+            width, height = image.size
+            thumb = thumbnail(image)
+    return {
+        'width': width,
+        'height': height,
+        'dhash': f'{dhash(thumb):016x}',
+        'phash': f'{phash(thumb):016x}',
+    }
+
+
+def hamming(a, b):
+    """Number of differing bits between two hex hashes"""
+    return bin(int(a, 16) ^ int(b, 16)).count('1')
+
+
+class PerceptualHashIndex:
+    """
+    Perceptual hashes keyed by file content hash.
+
+    A FileHashIndex maps paths to content hashes with a stat cache, so an
+    unchanged file costs one stat, and identical copies (such as the store
+    trees mirroring src/assets) are decoded and hashed once.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+        self.files = FileHashIndex(self.cache_dir / 'index.json')
+        self.hashes = {}
+        self.dirty = False
+        try:
+            with open(self.cache_dir / 'hashes.json', 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == HASH_VERSION:
+                self.hashes = data.get('hashes', {})
+        except (FileNotFoundError, ValueError):
+            pass
+
+    def content_hash(self, path, key=None):
+        return self.files.digest(path, key)
+
+    def lookup(self, sha256):
+        return self.hashes.get(sha256)
+
+    def record(self, sha256, hashes):
+        self.hashes[sha256] = hashes
+        self.dirty = True
+
+    def save(self):
+        self.files.save()
+        if not self.dirty:
+            return
+        path = self.cache_dir / 'hashes.json'
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': HASH_VERSION, 'hashes': self.hashes}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, path)
+        self.dirty = False
+
+
+def near_pairs(hashes, max_distance):
+    """
+    Pairs of keys whose dHashes and pHashes both differ in at most max_distance bits
+
+    The 64 bits are split into max_distance + 1 bands. Two hashes within the
+    distance must agree exactly on at least one band (pigeonhole), so only
+    keys sharing a band value are compared, instead of every pair.
+
+    Args:
+        hashes (dict): Key -> {"phash": hex, ...}
+        max_distance (int): Maximum Hamming distance
+
+    Returns:
+        set: (key, key) pairs, each ordered
+    """
+    bands = min(max_distance + 1, 64)
+    edges = [round(i * 64 / bands) for i in range(bands + 1)]
+    buckets = {}
+    for key, entry in hashes.items():
+        value = int(entry['phash'], 16)
+        for band in range(bands):
+            width = edges[band + 1] - edges[band]
+            bucket = (band, (value >> edges[band]) & ((1 << width) - 1))
+            buckets.setdefault(bucket, []).append(key)
+
+    pairs = set()
+    for keys in buckets.values():
+        for i, a in enumerate(keys):
+            for b in keys[i + 1:]:
+                pair = (a, b) if a < b else (b, a)
+                if pair not in pairs and hamming(hashes[a]['phash'], hashes[b]['phash']) <= max_distance \
+                        and hamming(hashes[a]['dhash'], hashes[b]['dhash']) <= max_distance:
+                    pairs.add(pair)
+    return pairs
+
+
+def clusters(keys, pairs):
+    """Connected components of keys joined by pairs, as sorted lists (singletons dropped)"""
+    parent = {key: key for key in keys}
+
+    def find(key):
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    for a, b in pairs:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    groups = {}
+    for key in keys:
+        groups.setdefault(find(key), []).append(key)
+    return sorted(sorted(group) for group in groups.values() if len(group) > 1)
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+HeadForge Resampler
+Batched image resizing with NumPy: the separable filter weights of each
+(source size, target size, filter) are computed once, and every image of a
+same-sized batch goes through the same two matrix products
+"""
+
+import math
+from functools import lru_cache
+
+
+def _box(x):
+    return 1.0 if -0.5 < x <= 0.5 else 0.0
+
+
+def _bilinear(x):
+    x = abs(x)
+    return 1.0 - x if x < 1.0 else 0.0
+
+
+def _bicubic(x, a=-0.5):
+    x = abs(x)
+    if x < 1.0:
+        return ((a + 2.0) * x - (a + 3.0)) * x * x + 1
+    if x < 2.0:
+        return (((x - 5) * x + 8) * x - 4) * a
+    return 0.0
+
+
+def _sinc(x):
+    if x == 0.0:
+        return 1.0
+    x *= math.pi
+    return math.sin(x) / x
+
+
+def _lanczos(x):
+    return _sinc(x) * _sinc(x / 3) if -3.0 <= x < 3.0 else 0.0
+
+
+# Filter name -> (support, kernel), as defined by Pillow's Resample.c
+FILTERS = {
+    'box': (0.5, _box),
+    'bilinear': (1.0, _bilinear),
+    'bicubic': (2.0, _bicubic),
+    'lanczos': (3.0, _lanczos),
+}
+
+# Modes resampled with premultiplied alpha, as Pillow does
+PREMULTIPLIED = {'RGBA': 'RGBa', 'LA': 'La'}
+BATCH_MODES = {'RGBA', 'RGB', 'LA', 'L'}
+
+
+def numpy_available():
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# Output pixels per block of banded weights: each block multiplies only the
+# window of source pixels its filters reach, instead of the whole row
+BLOCK_SIZE = 16
+
+
+@lru_cache(maxsize=256)
+def filter_weights(in_size, out_size, resample='lanczos'):
+    """
+    Banded resampling weights of one axis
+
+    Each output pixel gets the normalized filter taps Pillow computes for it,
+    so results match Image.resize() up to rounding. The taps are grouped into
+    blocks of BLOCK_SIZE output pixels, each stored as a dense matrix over the
+    source window the block reaches. Cached, so a batch of locale or store
+    variants computes them once.
+
+    Args:
+        in_size (int): Source pixels along the axis
+        out_size (int): Target pixels along the axis
+        resample (str): Key of FILTERS
+
+    Returns:
+        list: (first output, last output, first input, last input, float32
+        matrix of shape (outputs, inputs)) per block
+    """
+    import numpy as np
+
+    support, kernel = FILTERS[resample]
+    scale = in_size / out_size
+    filterscale = max(scale, 1.0)
+    support *= filterscale
+
+    taps = []
+    for out in range(out_size):
+        center = (out + 0.5) * scale
+        first = max(int(center - support + 0.5), 0)
+        last = min(int(center + support + 0.5), in_size)
+        weights = [kernel((x - center + 0.5) / filterscale) for x in range(first, last)]
+        total = sum(weights)
+        taps.append((first, [w / total for w in weights] if total else [0.0] * len(weights)))
+
+    blocks = []
+    for block_start in range(0, out_size, BLOCK_SIZE):
+        block_end = min(block_start + BLOCK_SIZE, out_size)
+        block = taps[block_start:block_end]
+        window_start = min(first for first, _ in block)
+        window_end = max(first + len(weights) for first, weights in block)
+        matrix = np.zeros((block_end - block_start, window_end - window_start), dtype=np.float32)
+        for row, (first, weights) in enumerate(block):
+            matrix[row, first - window_start:first - window_start + len(weights)] = weights
+        matrix.flags.writeable = False
+        blocks.append((block_start, block_end, window_start, window_end, matrix))
+    return blocks
+
+
+def resize_batch(images, size, resample='lanczos'):
+    """
+    Resize images of one size and mode to the same target size
+
+    Without NumPy, or for modes and filters it does not handle, every image
+    goes through Image.resize() instead, so callers never need to check.
+
+    Args:
+        images (list): PIL images sharing size and mode
+        size (tuple): Target (width, height)
+        resample (str): Key of FILTERS
+
+    Returns:
+        list: Resized images, in input order
+    """
+    from PIL import Image
+
+    if not images:
+        return []
+    mode, source_size = images[0].mode, images[0].size
+    if (resample not in FILTERS or mode not in BATCH_MODES or not numpy_available()
+            or any(image.mode != mode or image.size != source_size for image in images)):
+        return [image.resize(size, Image.Resampling[resample.upper()]) for image in images]
+    if tuple(size) == source_size:
+        return [image.copy() for image in images]
+
+    import numpy as np
+
+    (width, height), (out_width, out_height) = source_size, size
+    work_mode = PREMULTIPLIED.get(mode, mode)
+    channels = len(mode)
+    count = len(images)
+
+    # (N, H, C, W) planes, so every source row of the batch is one matrix row;
+    # alpha is premultiplied by Pillow's own conversion
+    planes = np.empty((count, height, channels, width), dtype=np.float32)
+    for index, image in enumerate(images):
+        source = image.convert(work_mode) if work_mode != mode else image
+        planes[index] = np.asarray(source, dtype=np.uint8).reshape(height, width, channels).transpose(0, 2, 1)
+
+    # Horizontal pass first with a clipped 8-bit intermediate, like Pillow: with
+    # LANCZOS ringing both the pass order and the clipping change edge pixels
+    if out_width != width:
+        rows = planes.reshape(count * height * channels, width)
+        resized = np.empty((rows.shape[0], out_width), dtype=np.float32)
+        for out_start, out_end, in_start, in_end, matrix in filter_weights(width, out_width, resample):
+            resized[:, out_start:out_end] = rows[:, in_start:in_end] @ matrix.T
+        np.clip(np.rint(resized, out=resized), 0, 255, out=resized)
+        planes = resized.reshape(count, height, channels, out_width)
+
+    if out_height != height:
+        columns = planes.reshape(count, height, channels * out_width)
+        resized = np.empty((count, out_height, channels * out_width), dtype=np.float32)
+        for out_start, out_end, in_start, in_end, matrix in filter_weights(height, out_height, resample):
+            resized[:, out_start:out_end] = np.matmul(matrix, columns[:, in_start:in_end])
+        planes = resized.reshape(count, out_height, channels, out_width)
+
+    pixels = np.clip(np.rint(planes), 0, 255).astype(np.uint8).transpose(0, 1, 3, 2)
+
+    results = []
+    for plane in pixels:
+        image = Image.frombuffer(work_mode, size, plane.tobytes(), 'raw', work_mode, 0, 1)
+        results.append(image.convert(mode) if work_mode != mode else image)
+    return results
+
+
+def resize_all(images, sizes, resample='lanczos'):
+    """
+    Resize each image to its own target size, batching images that share
+    source size, mode and target size
+
+    Args:
+        images (list): PIL images
+        sizes (list): Target (width, height) per image
+        resample (str): Key of FILTERS
+
+    Returns:
+        list: Resized images, in input order
+    """
+    groups = {}
+    for index, (image, size) in enumerate(zip(images, sizes)):
+        groups.setdefault((image.size, image.mode, tuple(size)), []).append(index)
+
+    results = [None] * len(images)
+    for (_, _, size), indices in groups.items():
+        for index, resized in zip(indices, resize_batch([images[i] for i in indices], size, resample)):
+            results[index] = resized
+    return results
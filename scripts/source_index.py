@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+HeadForge Source Index
+Incremental index of module imports and browser API usage under src/, used to
+generate the architecture, component and data flow diagrams
+"""
+
+import json
+import os
+import posixpath
+import re
+from pathlib import Path
+
+from file_index import FileHashIndex
+
+INDEX_VERSION = 1
+SOURCE_EXTENSIONS = ('.ts', '.js')
+RESOLVE_EXTENSIONS = ('', '.ts', '.js', '/index.ts', '/index.js')
+
+# tsconfig "paths" aliases, most specific first
+PATH_ALIASES = [
+    ('@/components/', 'popup/components/'),
+    ('@/', ''),
+]
+
+STATIC_IMPORT = re.compile(
+    r'^\s*(?:import|export)\s+(type\s+)?(?:[\w*${}\s,]+?\s+from\s+)?[\'"]([^\'"]+)[\'"]',
+    re.MULTILINE
+)
+DYNAMIC_IMPORT = re.compile(r'\bimport\(\s*[\'"]([^\'"]+)[\'"]\s*\)')
+
+# Browser capability -> pattern of the APIs that provide it
+API_PATTERNS = {
+    'storage': re.compile(r'\b(?:chrome|browser)\.storage\b'),
+    'messaging': re.compile(r'\b(?:runtime|tabs)\.(?:sendMessage|onMessage)\b'),
+    'clipboard': re.compile(r'navigator\.clipboard|\b(?:chrome|browser)\.clipboard\b'),
+    'downloads': re.compile(r'URL\.createObjectURL|\b(?:chrome|browser)\.downloads\b'),
+    'tabs': re.compile(r'\b(?:chrome|browser)\.tabs\.(?:create|query)\b'),
+}
+
+
+def parse_source(text):
+    """
+    Extract import specifiers and browser API usage from a TS/JS module
+
+    Args:
+        text (str): Module source
+
+    Returns:
+        dict: {"imports": [{"spec", "dynamic", "type_only"}], "apis": [...]}
+    """
+    # Drop comments so commented-out imports do not count
+    text = re.sub(r'/\*.*?\*/', '', text, flags=re.DOTALL)
+    text = re.sub(r'(^|[^:])//[^\n]*', r'\1', text)
+
+    imports = [{'spec': m.group(2), 'dynamic': False, 'type_only': bool(m.group(1))}
+               for m in STATIC_IMPORT.finditer(text)]
+    imports.extend({'spec': m.group(1), 'dynamic': True, 'type_only': False}
+                   for m in DYNAMIC_IMPORT.finditer(text))
+    apis = sorted(name for name, pattern in API_PATTERNS.items() if pattern.search(text))
+    return {'imports': imports, 'apis': apis}
+
+
+def resolve_import(module, spec, modules):
+    """
+    Resolve an import specifier to a module path relative to src/
+
+    Args:
+        module (str): Importing module, e.g. 'popup/popup.ts'
+        spec (str): Import specifier
+        modules (set): All known module paths
+
+    Returns:
+        str | None: Resolved module path, or None for packages and unknown files
+    """
+    for alias, target in PATH_ALIASES:
+        if spec.startswith(alias):
+            base = target + spec[len(alias):]
+            break
+    else:
+        if not spec.startswith('.'):
+            return None
+        base = posixpath.normpath(posixpath.join(posixpath.dirname(module), spec))
+
+    for ext in RESOLVE_EXTENSIONS:
+        if base + ext in modules:
+            return base + ext
+    return None
+
+
+class SourceIndex:
+    """
+    Import graph of src/, persisted between runs.
+
+    Files are hashed through a stat-cached FileHashIndex and parse results are
+    stored per content hash, so only files whose content changed are re-parsed.
+    """
+
+    def __init__(self, src_dir, cache_dir):
+        self.src_dir = Path(src_dir)
+        self.cache_dir = Path(cache_dir)
+        self.hashes = FileHashIndex(self.cache_dir / 'hashes.json')
+        self.parsed = {}
+        self.modules = {}
+        self.reparsed = 0
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_dir / 'imports.json', 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        if data.get('version') == INDEX_VERSION:
+            self.parsed = data.get('files', {})
+
+    def save(self):
+        self.hashes.save()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / 'imports.json'
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': INDEX_VERSION, 'files': self.parsed}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def update(self):
+        """Scan src/ and re-parse only files whose content hash is new"""
+        live_hashes = set()
+        self.modules = {}
+        for dirpath, _, filenames in os.walk(self.src_dir):
+            for filename in filenames:
+                if not filename.endswith(SOURCE_EXTENSIONS) or filename.endswith('.d.ts'):
+                    continue
+                path = Path(dirpath) / filename
+                rel = path.relative_to(self.src_dir).as_posix()
+                sha256 = self.hashes.digest(path, rel)
+                if sha256 not in self.parsed:
+                    self.parsed[sha256] = parse_source(path.read_text(encoding='utf-8'))
+                    self.reparsed += 1
+                live_hashes.add(sha256)
+                self.modules[rel] = self.parsed[sha256]
+
+        for key in set(self.hashes.keys()) - set(self.modules):
+            self.hashes.forget(key)
+        self.parsed = {sha256: info for sha256, info in self.parsed.items() if sha256 in live_hashes}
+        return self
+
+    def edges(self, include_types=True):
+        """
+        Resolved import edges between modules
+
+        Args:
+            include_types (bool): Keep `import type` edges
+
+        Returns:
+            list: Sorted (importer, imported, dynamic) tuples
+        """
+        known = set(self.modules)
+        result = set()
+        for module, info in self.modules.items():
+            for entry in info['imports']:
+                if entry['type_only'] and not include_types:
+                    continue
+                target = resolve_import(module, entry['spec'], known)
+                if target and target != module:
+                    result.add((module, target, entry['dynamic']))
+
+        # A static import wins over a dynamic one for the same pair
+        static_pairs = {(a, b) for a, b, dynamic in result if not dynamic}
+        return sorted(edge for edge in result if not (edge[2] and edge[:2] in static_pairs))
+
+    def apis(self, module):
+        return self.modules[module]['apis']
+
+
+def build_index(src_dir='src', cache_dir=Path('.cache') / 'source-index'):
+    """Load, update and persist the source index"""
+    index = SourceIndex(src_dir, cache_dir).update()
+    index.save()
+    return index
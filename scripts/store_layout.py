@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+HeadForge Store Layout
+Files each store tree ships on purpose, whether or not a page references
+them: the directories sync-store-assets.py mirrors, the fonts subset-fonts.py
+writes, the listing images the stores require and the icons read outside the
+manifests
+"""
+
+from icon_set import EXTRA_ICONS
+
+ICONS_SOURCE = 'src/assets/icons'
+
+# (source directory, destination directory inside each store tree).
+# assets/fonts is not mirrored: subset-fonts.py writes each store's fonts.
+SYNC_MAPPINGS = [
+    (ICONS_SOURCE, 'icons'),
+    (ICONS_SOURCE, 'assets/icons'),
+    ('src/assets/images', 'assets/images'),
+]
+
+# Destination of each store's subset fonts, written by subset-fonts.py
+FONTS_DEST = 'assets/fonts'
+
+# Listing images generate-assets.py renders into each store tree, with the
+# size the store requires
+LISTING_IMAGES = {
+    'chrome': {'banner-chrome.png': (1280, 800)},
+    'edge': {'banner-edge.png': (1280, 720)},
+    'firefox': {'banner-firefox.png': (1260, 600)},
+}
+
+
+def shipped_patterns(target=None):
+    """
+    Tree-relative glob patterns of files a store tree ships without any page
+    referencing them
+
+    Args:
+        target (str): Store name, or None for the listing images of every store
+
+    Returns:
+        list: fnmatch patterns, e.g. "icons/*" or "*.ico"
+    """
+    patterns = [f'{dest_dir}/*' for _, dest_dir in SYNC_MAPPINGS] + [f'{FONTS_DEST}/*']
+    targets = [target] if target else list(LISTING_IMAGES)
+    patterns.extend(name for store in targets for name in LISTING_IMAGES.get(store, {}))
+    patterns.append('*.ico')
+    for name in sorted(EXTRA_ICONS):
+        patterns.extend([name, f'*/{name}'])
+    return patterns
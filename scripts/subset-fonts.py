@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+HeadForge Font Subsetter
+Subsets the bundled fonts of each store tree down to the characters and
+weights its popup, options and content pages actually use
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import time
+from functools import lru_cache
+from pathlib import Path
+
+from file_index import FileHashIndex
+from store_layout import FONTS_DEST
+
+STORE_TARGETS = ['chrome', 'edge', 'firefox']
+FONTS_DIR = 'src/assets/fonts'
+STRINGS_PATH = 'config/store-strings.json'
+CACHE_DIR = Path('.cache') / 'fonts'
+SUBSET_VERSION = 1
+
+FONT_FLAVORS = {'.woff2': 'woff2', '.woff': 'woff', '.ttf': None, '.otf': None}
+TEXT_SUFFIXES = {'.html', '.css', '.js'}
+
+# Inputs show whatever the user types, so printable ASCII is always kept
+BASELINE = set(range(0x20, 0x7f))
+
+# HTML attributes whose values are rendered as text
+TEXT_ATTRIBUTES = {'alt', 'title', 'placeholder', 'value', 'label', 'aria-label'}
+
+JS_STRING = re.compile(r'''(["'`])((?:\\.|(?!\1)[^\\])*)\1''', re.S)
+JS_ESCAPE = re.compile(r'\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|.)', re.S)
+CSS_CONTENT = re.compile(r'''content\s*:\s*(["'])((?:\\.|(?!\1)[^\\])*)\1''', re.S)
+CSS_ESCAPE = re.compile(r'\\([0-9a-fA-F]{1,6}\s?|.)', re.S)
+CSS_FONT_WEIGHT = re.compile(r'font-weight\s*:\s*([a-z0-9]+)', re.I)
+CSS_WEIGHT_KEYWORDS = {'normal': 400, 'bold': 700}
+
+
+@lru_cache(maxsize=1)
+def _text_collector():
+    # html.parser is only imported once there is HTML to scan
+    from html.parser import HTMLParser
+
+    class TextCollector(HTMLParser):
+        def __init__(self):
+            super().__init__(convert_charrefs=True)
+            self.parts = []
+            self._skip = 0
+
+        def handle_starttag(self, tag, attrs):
+            if tag in ('script', 'style'):
+                self._skip += 1
+            self.parts.extend(value for name, value in attrs if name in TEXT_ATTRIBUTES and value)
+
+        def handle_endtag(self, tag):
+            if tag in ('script', 'style') and self._skip:
+                self._skip -= 1
+
+        def handle_data(self, data):
+            if not self._skip:
+                self.parts.append(data)
+
+    return TextCollector
+
+
+def html_text(source):
+    """Rendered text and text-bearing attribute values of an HTML document"""
+    collector = _text_collector()()
+    collector.feed(source)
+    collector.close()
+    return ''.join(collector.parts)
+
+
+def _unescape_js(match):
+    escape = match.group(1)
+    if escape.startswith('u{'):
+        return chr(int(escape[2:-1], 16))
+    if escape[0] in 'ux' and len(escape) > 1:
+        return chr(int(escape[1:], 16))
+    return {'n': '\n', 't': '\t', 'r': '\r'}.get(escape, escape)
+
+
+def js_text(source):
+    """Contents of the string and template literals of a script"""
+    return ''.join(JS_ESCAPE.sub(_unescape_js, match.group(2)) for match in JS_STRING.finditer(source))
+
+
+def _unescape_css(match):
+    escape = match.group(1).strip()
+    if re.fullmatch(r'[0-9a-fA-F]{1,6}', escape):
+        return chr(int(escape, 16))
+    return escape
+
+
+def css_text(source):
+    """Generated content strings of a stylesheet"""
+    return ''.join(CSS_ESCAPE.sub(_unescape_css, match.group(2)) for match in CSS_CONTENT.finditer(source))
+
+
+def css_weights(source):
+    """Numeric font weights declared in a stylesheet"""
+    weights = set()
+    for value in CSS_FONT_WEIGHT.findall(source):
+        value = value.lower()
+        if value.isdigit():
+            weights.add(int(value))
+        elif value in CSS_WEIGHT_KEYWORDS:
+            weights.add(CSS_WEIGHT_KEYWORDS[value])
+    return weights
+
+
+def strings_text(strings_path):
+    """Every string of every locale in the store string table"""
+    try:
+        with open(strings_path, 'r', encoding='utf-8') as f:
+            table = json.load(f)
+    except FileNotFoundError:
+        return ''
+
+    parts = []
+    stack = [table.get('locales', {})]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, str):
+            parts.append(value)
+    return ''.join(parts)
+
+
+def scan_target(target_dir, extra_text=''):
+    """
+    Collect the characters and font weights a store tree uses
+
+    Args:
+        target_dir (Path): Store tree, e.g. store/chrome
+        extra_text (str): Text shown in every target (locale strings)
+
+    Returns:
+        tuple: (set of code points, set of numeric weights)
+    """
+    text = [extra_text]
+    weights = set()
+    for path in sorted(target_dir.rglob('*')):
+        if path.suffix not in TEXT_SUFFIXES or 'assets' in path.relative_to(target_dir).parts:
+            continue
+        source = path.read_text(encoding='utf-8', errors='replace')
+        if path.suffix == '.html':
+            text.append(html_text(source))
+        elif path.suffix == '.js':
+            text.append(js_text(source))
+        else:
+            text.append(css_text(source))
+            weights |= css_weights(source)
+
+    codepoints = {ord(char) for char in ''.join(text) if char.isprintable() or char == '\u00a0'}
+    return codepoints | BASELINE, weights
+
+
+def glyph_set_hash(codepoints, weights):
+    spec = json.dumps([SUBSET_VERSION, sorted(codepoints), sorted(weights)])
+    return hashlib.sha256(spec.encode('utf-8')).hexdigest()
+
+
+def subset_font(font_path, codepoints, weights):
+    """
+    Subset one font to the given characters and weight range
+
+    Args:
+        font_path (Path): Full font (woff2, woff, ttf or otf)
+        codepoints (set): Unicode code points to keep
+        weights (set): CSS weights in use; a variable font's wght axis is
+            pinned to their range
+
+    Returns:
+        tuple: (subset font bytes, glyph count)
+    """
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+
+    font = TTFont(str(font_path))
+    if 'fvar' in font and weights:
+        axis = next((axis for axis in font['fvar'].axes if axis.axisTag == 'wght'), None)
+        if axis is not None:
+            from fontTools.varLib import instancer
+
+            low = max(axis.minValue, min(weights))
+            high = min(axis.maxValue, max(weights))
+            font = instancer.instantiateVariableFont(font, {'wght': low if low == high else (low, high)})
+
+    options = subset.Options()
+    options.flavor = FONT_FLAVORS[font_path.suffix]
+    options.notdef_outline = True
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+
+    buffer = io.BytesIO()
+    font.flavor = options.flavor
+    font.save(buffer)
+    return buffer.getvalue(), font['maxp'].numGlyphs
+
+
+def cached_subset(font_path, font_hash, codepoints, weights, cache_dir):
+    """
+    Subset bytes for (font hash, glyph set hash), computed once
+
+    Returns:
+        tuple: (subset bytes, glyph count or None when served from the cache)
+    """
+    cache_path = cache_dir / f'{font_hash[:16]}-{glyph_set_hash(codepoints, weights)[:16]}{font_path.suffix}'
+    if cache_path.exists():
+        return cache_path.read_bytes(), None
+
+    data, glyphs = subset_font(font_path, codepoints, weights)
+    write_atomic(cache_path, data)
+    return data, glyphs
+
+
+def write_atomic(path, data):
+    # A new inode, so hardlinks made by sync-store-assets.py never write through to src/
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Subset HeadForge fonts to the characters each store tree uses')
+    parser.add_argument('--targets', nargs='+', default=STORE_TARGETS, choices=STORE_TARGETS,
+                       help='Store trees to process (default: all)')
+    parser.add_argument('--fonts', default=FONTS_DIR,
+                       help=f'Directory of the full source fonts (default: {FONTS_DIR})')
+    parser.add_argument('--strings', default=STRINGS_PATH,
+                       help=f'Locale string table whose characters every target keeps (default: {STRINGS_PATH})')
+    parser.add_argument('--dry-run', action='store_true',
+                       help='Report the characters and weights in use without subsetting')
+
+    args = parser.parse_args()
+
+    # Get the directory of this script
+    script_dir = Path(__file__).resolve().parent
+    project_root = script_dir.parent
+
+    print("🔤 Subsetting fonts...")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    fonts_dir = project_root / args.fonts
+    fonts = sorted(path for path in fonts_dir.glob('*') if path.suffix in FONT_FLAVORS) if fonts_dir.is_dir() else []
+    extra_text = strings_text(project_root / args.strings)
+    index = FileHashIndex(project_root / CACHE_DIR / 'index.json')
+
+    for font_path in fonts:
+        if font_path.stat().st_size == 0:
+            print(f"⏭️  {font_path.relative_to(project_root)} is empty, copied without subsetting")
+
+    for target in args.targets:
+        target_dir = project_root / 'store' / target
+        if not target_dir.is_dir():
+            print(f"⏭️  {target}: store/{target} not found")
+            continue
+
+        codepoints, weights = scan_target(target_dir, extra_text)
+        weight_range = f"weights {min(weights)}-{max(weights)}" if weights else "no weights declared"
+        print(f"🔍 {target}: {len(codepoints)} characters, {weight_range}")
+        if args.dry_run:
+            non_ascii = ''.join(sorted(chr(c) for c in codepoints - BASELINE))
+            print(f"   Beyond ASCII: {non_ascii}")
+
+        for font_path in fonts if not args.dry_run else []:
+            try:
+                if font_path.stat().st_size == 0:
+                    data, glyphs = b'', 0
+                else:
+                    data, glyphs = cached_subset(font_path, index.digest(font_path), codepoints, weights,
+                                                 project_root / CACHE_DIR)
+            except ImportError:
+                print("❌ Font subsetting needs fontTools and brotli: pip install fonttools brotli")
+                return False
+            except Exception as e:
+                print(f"❌ Could not subset {font_path.name}: {e}")
+                return False
+
+            output_path = target_dir / FONTS_DEST / font_path.name
+            if output_path.exists() and output_path.read_bytes() == data:
+                print(f"⏭️  Up to date {output_path.relative_to(project_root)}")
+                continue
+            write_atomic(output_path, data)
+            detail = f", {glyphs} glyphs" if glyphs is not None else " (cached)"
+            print(f"✅ {output_path.relative_to(project_root)}: {font_path.stat().st_size / 1024:.0f} KB → "
+                  f"{len(data) / 1024:.0f} KB{detail}")
+
+    index.save()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"\n✅ Fonts processed in {elapsed_ms:.0f} ms")
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
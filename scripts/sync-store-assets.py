@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+HeadForge Store Asset Sync
+Incrementally mirrors src/assets into the store/chrome, store/edge and
+store/firefox trees using a content-hash index
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+from file_index import FileHashIndex
+from icon_set import ICON_FILE, SVG_ICON, load_icon_sets
+from store_layout import ICONS_SOURCE, SYNC_MAPPINGS
+
+STORE_TARGETS = ['chrome', 'edge', 'firefox']
+
+SYNC_MODES = ['copy', 'hardlink', 'reflink', 'auto']
+
+# Linux FICLONE ioctl (btrfs, xfs, bcachefs...)
+FICLONE = 0x40049409
+
+INDEX_PATH = Path('.cache') / 'store-sync' / 'index.json'
+
+
+def list_files(root):
+    """
+    Recursively list regular files under root
+
+    Args:
+        root (Path): Directory to walk
+
+    Returns:
+        dict: Relative POSIX path -> absolute path
+    """
+    files = {}
+    if not root.is_dir():
+        return files
+
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.is_file(follow_symlinks=False):
+                    rel = Path(entry.path).relative_to(root).as_posix()
+                    files[rel] = Path(entry.path)
+    return files
+
+
+def reflink_file(src, dst):
+    """Clone src into dst with copy-on-write; raises OSError if unsupported"""
+    import fcntl
+
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+    shutil.copystat(src, dst)
+
+
+def place_file(src, dst, mode):
+    """
+    Materialize src at dst using the requested mode
+
+    Args:
+        src (Path): Source file
+        dst (Path): Destination path (must not exist)
+        mode (str): One of SYNC_MODES
+
+    Returns:
+        str: The method actually used ('copied', 'linked' or 'reflinked')
+    """
+    if mode == 'hardlink':
+        try:
+            os.link(src, dst)
+            return 'linked'
+        except OSError:
+            pass
+    elif mode in ('reflink', 'auto'):
+        try:
+            reflink_file(src, dst)
+            return 'reflinked'
+        except (OSError, ImportError):
+            # Leave no partial clone behind before falling back
+            if dst.exists():
+                dst.unlink()
+
+    shutil.copy2(src, dst)
+    return 'copied'
+
+
+def is_icon(name):
+    return bool(ICON_FILE.fullmatch(name)) or name == SVG_ICON
+
+
+def sync_target(project_root, target, index, mode, dry_run=False, verbose=False, icon_set=None):
+    """
+    Bring one store tree in line with src/assets
+
+    Icon files (icon-<size>.png, icon.svg) outside icon_set are neither
+    copied nor kept, so each store ships only the icons its manifest needs.
+
+    Args:
+        project_root (Path): Repository root
+        target (str): Store name (chrome, edge, firefox)
+        index (FileHashIndex): Shared content-hash index
+        mode (str): Transfer mode
+        dry_run (bool): Report actions without touching the tree
+        verbose (bool): Print every action
+        icon_set (set): Icon file names the target needs, or None for all
+
+    Returns:
+        dict: Action name -> number of files
+    """
+    stats = {'copied': 0, 'linked': 0, 'reflinked': 0, 'unchanged': 0, 'deleted': 0}
+    store_root = project_root / 'store' / target
+
+    for source_dir, dest_dir in SYNC_MAPPINGS:
+        source_root = project_root / source_dir
+        dest_root = store_root / dest_dir
+        if not source_root.is_dir():
+            continue
+
+        source_files = list_files(source_root)
+        if source_dir == ICONS_SOURCE and icon_set is not None:
+            source_files = {rel: src for rel, src in source_files.items()
+                            if not is_icon(src.name) or src.name in icon_set}
+        dest_files = list_files(dest_root)
+
+        for rel, src in sorted(source_files.items()):
+            src_key = f'{source_dir}/{rel}'
+            dst = dest_root / rel
+            dst_key = f'store/{target}/{dest_dir}/{rel}'
+            src_hash = index.digest(src, src_key)
+
+            if rel in dest_files:
+                dst_stat = os.stat(dst)
+                dst_hash = index.lookup(dst_key, dst_stat)
+                if dst_hash is None and dst_stat.st_size == os.stat(src).st_size:
+                    dst_hash = index.digest(dst, dst_key)
+                if dst_hash == src_hash:
+                    stats['unchanged'] += 1
+                    continue
+
+            if dry_run:
+                action = 'copied'
+            else:
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                # Unlink first so a hardlinked destination never writes through
+                if dst.exists():
+                    dst.unlink()
+                action = place_file(src, dst, mode)
+                index.record(dst_key, os.stat(dst), src_hash)
+
+            stats[action] += 1
+            if verbose:
+                print(f"  {action:<9} {dst_key}")
+
+        for rel in sorted(set(dest_files) - set(source_files)):
+            dst_key = f'store/{target}/{dest_dir}/{rel}'
+            if not dry_run:
+                dest_files[rel].unlink()
+                index.forget(dst_key)
+            stats['deleted'] += 1
+            if verbose:
+                print(f"  {'deleted':<9} {dst_key}")
+
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sync generated assets into the store trees')
+    parser.add_argument('--targets', nargs='+', choices=STORE_TARGETS, default=STORE_TARGETS,
+                       help='Store trees to sync (default: all)')
+    parser.add_argument('--mode', choices=SYNC_MODES, default='copy',
+                       help='How to materialize changed files (default: copy)')
+    parser.add_argument('--dry-run', action='store_true',
+                       help='Report what would change without touching any file')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                       help='Print every copied, linked or deleted file')
+
+    args = parser.parse_args()
+
+    # Get the directory of this script
+    script_dir = Path(__file__).resolve().parent
+    project_root = script_dir.parent
+
+    start = time.perf_counter()
+    index = FileHashIndex(project_root / INDEX_PATH)
+    icon_sets = load_icon_sets(project_root)
+
+    total_changes = 0
+    for target in args.targets:
+        stats = sync_target(project_root, target, index, args.mode,
+                            dry_run=args.dry_run, verbose=args.verbose, icon_set=icon_sets.get(target))
+        changes = stats['copied'] + stats['linked'] + stats['reflinked'] + stats['deleted']
+        total_changes += changes
+        summary = ', '.join(f"{count} {action}" for action, count in stats.items() if count)
+        print(f"{'🔄' if changes else '✅'} {target}: {summary or 'nothing to sync'}")
+
+    if not args.dry_run:
+        index.save()
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    prefix = 'Would change' if args.dry_run else 'Changed'
+    print(f"\n{prefix} {total_changes} file(s) in {elapsed_ms:.1f} ms")
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+HeadForge Text Layout
+Font loading plus per-process caches of text measurements, rasterized glyph
+coverage and shadowed text sprites, keyed by (string, size, font, style), so
+repeated strings across banners, screenshots and locales are drawn only once
+"""
+
+import math
+import os
+from collections import namedtuple
+from functools import lru_cache
+
+DEFAULT_FONT = 'arial.ttf'
+
+# Tried in order when a font is missing; Pillow's built-in font covers ASCII only,
+# so localized strings need one of these on machines without Arial
+FALLBACK_FONTS = ['Arial.ttf', 'DejaVuSans.ttf', 'LiberationSans-Regular.ttf', 'NotoSans-Regular.ttf']
+
+# Font file that replaces every font name when set, so builds on different
+# machines render identical text (visual-regression.py records it)
+FONT_ENV = 'HEADFORGE_FONT'
+
+# Offset in pixels, color, and Gaussian blur radius (0 for a hard shadow)
+Shadow = namedtuple('Shadow', ['dx', 'dy', 'color', 'blur'], defaults=[0])
+
+
+@lru_cache(maxsize=None)
+def load_font(size, name=DEFAULT_FONT):
+    """
+    Load a TrueType font at a pixel size, falling back to common system fonts
+    and then Pillow's default font. A font pinned through HEADFORGE_FONT is
+    used for every name and never falls back.
+
+    Args:
+        size (int): Font size in pixels
+        name (str): Font file name
+
+    Returns:
+        ImageFont: Font object, shared between calls with the same arguments
+    """
+    from PIL import ImageFont
+
+    pinned = os.environ.get(FONT_ENV)
+    if pinned:
+        return ImageFont.truetype(pinned, size)
+
+    for candidate in [name] + FALLBACK_FONTS:
+        try:
+            return ImageFont.truetype(candidate, size)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:
+        # Pillow < 10.1 only has the fixed-size bitmap font
+        return ImageFont.load_default()
+
+
+def font_file(name=DEFAULT_FONT):
+    """Path of the font file load_font() renders name with, or None for Pillow's default font"""
+    return getattr(load_font(12, name), 'path', None)
+
+
+@lru_cache(maxsize=1)
+def _scratch_draw():
+    from PIL import Image, ImageDraw
+
+    return ImageDraw.Draw(Image.new('L', (1, 1)))
+
+
+@lru_cache(maxsize=4096)
+def measure_text(text, size, font=DEFAULT_FONT):
+    """
+    Bounding box of text drawn at the origin
+
+    Args:
+        text (str): Text, may contain newlines
+        size (int): Font size in pixels
+        font (str): Font file name
+
+    Returns:
+        tuple: (x0, y0, x1, y1) as returned by ImageDraw.textbbox
+    """
+    return tuple(_scratch_draw().textbbox((0, 0), text, font=load_font(size, font)))
+
+
+def text_width(text, size, font=DEFAULT_FONT):
+    x0, _, x1, _ = measure_text(text, size, font)
+    return x1 - x0
+
+
+@lru_cache(maxsize=1024)
+def text_mask(text, size, font=DEFAULT_FONT):
+    """
+    Rasterize text coverage once
+
+    Args:
+        text (str): Text, may contain newlines
+        size (int): Font size in pixels
+        font (str): Font file name
+
+    Returns:
+        tuple: ("L" mask image, (x0, y0) offset of the mask from the text origin)
+    """
+    from PIL import Image, ImageDraw
+
+    x0, y0, x1, y1 = measure_text(text, size, font)
+    mask = Image.new('L', (max(1, x1 - x0), max(1, y1 - y0)))
+    ImageDraw.Draw(mask).text((-x0, -y0), text, fill=255, font=load_font(size, font))
+    return mask, (x0, y0)
+
+
+@lru_cache(maxsize=1024)
+def text_sprite(text, size, fill, font=DEFAULT_FONT, shadow=None):
+    """
+    Render text, and optionally its shadow, once into an RGBA sprite
+
+    Args:
+        text (str): Text, may contain newlines
+        size (int): Font size in pixels
+        fill: Text color accepted by ImageColor.getrgb
+        font (str): Font file name
+        shadow (Shadow): Shadow spec baked into the sprite, or None
+
+    Returns:
+        tuple: (RGBA sprite, (x0, y0) offset of the sprite from the text origin)
+    """
+    from PIL import Image, ImageColor, ImageFilter
+
+    mask, (x0, y0) = text_mask(text, size, font)
+    if shadow is None:
+        sprite = Image.new('RGBA', mask.size, ImageColor.getrgb(fill))
+        sprite.putalpha(mask)
+        return sprite, (x0, y0)
+
+    # Room for the offset on either side plus the blur falloff
+    pad = math.ceil(shadow.blur * 3)
+    left, top = pad + max(-shadow.dx, 0), pad + max(-shadow.dy, 0)
+    size_xy = (mask.width + abs(shadow.dx) + 2 * pad, mask.height + abs(shadow.dy) + 2 * pad)
+
+    shadow_alpha = Image.new('L', size_xy)
+    shadow_alpha.paste(mask, (left + shadow.dx, top + shadow.dy))
+    if shadow.blur:
+        shadow_alpha = shadow_alpha.filter(ImageFilter.GaussianBlur(shadow.blur))
+    shadow_rgba = ImageColor.getrgb(shadow.color)
+    if len(shadow_rgba) == 4:
+        shadow_alpha = shadow_alpha.point(lambda value: value * shadow_rgba[3] // 255)
+
+    sprite = Image.new('RGBA', size_xy, shadow_rgba[:3])
+    sprite.putalpha(shadow_alpha)
+    text_layer = Image.new('RGBA', size_xy, ImageColor.getrgb(fill)[:3])
+    text_alpha = Image.new('L', size_xy)
+    text_alpha.paste(mask, (left, top))
+    text_layer.putalpha(text_alpha)
+    return Image.alpha_composite(sprite, text_layer), (x0 - left, y0 - top)
+
+
+def scale_shadow(shadow, scale):
+    """Scale a shadow spec along with the text it belongs to"""
+    if shadow is None:
+        return None
+    return Shadow(round(shadow.dx * scale), round(shadow.dy * scale), shadow.color, shadow.blur * scale)
+
+
+def draw_text(img, xy, text, fill, size, font=DEFAULT_FONT, shadow=None):
+    """
+    Paste the cached sprite of a string onto an image
+
+    Args:
+        img (Image): Canvas
+        xy (tuple): Text origin, as for ImageDraw.text
+        text (str): Text, may contain newlines
+        fill: Text color
+        size (int): Font size in pixels
+        font (str): Font file name
+        shadow (Shadow): Optional shadow drawn under the text
+    """
+    sprite, (dx, dy) = text_sprite(text, size, fill, font, shadow)
+    img.paste(sprite, (round(xy[0]) + dx, round(xy[1]) + dy), sprite)
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+HeadForge Store Asset Validator
+Checks the icons and listing images of each store tree against that store's
+size, format and color mode rules, reading only image headers
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+from icon_set import manifest_icons
+from image_headers import read_image_header
+from store_layout import LISTING_IMAGES
+
+STORE_TARGETS = ['chrome', 'edge', 'firefox']
+HEADER_SUFFIXES = {'.png', '.ico', '.svg'}
+
+# PNG color modes that can carry transparency (palette images through tRNS)
+ALPHA_MODES = {'RGBA', 'LA', 'P'}
+
+# Below this many files a thread pool costs more to start than the reads take
+PARALLEL_THRESHOLD = 256
+
+# icon-<size>.png and icon-<size>-square.png are exactly size x size
+ICON_NAME = re.compile(r'icon-(\d+)(?:-square)?\.png$')
+
+STORE_RULES = {
+    'chrome': {
+        # Chrome does not load SVG manifest icons
+        'icon_formats': {'PNG'},
+        'icon_sizes': [16, 32, 48, 128],
+        'recommended_icon_sizes': [],
+        # Screenshots and promo images must be 24-bit PNG without alpha
+        'listing_images': LISTING_IMAGES['chrome'],
+        'listing_opaque': True,
+    },
+    'edge': {
+        'icon_formats': {'PNG'},
+        'icon_sizes': [16, 32, 48, 128],
+        'recommended_icon_sizes': [],
+        'listing_images': LISTING_IMAGES['edge'],
+        'listing_opaque': False,
+    },
+    'firefox': {
+        # about:addons shows the 48 px icon, and 96 px on high-DPI screens
+        'icon_formats': {'PNG', 'SVG'},
+        'icon_sizes': [48],
+        'recommended_icon_sizes': [96],
+        'listing_images': LISTING_IMAGES['firefox'],
+        'listing_opaque': False,
+    },
+}
+
+
+def read_header(path):
+    """Header and file size of an image, or (None, None) if it cannot be read"""
+    try:
+        return read_image_header(path), os.path.getsize(path)
+    except OSError:
+        return None, None
+
+
+def read_headers(paths):
+    """
+    Read the headers of many images on a thread pool
+
+    Each read is one small file read, so threads overlap the I/O of a cold
+    cache or a network drive. From the page cache, the three store trees read
+    in about 2 ms sequentially, so small sets skip the pool.
+
+    Args:
+        paths (list): Image paths
+
+    Returns:
+        dict: Path -> (header or None, file size or None)
+    """
+    if len(paths) < PARALLEL_THRESHOLD:
+        return {path: read_header(path) for path in paths}
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor() as executor:
+        return dict(zip(paths, executor.map(read_header, paths)))
+
+
+def describe(header):
+    if header['format'] == 'PNG':
+        return f"{header['width']}x{header['height']} {header['mode']}"
+    return f"{header['width']}x{header['height']} {header['format']}"
+
+
+def check_file(rel, header, file_size, rules):
+    """
+    Check one image of a store tree against its naming and format rules
+
+    Args:
+        rel (str): Tree-relative POSIX path
+        header (dict | None): Output of read_image_header()
+        file_size (int): File size in bytes
+        rules (dict): STORE_RULES entry of the tree
+
+    Returns:
+        tuple: (errors, warnings) as lists of messages
+    """
+    errors, warnings = [], []
+    if header is None:
+        return [f"{rel}: not a valid {Path(rel).suffix[1:].upper()} header"], warnings
+
+    if header['format'] == 'ICO':
+        entries = header['entries']
+        if not entries:
+            errors.append(f"{rel}: ICO has no images")
+        for entry in entries:
+            if entry['width'] != entry['height']:
+                errors.append(f"{rel}: ICO entry {entry['width']}x{entry['height']} is not square")
+            if entry['offset'] + entry['size'] > file_size:
+                errors.append(f"{rel}: ICO entry {entry['width']}x{entry['height']} extends past the end of the file")
+    elif header['format'] == 'SVG':
+        if header['width'] is None or header['height'] is None:
+            errors.append(f"{rel}: SVG root has neither width/height nor a viewBox")
+
+    match = ICON_NAME.search(rel)
+    if match and header['format'] == 'PNG':
+        size = int(match.group(1))
+        if (header['width'], header['height']) != (size, size):
+            errors.append(f"{rel}: {header['width']}x{header['height']}, expected {size}x{size} from its name")
+
+    expected = rules['listing_images'].get(rel)
+    if expected:
+        if header['format'] != 'PNG':
+            errors.append(f"{rel}: listing image must be a PNG")
+        elif (header['width'], header['height']) != expected:
+            errors.append(f"{rel}: {describe(header)}, the store expects {expected[0]}x{expected[1]}")
+        elif rules['listing_opaque'] and header['mode'] in ALPHA_MODES:
+            errors.append(f"{rel}: {describe(header)}, the store rejects listing images with alpha")
+    return errors, warnings
+
+
+def check_manifest(manifest, headers, root, rules):
+    """
+    Check the icons a store manifest references
+
+    Args:
+        manifest (dict): Parsed manifest.json
+        headers (dict): Output of read_headers()
+        root (Path): Store tree
+        rules (dict): STORE_RULES entry of the tree
+
+    Returns:
+        tuple: (errors, warnings, number of references)
+    """
+    errors, warnings = [], []
+    declared = {str(size) for size in (manifest.get('icons') or {})}
+    for size in rules['icon_sizes']:
+        if str(size) not in declared:
+            errors.append(f"manifest.json: icons has no {size}x{size} entry")
+    for size in rules['recommended_icon_sizes']:
+        if str(size) not in declared:
+            warnings.append(f"manifest.json: icons has no {size}x{size} entry (recommended)")
+
+    references = manifest_icons(manifest)
+    for field, size, rel in references:
+        header, _ = headers.get(root / rel, (None, None))
+        if not (root / rel).is_file():
+            errors.append(f"manifest.json {field}: {rel} does not exist")
+            continue
+        if header is None:
+            errors.append(f"manifest.json {field}: {rel} is not a readable image")
+            continue
+        if header['format'] not in rules['icon_formats']:
+            errors.append(f"manifest.json {field}: {rel} is {header['format']}, "
+                          f"the store only loads {', '.join(sorted(rules['icon_formats']))} icons")
+            continue
+
+        if header['format'] == 'SVG':
+            if header['width'] and header['height'] and header['width'] != header['height']:
+                warnings.append(f"manifest.json {field}: {rel} is {describe(header)}, not square")
+            continue
+        if size is not None and (header['width'], header['height']) != (size, size):
+            errors.append(f"manifest.json {field}: {rel} is {describe(header)}, declared as {size}x{size}")
+        elif header['width'] != header['height']:
+            errors.append(f"manifest.json {field}: {rel} is {describe(header)}, not square")
+        if header['mode'] not in ALPHA_MODES:
+            warnings.append(f"manifest.json {field}: {rel} is {header['mode']} without transparency")
+    return errors, warnings, len(references)
+
+
+def image_files(root):
+    """Every image under a store tree whose header can be checked"""
+    paths = []
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if os.path.splitext(filename)[1].lower() in HEADER_SUFFIXES:
+                paths.append(Path(dirpath) / filename)
+    return sorted(paths)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate HeadForge store images against store requirements')
+    parser.add_argument('--targets', nargs='+', default=STORE_TARGETS, choices=STORE_TARGETS,
+                       help='Store trees to validate (default: all)')
+    parser.add_argument('--strict', action='store_true',
+                       help='Fail on warnings as well as errors')
+    parser.add_argument('--json', metavar='PATH',
+                       help='Write the errors and warnings of every tree to a JSON report')
+
+    args = parser.parse_args()
+
+    # Get the directory of this script
+    script_dir = Path(__file__).resolve().parent
+    project_root = script_dir.parent
+
+    print("🔍 Validating store assets...")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    trees = {}
+    for target in args.targets:
+        root = project_root / 'store' / target
+        if not (root / 'manifest.json').is_file():
+            print(f"❌ {target}: store/{target}/manifest.json not found")
+            return False
+        try:
+            with open(root / 'manifest.json', 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except ValueError as e:
+            print(f"❌ {target}: invalid manifest.json: {e}")
+            return False
+        trees[target] = (root, manifest, image_files(root))
+
+    # One pool for every tree: the reads are independent and each is tiny
+    headers = read_headers([path for _, _, paths in trees.values() for path in paths])
+
+    failed = False
+    report = {}
+    total_images = 0
+    for target, (root, manifest, paths) in trees.items():
+        rules = STORE_RULES[target]
+        errors, warnings, references = check_manifest(manifest, headers, root, rules)
+        for path in paths:
+            file_errors, file_warnings = check_file(path.relative_to(root).as_posix(), *headers[path], rules)
+            errors += file_errors
+            warnings += file_warnings
+
+        total_images += len(paths)
+        ok = not errors and not (args.strict and warnings)
+        failed = failed or not ok
+        print(f"{'✅' if ok else '❌'} {target}: {len(paths)} image(s), {references} manifest icon reference(s), "
+              f"{len(errors)} error(s), {len(warnings)} warning(s)")
+        for message in errors:
+            print(f"   ❌ {message}")
+        for message in warnings:
+            print(f"   ⚠️  {message}")
+        report[target] = {'images': len(paths), 'errors': errors, 'warnings': warnings}
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"\n{'❌ Store asset validation failed' if failed else '✅ All store assets valid'} "
+          f"({total_images} image header(s) checked in {elapsed_ms:.0f} ms)")
+    return not failed
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
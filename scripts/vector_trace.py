@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+HeadForge Vector Trace
+Turns the alpha and color regions of a raster logo into compact SVG paths:
+colors are quantized, region boundaries are traced on a pixel grid and the
+outlines are simplified within an error tolerance
+"""
+
+import json
+import os
+from pathlib import Path
+
+TRACE_VERSION = 1
+
+DEFAULT_PARAMS = {
+    'size': 256,            # Trace grid, in pixels along the longer side
+    'max_colors': 4,        # Palette size after quantization
+    'merge_distance': 32,   # Palette entries closer than this (RGB distance) become one color
+    'alpha_threshold': 128,  # Minimum alpha for a pixel to be filled
+    'tolerance': 0.5,       # Maximum outline deviation, in grid pixels
+    'min_area': 4,          # Outlines enclosing less area are dropped as speckles
+}
+
+# Direction of travel -> preferred next directions (right turn, straight, left turn);
+# turning right keeps regions that only touch at a corner in separate outlines
+TURNS = {
+    (1, 0): [(0, 1), (1, 0), (0, -1)],
+    (0, 1): [(-1, 0), (0, 1), (1, 0)],
+    (-1, 0): [(0, -1), (-1, 0), (0, 1)],
+    (0, -1): [(1, 0), (0, -1), (-1, 0)],
+}
+
+
+def label_grid(image, params):
+    """
+    Downsample and quantize an image into a grid of color labels
+
+    Returns:
+        tuple: (width, height, labels as a flat list with -1 for transparent,
+        list of "#rrggbb" colors indexed by label)
+    """
+    from PIL import Image
+
+    image = image.convert('RGBA')
+    scale = params['size'] / max(image.size)
+    width, height = max(1, round(image.width * scale)), max(1, round(image.height * scale))
+    small = image.resize((width, height), Image.Resampling.BOX)
+
+    alpha = small.getchannel('A').tobytes()
+    quantized = small.convert('RGB').quantize(params['max_colors'])
+    indices = quantized.tobytes()
+    palette = quantized.getpalette()
+
+    rgb = [tuple(palette[i * 3:i * 3 + 3]) for i in range(len(palette) // 3)]
+
+    # Map near-identical palette entries onto the first of them
+    merged = []
+    for color in rgb:
+        target = next((i for i in set(merged)
+                       if sum((a - b) ** 2 for a, b in zip(color, rgb[i])) <= params['merge_distance'] ** 2),
+                      len(merged))
+        merged.append(target)
+
+    labels = [merged[index] if a >= params['alpha_threshold'] else -1 for index, a in zip(indices, alpha)]
+    colors = ['#%02x%02x%02x' % color for color in rgb]
+    return width, height, labels, colors
+
+
+def boundary_loops(width, height, labels, label):
+    """
+    Trace the closed outlines of every region with the given label
+
+    Outer outlines run clockwise and holes counter-clockwise (y pointing down),
+    so they fill correctly with the nonzero rule.
+
+    Returns:
+        list: Loops as lists of (x, y) grid corners, corners only
+    """
+    outgoing = {}
+
+    def add(x0, y0, x1, y1):
+        outgoing.setdefault((x0, y0), []).append((x1, y1))
+
+    for y in range(height):
+        row = y * width
+        for x in range(width):
+            if labels[row + x] != label:
+                continue
+            if y == 0 or labels[row - width + x] != label:
+                add(x, y, x + 1, y)
+            if x == width - 1 or labels[row + x + 1] != label:
+                add(x + 1, y, x + 1, y + 1)
+            if y == height - 1 or labels[row + width + x] != label:
+                add(x + 1, y + 1, x, y + 1)
+            if x == 0 or labels[row + x - 1] != label:
+                add(x, y + 1, x, y)
+
+    loops = []
+    while outgoing:
+        start = next(iter(outgoing))
+        point = start
+        direction = None
+        loop = []
+        while True:
+            ends = outgoing[point]
+            if direction is None or len(ends) == 1:
+                end = ends[0]
+            else:
+                end = next(
+                    (candidate for turn in TURNS[direction]
+                     for candidate in ends
+                     if (candidate[0] - point[0], candidate[1] - point[1]) == turn),
+                    ends[0])
+            ends.remove(end)
+            if not ends:
+                del outgoing[point]
+
+            new_direction = (end[0] - point[0], end[1] - point[1])
+            if new_direction != direction:
+                loop.append(point)
+            direction = new_direction
+            point = end
+            if point == start:
+                break
+
+        # The start corner is redundant if the loop closes without turning there
+        if len(loop) > 2 and (loop[0][0] - loop[-1][0], loop[0][1] - loop[-1][1]) == direction \
+                and (loop[1][0] - loop[0][0], loop[1][1] - loop[0][1]) == direction:
+            loop.pop(0)
+        loops.append(loop)
+    return loops
+
+
+def polygon_area(points):
+    """Signed shoelace area"""
+    return sum(x0 * y1 - x1 * y0 for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1])) / 2
+
+
+def _segment_distance(point, start, end):
+    (px, py), (ax, ay), (bx, by) = point, start, end
+    dx, dy = bx - ax, by - ay
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0:
+        return ((px - ax) ** 2 + (py - ay) ** 2) ** 0.5
+    t = max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / length_sq))
+    return ((px - ax - t * dx) ** 2 + (py - ay - t * dy) ** 2) ** 0.5
+
+
+def simplify(points, tolerance):
+    """
+    Douglas-Peucker simplification of a closed polygon
+
+    Args:
+        points (list): Polygon corners
+        tolerance (float): Maximum distance of a dropped corner from the result
+
+    Returns:
+        list: Subset of the corners
+    """
+    if tolerance <= 0 or len(points) <= 4:
+        return points
+
+    # Split the ring at the corner farthest from the first one
+    far = max(range(len(points)), key=lambda i: (points[i][0] - points[0][0]) ** 2 + (points[i][1] - points[0][1]) ** 2)
+    ring = points + [points[0]]
+    keep = {0, far, len(points)}
+    stack = [(0, far), (far, len(points))]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        distance, index = max((_segment_distance(ring[i], ring[first], ring[last]), i)
+                              for i in range(first + 1, last))
+        if distance > tolerance:
+            keep.add(index)
+            stack.append((first, index))
+            stack.append((index, last))
+
+    result = [ring[i] for i in sorted(keep) if i < len(points)]
+    return result if len(result) >= 3 else points
+
+
+def path_data(loops):
+    """SVG path data for a set of loops, using H/V for axis-aligned runs"""
+    parts = []
+    for loop in loops:
+        x, y = loop[0]
+        commands = [f'M{x} {y}']
+        for nx, ny in loop[1:]:
+            if ny == y:
+                commands.append(f'H{nx}')
+            elif nx == x:
+                commands.append(f'V{ny}')
+            else:
+                commands.append(f'L{nx} {ny}')
+            x, y = nx, ny
+        parts.append(''.join(commands) + 'Z')
+    return ''.join(parts)
+
+
+def trace_image(image, **params):
+    """
+    Trace an image into filled vector layers
+
+    Args:
+        image (Image): Source raster
+        **params: Overrides of DEFAULT_PARAMS
+
+    Returns:
+        dict: {"width", "height", "layers": [{"fill", "d"}]} in grid units
+    """
+    params = {**DEFAULT_PARAMS, **params}
+    width, height, labels, colors = label_grid(image, params)
+
+    layers = []
+    for label in sorted(set(labels) - {-1}):
+        loops = []
+        for loop in boundary_loops(width, height, labels, label):
+            if abs(polygon_area(loop)) < params['min_area']:
+                continue
+            loops.append(simplify(loop, params['tolerance']))
+        if loops:
+            layers.append({'fill': colors[label], 'd': path_data(loops)})
+    return {'width': width, 'height': height, 'layers': layers}
+
+
+def trace_file(source_path, image_cache, **params):
+    """
+    Trace an image file, reusing the result cached for the same content and parameters
+
+    Args:
+        source_path (str | Path): Source image
+        image_cache (ImageCache): Provides content-hash keys and the decoded source
+        **params: Overrides of DEFAULT_PARAMS
+
+    Returns:
+        dict: Output of trace_image()
+    """
+    params = {**DEFAULT_PARAMS, **params}
+    key = image_cache.key(source_path, 'trace', {'version': TRACE_VERSION, **params})
+    cache_path = Path(image_cache.cache_dir) / 'traces' / f'{key}.json'
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        pass
+
+    traced = trace_image(image_cache.decoded(source_path), **params)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(traced, f)
+    os.replace(tmp_path, cache_path)
+    return traced
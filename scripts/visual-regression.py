@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+HeadForge Visual Regression
+Compares the generated PNG assets with a golden store of content hashes,
+perceptual hashes and downscaled reference thumbnails, and updates the store
+after intentional changes
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from file_index import hash_file
+from perceptual_hash import hamming
+from text_layout import FONT_ENV
+
+GOLDEN_DIR = Path('tests') / 'golden'
+DIFF_DIR = Path('.cache') / 'visual-diff'
+GOLDEN_VERSION = 1
+
+# PNGs written by generate-assets.py, generate-banner.py and optimize-icons.py
+# with the pinned text font. Only the default locale's screenshots get golden
+# images: the localized copies under promotional-images/<locale>/ come out of
+# the same rendering code with different strings.
+GOLDEN_PATTERNS = [
+    'src/assets/icons/*.png',
+    'src/assets/images/banner.png',
+    'src/assets/images/banner_final.png',
+    'store/*/banner-*.png',
+    'store/shared/promotional-images/*.png',
+]
+
+# Longest side of the reference thumbnails kept in the golden store
+THUMBNAIL_SIZE = 128
+DEFAULT_DISTANCE = 6
+DEFAULT_TOLERANCE = 16
+DEFAULT_MAX_DIFF = 0.5
+
+
+def collect_artifacts(project_root):
+    """Project-relative POSIX path -> absolute path of every artifact on disk"""
+    artifacts = {}
+    for pattern in GOLDEN_PATTERNS:
+        for path in project_root.glob(pattern):
+            if path.is_file():
+                artifacts[path.relative_to(project_root).as_posix()] = path
+    return dict(sorted(artifacts.items()))
+
+
+def text_font():
+    """File name and SHA-256 of the font text is rendered with, or None for Pillow's default font"""
+    from text_layout import font_file
+
+    path = font_file()
+    return {'file': Path(path).name, 'sha256': hash_file(path)} if path else None
+
+
+def thumbnail_name(rel):
+    return rel.replace('/', '__')
+
+
+def reference_thumbnail(image):
+    """Premultiplied RGBA box-downscale fitting THUMBNAIL_SIZE, so hidden colors under alpha never count"""
+    from PIL import Image
+
+    scale = THUMBNAIL_SIZE / max(image.size)
+    size = (max(1, round(image.width * scale)), max(1, round(image.height * scale))) if scale < 1 else image.size
+    # Downscale before converting: Pillow already weights RGBA by alpha while resampling
+    source = image if image.mode in ('RGB', 'RGBA', 'L', 'LA') else image.convert('RGBA')
+    return source.resize(size, Image.Resampling.BOX).convert('RGBA').convert('RGBa')
+
+
+def analyze(path):
+    """
+    Decode an artifact once for its perceptual hashes and reference thumbnail
+
+    Returns:
+        tuple: ({"width", "height", "mode", "dhash", "phash"}, thumbnail image)
+    """
+    from PIL import Image
+    from perceptual_hash import dhash, phash, thumbnail
+
+    with Image.open(path) as image:
+        image.load()
+        thumb = thumbnail(image)
+        entry = {
+            'width': image.width,
+            'height': image.height,
+            'mode': image.mode,
+            'dhash': f'{dhash(thumb):016x}',
+            'phash': f'{phash(thumb):016x}',
+        }
+        return entry, reference_thumbnail(image)
+
+
+def analyze_all(paths, jobs):
+    """analyze() every path, on worker processes when there are several"""
+    if jobs != 1 and len(paths) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as executor:
+            return dict(zip(paths, executor.map(analyze, paths)))
+    return {path: analyze(path) for path in paths}
+
+
+def pixel_diff(current, reference, tolerance):
+    """
+    Compare two premultiplied thumbnails pixel by pixel
+
+    Returns:
+        tuple: (percent of pixels whose largest channel difference exceeds
+        tolerance, largest difference, grayscale difference image)
+    """
+    from PIL import ImageChops
+
+    difference = ImageChops.difference(current, reference)
+    largest = difference.getchannel(0)
+    for band in range(1, len(difference.getbands())):
+        largest = ImageChops.lighter(largest, difference.getchannel(band))
+    histogram = largest.histogram()
+    over = sum(histogram[tolerance + 1:])
+    peak = max((level for level, count in enumerate(histogram) if count), default=0)
+    return 100 * over / (largest.width * largest.height), peak, largest
+
+
+def load_golden(golden_dir):
+    """
+    Returns:
+        tuple: (path -> golden entry, text font the goldens were recorded with)
+    """
+    try:
+        with open(golden_dir / 'golden.json', 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}, None
+    if data.get('version') != GOLDEN_VERSION:
+        return {}, None
+    return data.get('artifacts', {}), data.get('font')
+
+
+def save_golden(golden_dir, artifacts, font):
+    path = golden_dir / 'golden.json'
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': GOLDEN_VERSION, 'thumbnail_size': THUMBNAIL_SIZE, 'font': font,
+                   'artifacts': artifacts}, f, indent=1, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+
+def update(project_root, golden_dir, golden, artifacts, jobs):
+    """
+    Record every artifact whose bytes differ from its golden entry, drop
+    entries of artifacts that no longer exist, and pin the text font of this machine
+
+    Returns:
+        tuple: (updated paths, removed paths)
+    """
+    changed = [rel for rel, path in artifacts.items()
+               if rel not in golden or hash_file(path) != golden[rel]['sha256']]
+    removed = sorted(set(golden) - set(artifacts))
+
+    thumbs_dir = golden_dir / 'thumbs'
+    thumbs_dir.mkdir(parents=True, exist_ok=True)
+    results = analyze_all([artifacts[rel] for rel in changed], jobs)
+    for rel in changed:
+        entry, thumb = results[artifacts[rel]]
+        thumb.convert('RGBA').save(thumbs_dir / f'{thumbnail_name(rel)}', 'PNG', optimize=True)
+        golden[rel] = {'sha256': hash_file(artifacts[rel]), **entry}
+    for rel in removed:
+        del golden[rel]
+        (thumbs_dir / thumbnail_name(rel)).unlink(missing_ok=True)
+
+    save_golden(golden_dir, golden, text_font())
+    return changed, removed
+
+
+def check(project_root, golden_dir, golden, font, artifacts, args):
+    """
+    Compare the artifacts with the golden store
+
+    Byte-identical files pass on their SHA-256 alone. Only files whose bytes
+    changed are decoded: they must keep their size, stay within args.distance
+    bits of both perceptual hashes, and differ from the reference thumbnail
+    beyond args.tolerance levels in at most args.max_diff percent of pixels.
+    Changed files rendered with another text font than the goldens fail
+    without a comparison, since their text cannot match.
+
+    Returns:
+        tuple: (identical count, list of (path, message) passes, list of
+        (path, message) failures, new paths, paths not built)
+    """
+    from PIL import Image
+
+    identical, changed = 0, []
+    for rel, path in artifacts.items():
+        if rel not in golden:
+            continue
+        if hash_file(path) == golden[rel]['sha256']:
+            identical += 1
+        else:
+            changed.append(rel)
+
+    passes, failures = [], []
+    missing = sorted(set(golden) - set(artifacts))
+    current_font = text_font() if changed and font else font
+    if current_font != font:
+        found = current_font['file'] if current_font else "Pillow's default font"
+        failures.extend((rel, f"text renders with {found}, goldens were recorded with {font['file']}; "
+                              f"set {FONT_ENV} to that font file") for rel in changed)
+        changed = []
+
+    results = analyze_all([artifacts[rel] for rel in changed], args.jobs)
+    for rel in changed:
+        expected = golden[rel]
+        entry, thumb = results[artifacts[rel]]
+        if (entry['width'], entry['height']) != (expected['width'], expected['height']):
+            failures.append((rel, f"{entry['width']}x{entry['height']}, golden is "
+                                  f"{expected['width']}x{expected['height']}"))
+            continue
+
+        distance = max(hamming(entry['dhash'], expected['dhash']), hamming(entry['phash'], expected['phash']))
+        with Image.open(golden_dir / 'thumbs' / thumbnail_name(rel)) as reference:
+            percent, peak, difference = pixel_diff(thumb, reference.convert('RGBA').convert('RGBa'), args.tolerance)
+        message = f"hash distance {distance}, {percent:.2f}% of pixels beyond ±{args.tolerance} (max {peak})"
+        if distance <= args.distance and percent <= args.max_diff:
+            passes.append((rel, message))
+            continue
+
+        # Differences stretched to full range, so faint changes are visible
+        diff_path = project_root / DIFF_DIR / thumbnail_name(rel)
+        diff_path.parent.mkdir(parents=True, exist_ok=True)
+        difference.point(lambda level: min(255, level * 8)).save(diff_path)
+        failures.append((rel, f"{message}; diff in {diff_path.relative_to(project_root)}"))
+
+    new = [rel for rel in artifacts if rel not in golden]
+    return identical, passes, failures, new, missing
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare generated HeadForge assets with their golden images')
+    parser.add_argument('--update', action='store_true',
+                       help='Record the current artifacts as the golden images (after intentional changes)')
+    parser.add_argument('--golden', default=str(GOLDEN_DIR),
+                       help=f'Golden store directory (default: {GOLDEN_DIR})')
+    parser.add_argument('--distance', type=int, default=DEFAULT_DISTANCE,
+                       help=f'Maximum dHash/pHash Hamming distance of a changed artifact (default: {DEFAULT_DISTANCE})')
+    parser.add_argument('--tolerance', type=int, default=DEFAULT_TOLERANCE,
+                       help=f'Per-channel difference a thumbnail pixel may have (default: {DEFAULT_TOLERANCE})')
+    parser.add_argument('--max-diff', type=float, default=DEFAULT_MAX_DIFF, metavar='PERCENT',
+                       help=f'Percent of thumbnail pixels allowed beyond the tolerance (default: {DEFAULT_MAX_DIFF})')
+    parser.add_argument('--jobs', type=int,
+                       help='Processes decoding changed artifacts (default: CPU count)')
+
+    args = parser.parse_args()
+    args.jobs = args.jobs or os.cpu_count() or 1
+
+    # Get the directory of this script
+    script_dir = Path(__file__).resolve().parent
+    project_root = script_dir.parent
+    golden_dir = project_root / args.golden
+
+    start = time.perf_counter()
+    golden, font = load_golden(golden_dir)
+    artifacts = collect_artifacts(project_root)
+
+    if args.update:
+        print("📸 Updating golden images...")
+        print("=" * 50)
+        changed, removed = update(project_root, golden_dir, golden, artifacts, args.jobs)
+        for rel in changed:
+            print(f"   📝 {rel}")
+        for rel in removed:
+            print(f"   🗑️  {rel}")
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"\n✅ {len(golden)} golden image(s): {len(changed)} recorded, {len(removed)} removed "
+              f"in {elapsed_ms:.0f} ms")
+        return True
+
+    print("🔍 Comparing assets with golden images...")
+    print("=" * 50)
+    if not golden:
+        print(f"❌ No golden images in {args.golden}; record them with --update")
+        return False
+
+    identical, passes, failures, new, missing = check(project_root, golden_dir, golden, font, artifacts, args)
+    for rel, message in passes:
+        print(f"   ✅ {rel}: within tolerance, {message}")
+    for rel, message in failures:
+        print(f"   ❌ {rel}: {message}")
+    for rel in new:
+        print(f"   ⚠️  {rel}: no golden image; record it with --update")
+    for rel in missing:
+        print(f"   ⏭️  {rel}: not on disk, skipped; build it or record its removal with --update")
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    summary = (f"{identical} identical, {len(passes)} within tolerance, {len(failures)} failed, "
+               f"{len(new)} new, {len(missing)} skipped in {elapsed_ms:.0f} ms")
+    print(f"\n{'❌ Visual regressions found' if failures else '✅ All assets match'} ({summary})")
+    if failures:
+        print("   Intentional? Record the new output with --update")
+    return not failures
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,28 @@
+"""Shared setup for the unit tests of the Python asset scripts"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[3] / 'scripts'
+
+# The scripts import their sibling modules directly, as when run from the repo root
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+@pytest.fixture(scope='session')
+def load_script():
+    """Import a CLI script whose file name is not a valid module name, e.g. subset-fonts"""
+    modules = {}
+
+    def load(name):
+        if name not in modules:
+            spec = importlib.util.spec_from_file_location(name.replace('-', '_'), SCRIPTS_DIR / f'{name}.py')
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            modules[name] = module
+        return modules[name]
+
+    return load
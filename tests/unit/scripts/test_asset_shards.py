@@ -0,0 +1,128 @@
+"""Tests for scripts/asset_shards.py"""
+
+import json
+
+import pytest
+
+from asset_shards import (Artifact, estimate_cost, merge_shards, parse_shard, partition, plan_digest,
+                          shard_manifest_path, write_shard_manifest)
+
+
+def make_plan():
+    artifacts = [Artifact(f'out/icon-{size}.png', 'icons', (size, size), 'png-rgba') for size in (16, 32, 48, 128)]
+    artifacts += [Artifact(f'out/banner-{name}.png', 'banners', size, 'png-rgb')
+                  for name, size in (('a', (1280, 800)), ('b', (1260, 600)), ('c', (1920, 1080)))]
+    artifacts.append(Artifact('out/icon.svg', 'icons', (256, 256), 'svg'))
+    return artifacts
+
+
+def test_parse_shard():
+    assert parse_shard('2/3') == (2, 3)
+    for value in ('0/3', '4/3', 'x', '1-3'):
+        with pytest.raises(ValueError):
+            parse_shard(value)
+
+
+@pytest.mark.parametrize('count', [1, 2, 3, 5])
+def test_partition_covers_the_plan_once_and_is_deterministic(count):
+    plan = make_plan()
+    shards = partition(plan, count)
+
+    assert len(shards) == count
+    assert sorted(a.path for shard in shards for a in shard) == sorted(a.path for a in plan)
+    assert partition(list(reversed(plan)), count) == [sorted(shard, key=lambda a: plan[::-1].index(a))
+                                                      for shard in shards]
+
+
+def test_partition_balances_estimated_cost():
+    plan = make_plan()
+    costs = [sum(estimate_cost(a) for a in shard) for shard in partition(plan, 2)]
+    # Greedy LPT stays within the most expensive artifact of a perfect split
+    assert max(costs) - min(costs) <= max(estimate_cost(a) for a in plan)
+
+
+def test_plan_digest_ignores_order_but_not_sizes():
+    plan = make_plan()
+    assert plan_digest(plan) == plan_digest(list(reversed(plan)))
+    assert plan_digest(plan) != plan_digest(plan[:-1] + [plan[-1]._replace(size=(128, 128))])
+
+
+def write_outputs(root, artifacts):
+    for artifact in artifacts:
+        path = root / artifact.path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(artifact.path.encode('utf-8') * 3)
+
+
+def test_split_and_merge_round_trip(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    plan = make_plan()
+    digest = plan_digest(plan)
+    shards = partition(plan, 3)
+
+    # Each shard builds in its own checkout, as on separate CI jobs
+    roots = []
+    for index, shard in enumerate(shards, 1):
+        root = tmp_path / f'job-{index}'
+        root.mkdir()
+        monkeypatch.chdir(root)
+        write_outputs(root, shard)
+        write_shard_manifest(index, 3, digest, shard, {a.path: a.path for a in shard},
+                             {'elapsed_ms': 10.0 * index, 'category_ms': {}})
+        roots.append(root)
+
+    merge_root = tmp_path / 'merge'
+    merge_root.mkdir()
+    monkeypatch.chdir(merge_root)
+    merged = merge_shards(roots, 'merged.json')
+
+    assert sorted(merged['artifacts']) == sorted(a.path for a in plan)
+    assert all((merge_root / a.path).read_bytes() == a.path.encode('utf-8') * 3 for a in plan)
+    assert {entry['shard'] for entry in merged['artifacts'].values()} == {1, 2, 3}
+    assert merged['metrics']['estimated_cost'] == sum(estimate_cost(a) for a in plan)
+    assert json.loads((merge_root / 'merged.json').read_text(encoding='utf-8')) == merged
+
+
+
+def test_merge_accepts_empty_shards(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    plan = make_plan()
+    count = len(plan) + 2
+    shards = partition(plan, count)
+    assert [] in shards
+    write_outputs(tmp_path, plan)
+
+    # Shards beyond the plan size render nothing but still write a manifest
+    for index, shard in enumerate(shards, 1):
+        write_shard_manifest(index, count, plan_digest(plan), shard, {a.path: a.path for a in shard},
+                             {'elapsed_ms': 0.0, 'category_ms': {}})
+    merged = merge_shards([shard_manifest_path(index, count) for index in range(1, count + 1)], 'merged.json')
+
+    assert merged['shards'] == count
+    assert sorted(merged['artifacts']) == sorted(a.path for a in plan)
+
+def test_merge_rejects_missing_and_mismatched_shards(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    plan = make_plan()
+    shards = partition(plan, 2)
+    write_outputs(tmp_path, plan)
+    write_shard_manifest(1, 2, plan_digest(plan), shards[0], {a.path: a.path for a in shards[0]},
+                         {'elapsed_ms': 1.0})
+
+    with pytest.raises(ValueError, match='Missing shard'):
+        merge_shards([shard_manifest_path(1, 2)], 'merged.json')
+
+    write_shard_manifest(2, 2, 'other-plan', shards[1], {a.path: a.path for a in shards[1]}, {'elapsed_ms': 1.0})
+    with pytest.raises(ValueError, match='different build plans'):
+        merge_shards([shard_manifest_path(1, 2), shard_manifest_path(2, 2)], 'merged.json')
+
+
+def test_merge_rejects_files_that_changed_after_the_shard(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    plan = make_plan()
+    write_outputs(tmp_path, plan)
+    write_shard_manifest(1, 1, plan_digest(plan), plan, {a.path: a.path for a in plan}, {'elapsed_ms': 1.0})
+    (tmp_path / plan[0].path).write_bytes(b'changed')
+
+    with pytest.raises(ValueError, match='does not match'):
+        merge_shards([shard_manifest_path(1, 1)], 'merged.json')
@@ -0,0 +1,105 @@
+"""Tests for scripts/build_journal.py"""
+
+import os
+import pickle
+import threading
+
+from build_journal import BuildJournal, remove_partial_writes
+from file_index import hash_file
+
+
+def write_artifacts(tmp_path, names):
+    paths = []
+    for name in names:
+        path = tmp_path / 'out' / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(name.encode('utf-8') * 10)
+        paths.append(path)
+    return paths
+
+
+def test_resume_after_a_torn_line_and_a_corrupt_artifact(tmp_path):
+    journal_path = tmp_path / 'journal.jsonl'
+    journal = BuildJournal(journal_path, 'build-1')
+    journal.rewrite()
+    paths = write_artifacts(tmp_path, ['a.png', 'b.png', 'c.png'])
+    for path in paths:
+        journal.record(path)
+    journal.close()
+
+    # A kill mid-write leaves half a line; an artifact changed after it was recorded
+    with open(journal_path, 'a', encoding='utf-8') as f:
+        f.write('{"path": "out/d.png", "sha2')
+    paths[1].write_bytes(b'truncated')
+
+    entries = BuildJournal(journal_path, 'build-1').load()
+    assert sorted(entries) == sorted(path.as_posix() for path in paths)
+
+    intact, rejected = journal.verify(entries)
+    assert sorted(intact) == [paths[0].as_posix(), paths[2].as_posix()]
+    assert rejected == [paths[1].as_posix()]
+
+    # The resumed run keeps only the intact entries and appends after them
+    journal.rewrite(intact)
+    journal.record(paths[1])
+    journal.close()
+    resumed = journal.load()
+    assert sorted(resumed) == sorted(path.as_posix() for path in paths)
+    assert resumed[paths[1].as_posix()]['sha256'] == hash_file(paths[1])
+
+
+def test_journal_of_another_build_or_garbage_is_ignored(tmp_path):
+    journal_path = tmp_path / 'journal.jsonl'
+    BuildJournal(journal_path, 'build-1').rewrite()
+
+    assert BuildJournal(journal_path, 'build-2').load() is None
+    journal_path.write_bytes(b'\x00\x01 not json')
+    assert BuildJournal(journal_path, 'build-1').load() is None
+    assert BuildJournal(tmp_path / 'missing.jsonl', 'build-1').load() is None
+
+
+def test_threads_share_one_descriptor(tmp_path):
+    journal = BuildJournal(tmp_path / 'journal.jsonl', 'build-1')
+    journal.rewrite()
+    paths = write_artifacts(tmp_path, [f'{i}.png' for i in range(64)])
+    before = len(os.listdir('/proc/self/fd')) if os.path.isdir('/proc/self/fd') else None
+
+    barrier = threading.Barrier(8)
+
+    def record(chunk):
+        barrier.wait()
+        for path in chunk:
+            journal.record(path)
+
+    threads = [threading.Thread(target=record, args=(paths[i::8],)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if before is not None:
+        assert len(os.listdir('/proc/self/fd')) <= before + 1
+    journal.close()
+    assert len(journal.load()) == 64
+
+
+def test_pickled_copy_opens_its_own_descriptor(tmp_path):
+    journal = BuildJournal(tmp_path / 'journal.jsonl', 'build-1')
+    journal.rewrite()
+    first, second = write_artifacts(tmp_path, ['a.png', 'b.png'])
+    journal.record(first)
+
+    copy = pickle.loads(pickle.dumps(journal))
+    copy.record(second)
+    copy.close()
+    journal.close()
+    assert sorted(journal.load()) == [first.as_posix(), second.as_posix()]
+
+
+def test_remove_partial_writes(tmp_path):
+    path, = write_artifacts(tmp_path, ['a.png'])
+    (path.parent / '.a.png.123.tmp').write_bytes(b'partial')
+    (path.parent / 'b.png.123.tmp').write_bytes(b'other')
+
+    assert remove_partial_writes([path, tmp_path / 'missing' / 'c.png']) == 1
+    assert sorted(p.name for p in path.parent.iterdir()) == ['a.png', 'b.png.123.tmp']
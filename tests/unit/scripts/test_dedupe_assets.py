@@ -0,0 +1,69 @@
+"""Tests for scripts/dedupe-assets.py"""
+
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[3] / 'scripts'
+
+
+def run(project, script, *args):
+    result = subprocess.run([sys.executable, str(project / 'scripts' / script), *args], cwd=project,
+                            capture_output=True, text=True, check=True)
+    return result.stdout
+
+
+def make_project(tmp_path):
+    """A project whose src/assets holds what generate-assets writes, with one store tree"""
+    from PIL import Image
+
+    project = tmp_path / 'project'
+    shutil.copytree(SCRIPTS_DIR, project / 'scripts', ignore=shutil.ignore_patterns('__pycache__'))
+
+    icons = project / 'src' / 'assets' / 'icons'
+    icons.mkdir(parents=True)
+    for size in (16, 32, 48, 96, 128, 256):
+        Image.new('RGBA', (size, size), (size, 0, 0, 255)).save(icons / f'icon-{size}.png')
+    Image.new('RGBA', (32, 32), (1, 2, 3, 255)).save(icons / 'favicon.ico')
+    (icons / 'icon.svg').write_text('<svg width="256" height="256"></svg>', encoding='utf-8')
+    images = project / 'src' / 'assets' / 'images'
+    images.mkdir()
+    Image.new('RGBA', (64, 32), (0, 0, 255, 255)).save(images / 'banner.png')
+
+    manifest = {'manifest_version': 3, 'name': 'HeadForge',
+                'icons': {str(size): f'icons/icon-{size}.png' for size in (16, 32, 48, 128)}}
+    (project / 'src' / 'manifest.json').write_text(json.dumps(manifest), encoding='utf-8')
+
+    store = project / 'store' / 'chrome'
+    store.mkdir(parents=True)
+    (store / 'manifest.json').write_text(json.dumps(manifest), encoding='utf-8')
+    (store / 'popup.html').write_text('<img src="assets/images/banner.png">', encoding='utf-8')
+    Image.new('RGB', (1280, 800), (9, 9, 9)).save(store / 'banner-chrome.png')
+    (store / 'assets' / 'fonts').mkdir(parents=True)
+    (store / 'assets' / 'fonts' / 'inter.woff2').write_bytes(b'')
+    (store / 'assets' / 'media').mkdir()
+    Image.new('RGB', (8, 8), (7, 7, 7)).save(store / 'assets' / 'media' / 'leftover.png')
+    return project
+
+
+def test_prune_then_sync_changes_nothing(tmp_path):
+    project = make_project(tmp_path)
+    store = project / 'store' / 'chrome'
+    run(project, 'sync-store-assets.py', '--targets', 'chrome')
+
+    run(project, 'dedupe-assets.py', '--prune', '--jobs', '1')
+
+    # Only the file nothing ships or references is gone
+    assert not (store / 'assets' / 'media' / 'leftover.png').exists()
+    for rel in ('banner-chrome.png', 'icons/icon-96.png', 'icons/icon-256.png', 'icons/icon.svg',
+                'icons/favicon.ico', 'assets/icons/icon-16.png', 'assets/images/banner.png',
+                'assets/fonts/inter.woff2'):
+        assert (store / rel).exists(), rel
+
+    assert 'Would change 0 file(s)' in run(project, 'sync-store-assets.py', '--targets', 'chrome', '--dry-run')
+    report = tmp_path / 'report.json'
+    run(project, 'dedupe-assets.py', '--jobs', '1', '--json', str(report))
+    assert [path for path in json.loads(report.read_text(encoding='utf-8'))['unreferenced']
+            if path.startswith('store/')] == []
@@ -0,0 +1,66 @@
+"""Tests for scripts/file_index.py"""
+
+import os
+
+import file_index
+from file_index import FileHashIndex, hash_file
+
+
+def test_digest_hashes_once_while_stat_is_unchanged(tmp_path, monkeypatch):
+    path = tmp_path / 'a.txt'
+    path.write_bytes(b'first')
+    index = FileHashIndex(tmp_path / 'index.json')
+
+    calls = []
+    monkeypatch.setattr(file_index, 'hash_file', lambda p: calls.append(p) or hash_file(p))
+
+    digest = index.digest(path, 'a.txt')
+    assert index.digest(path, 'a.txt') == digest
+    assert len(calls) == 1
+
+
+def test_digest_rehashes_after_content_and_mtime_change(tmp_path):
+    path = tmp_path / 'a.txt'
+    path.write_bytes(b'first')
+    index = FileHashIndex(tmp_path / 'index.json')
+    first = index.digest(path, 'a.txt')
+
+    path.write_bytes(b'other')
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert index.lookup('a.txt', path.stat()) is None
+    assert index.digest(path, 'a.txt') == hash_file(path) != first
+
+
+def test_save_round_trips_and_leaves_no_temporary_file(tmp_path):
+    path = tmp_path / 'a.txt'
+    path.write_bytes(b'content')
+    index_path = tmp_path / 'cache' / 'index.json'
+    index = FileHashIndex(index_path)
+    digest = index.digest(path, 'a.txt')
+    index.save()
+
+    reloaded = FileHashIndex(index_path)
+    assert reloaded.lookup('a.txt', path.stat()) == digest
+    assert not reloaded.dirty
+    assert sorted(p.name for p in index_path.parent.iterdir()) == ['index.json']
+
+
+def test_corrupt_index_starts_empty(tmp_path):
+    index_path = tmp_path / 'index.json'
+    index_path.write_text('{"version": 1, "files": {', encoding='utf-8')
+
+    assert FileHashIndex(index_path).keys() == []
+
+
+def test_forget_marks_the_index_dirty(tmp_path):
+    path = tmp_path / 'a.txt'
+    path.write_bytes(b'content')
+    index = FileHashIndex(tmp_path / 'index.json')
+    index.digest(path, 'a.txt')
+    index.save()
+
+    index.forget('a.txt')
+    assert index.dirty
+    assert index.keys() == []
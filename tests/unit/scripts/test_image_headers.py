@@ -0,0 +1,64 @@
+"""Tests for scripts/image_headers.py"""
+
+import pytest
+
+from image_headers import (parse_png_header, parse_svg_header, read_ico_entries, read_image_header,
+                           read_png_header)
+
+
+@pytest.mark.parametrize('mode', ['RGBA', 'RGB', 'LA', 'L'])
+def test_png_header_matches_pillow(tmp_path, mode):
+    from PIL import Image
+
+    path = tmp_path / 'image.png'
+    Image.new(mode, (37, 21)).save(path)
+
+    header = read_png_header(path)
+    assert (header['width'], header['height'], header['mode']) == (37, 21, mode)
+    assert header['bit_depth'] == 8
+    assert not header['interlaced']
+
+
+def test_png_header_rejects_other_data():
+    assert parse_png_header(b'GIF89a' + bytes(40)) is None
+    assert parse_png_header(b'\x89PNG\r\n\x1a\n') is None
+
+
+def test_ico_entries_match_pillow(tmp_path):
+    from PIL import Image
+
+    path = tmp_path / 'icon.ico'
+    Image.new('RGBA', (256, 256)).save(path, sizes=[(16, 16), (32, 32), (256, 256)])
+
+    entries = read_ico_entries(path)
+    assert sorted((entry['width'], entry['height']) for entry in entries) == [(16, 16), (32, 32), (256, 256)]
+    size = path.stat().st_size
+    assert all(entry['offset'] + entry['size'] <= size for entry in entries)
+
+
+def test_svg_header_prefers_width_and_height_over_view_box():
+    header = parse_svg_header(b'<?xml version="1.0"?>\n<svg xmlns="http://www.w3.org/2000/svg" '
+                              b'width="128px" height="64" viewBox="0 0 256 128">')
+    assert (header['width'], header['height']) == (128, 64)
+    assert header['view_box'] == [0, 0, 256, 128]
+
+
+def test_svg_header_falls_back_to_view_box():
+    header = parse_svg_header(b"<svg viewBox='0,0,48,24'><rect/></svg>")
+    assert (header['width'], header['height']) == (48, 24)
+
+
+def test_svg_header_without_root_tag():
+    assert parse_svg_header(b'<html></html>') is None
+
+
+def test_read_image_header_dispatches_on_suffix(tmp_path):
+    from PIL import Image
+
+    png_path = tmp_path / 'icon.png'
+    Image.new('RGB', (8, 4)).save(png_path)
+    svg_path = tmp_path / 'icon.svg'
+    svg_path.write_text('<svg width="10" height="20"></svg>', encoding='utf-8')
+
+    assert read_image_header(png_path)['format'] == 'PNG'
+    assert read_image_header(svg_path)['format'] == 'SVG'
@@ -0,0 +1,55 @@
+"""Tests for scripts/perceptual_hash.py"""
+
+import itertools
+import random
+
+from perceptual_hash import clusters, hamming, near_pairs
+
+
+def flip(value, bits):
+    for bit in bits:
+        value ^= 1 << bit
+    return value
+
+
+def entry(dhash, phash):
+    return {'dhash': f'{dhash:016x}', 'phash': f'{phash:016x}'}
+
+
+def brute_force(hashes, max_distance):
+    return {(a, b) for a, b in itertools.combinations(sorted(hashes), 2)
+            if hamming(hashes[a]['phash'], hashes[b]['phash']) <= max_distance
+            and hamming(hashes[a]['dhash'], hashes[b]['dhash']) <= max_distance}
+
+
+def test_hamming():
+    assert hamming('00', 'ff') == 8
+    assert hamming('f0f0', 'f0f1') == 1
+
+
+def test_near_pairs_matches_brute_force():
+    rng = random.Random(1234)
+    hashes = {}
+    for group in range(20):
+        dhash, phash = rng.getrandbits(64), rng.getrandbits(64)
+        for member in range(4):
+            hashes[f'{group}-{member}'] = entry(flip(dhash, rng.sample(range(64), rng.randint(0, 6))),
+                                                flip(phash, rng.sample(range(64), rng.randint(0, 6))))
+
+    for max_distance in (0, 3, 6, 10):
+        assert near_pairs(hashes, max_distance) == brute_force(hashes, max_distance)
+
+
+def test_near_pairs_needs_both_hashes_close():
+    hashes = {
+        'a': entry(0, 0),
+        'b': entry(flip(0, range(2)), flip(0, range(2))),
+        'c': entry(flip(0, range(20)), flip(0, range(1))),
+    }
+    assert near_pairs(hashes, 4) == {('a', 'b')}
+
+
+def test_clusters_joins_pairs_transitively():
+    keys = ['a', 'b', 'c', 'd', 'e']
+    assert sorted(clusters(keys, {('a', 'b'), ('b', 'c')})) == [['a', 'b', 'c']]
+    assert sorted(clusters(keys, {('a', 'b'), ('d', 'e')})) == [['a', 'b'], ['d', 'e']]
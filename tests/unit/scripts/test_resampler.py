@@ -0,0 +1,58 @@
+"""Tests for scripts/resampler.py"""
+
+import random
+
+import pytest
+
+from resampler import FILTERS, resize_all, resize_batch
+
+# resize_batch() promises results within this many levels of Image.resize()
+MAX_LEVELS = 3
+
+
+def noise(mode, size, seed):
+    from PIL import Image
+
+    rng = random.Random(seed)
+    return Image.frombytes(mode, size, bytes(rng.getrandbits(8) for _ in range(size[0] * size[1] * len(mode))))
+
+
+def max_difference(a, b):
+    from PIL import ImageChops
+
+    # Colors under transparent pixels are invisible; compare premultiplied
+    if a.mode == 'RGBA':
+        a, b = a.convert('RGBa'), b.convert('RGBa')
+    return max(high for _, high in ImageChops.difference(a, b).getextrema()) if len(a.getbands()) > 1 \
+        else ImageChops.difference(a, b).getextrema()[1]
+
+
+@pytest.mark.parametrize('resample', sorted(FILTERS))
+@pytest.mark.parametrize('mode', ['RGBA', 'RGB', 'L'])
+@pytest.mark.parametrize('size', [(23, 9), (61, 47), (150, 90)])
+def test_resize_batch_matches_pillow(resample, mode, size):
+    pytest.importorskip('numpy')
+    from PIL import Image
+
+    images = [noise(mode, (64, 48), seed) for seed in range(3)]
+    for image, resized in zip(images, resize_batch(images, size, resample)):
+        assert resized.mode == mode and resized.size == size
+        assert max_difference(resized, image.resize(size, Image.Resampling[resample.upper()])) <= MAX_LEVELS
+
+
+def test_resize_batch_falls_back_for_mixed_batches():
+    from PIL import Image
+
+    images = [noise('RGB', (40, 30), 1), noise('RGB', (30, 40), 2)]
+    for image, resized in zip(images, resize_batch(images, (10, 10), 'bilinear')):
+        assert resized.tobytes() == image.resize((10, 10), Image.Resampling.BILINEAR).tobytes()
+
+
+def test_resize_all_keeps_input_order():
+    images = [noise('RGB', (40, 30), 1), noise('L', (40, 30), 2), noise('RGB', (40, 30), 3)]
+    sizes = [(20, 15), (10, 5), (20, 15)]
+
+    results = resize_all(images, sizes)
+    assert [(result.mode, result.size) for result in results] == [('RGB', (20, 15)), ('L', (10, 5)),
+                                                                  ('RGB', (20, 15))]
+    assert results[0].tobytes() != results[2].tobytes()
@@ -0,0 +1,83 @@
+"""Tests for scripts/subset-fonts.py"""
+
+import pytest
+
+
+@pytest.fixture
+def subset_fonts(load_script):
+    return load_script('subset-fonts')
+
+
+def build_font(path, chars):
+    """Write a TrueType font with one square glyph per character"""
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+    glyph_names = {ord(char): f'uni{ord(char):04X}' for char in chars}
+    glyph_order = ['.notdef'] + list(glyph_names.values())
+
+    pen = TTGlyphPen(None)
+    pen.moveTo((0, 0))
+    pen.lineTo((0, 500))
+    pen.lineTo((500, 500))
+    pen.lineTo((500, 0))
+    pen.closePath()
+    square = pen.glyph()
+
+    builder = FontBuilder(1000, isTTF=True)
+    builder.setupGlyphOrder(glyph_order)
+    builder.setupCharacterMap(glyph_names)
+    builder.setupGlyf({name: square for name in glyph_order})
+    builder.setupHorizontalMetrics({name: (600, 0) for name in glyph_order})
+    builder.setupHorizontalHeader(ascent=800, descent=-200)
+    builder.setupNameTable({'familyName': 'Subset Test', 'styleName': 'Regular'})
+    builder.setupOS2()
+    builder.setupPost()
+    builder.save(str(path))
+
+
+def test_scan_target_collects_page_text_and_weights(subset_fonts, tmp_path):
+    (tmp_path / 'popup.html').write_text('<p title="Größe">Héllo</p><script>ignored()</script>', encoding='utf-8')
+    (tmp_path / 'popup.js').write_text("const label = 'caf\\u00e9';", encoding='utf-8')
+    (tmp_path / 'popup.css').write_text('h1 { font-weight: bold; content: "\\2014"; }', encoding='utf-8')
+    (tmp_path / 'assets').mkdir()
+    (tmp_path / 'assets' / 'vendor.js').write_text("'Ω'", encoding='utf-8')
+
+    codepoints, weights = subset_fonts.scan_target(tmp_path)
+
+    assert {ord(char) for char in 'öéß—'} <= codepoints
+    assert ord('Ω') not in codepoints
+    assert subset_fonts.BASELINE <= codepoints
+    assert weights == {700}
+
+
+def test_subset_font_keeps_only_used_characters(subset_fonts, tmp_path):
+    pytest.importorskip('fontTools')
+    from fontTools.ttLib import TTFont
+
+    font_path = tmp_path / 'test.ttf'
+    build_font(font_path, 'ABé')
+
+    data, glyphs = subset_fonts.subset_font(font_path, {ord('A'), ord('é')}, set())
+
+    subset_path = tmp_path / 'subset.ttf'
+    subset_path.write_bytes(data)
+    cmap = TTFont(str(subset_path)).getBestCmap()
+    assert set(cmap) == {ord('A'), ord('é')}
+    assert glyphs == 3  # .notdef plus the two kept characters
+
+
+def test_cached_subset_reuses_the_cache(subset_fonts, tmp_path):
+    pytest.importorskip('fontTools')
+
+    font_path = tmp_path / 'test.ttf'
+    build_font(font_path, 'AB')
+    cache_dir = tmp_path / 'cache'
+
+    data, glyphs = subset_fonts.cached_subset(font_path, 'f' * 64, {ord('A')}, set(), cache_dir)
+    cached, cached_glyphs = subset_fonts.cached_subset(font_path, 'f' * 64, {ord('A')}, set(), cache_dir)
+
+    assert glyphs == 2
+    assert cached_glyphs is None
+    assert cached == data
+    assert len(list(cache_dir.iterdir())) == 1
@@ -0,0 +1,63 @@
+"""Tests for scripts/theme.py"""
+
+from theme import (LINEAR_MAX, SRGB_TO_LINEAR, Theme, composite_linear, decode_lut, encode_lut, linear_to_srgb,
+                   mix, parse_hex, srgb_to_linear)
+
+
+def test_parse_hex():
+    assert parse_hex('#667eea') == (102, 126, 234)
+    assert parse_hex('fff') == (255, 255, 255)
+
+
+def test_transfer_functions_are_inverse():
+    for i in range(256):
+        assert round(linear_to_srgb(srgb_to_linear(i / 255)) * 255) == i
+
+
+def test_decode_lut_matches_the_transfer_function():
+    lut = decode_lut()
+    assert len(lut) == 256
+    assert lut[0] == 0 and lut[255] == LINEAR_MAX
+    assert lut == sorted(lut)
+    assert all(lut[i] == round(SRGB_TO_LINEAR[i] * LINEAR_MAX) for i in range(256))
+
+
+def test_encode_lut_round_trips_every_8_bit_value():
+    decode, encode = decode_lut(), encode_lut()
+    assert len(encode) == 65536
+    assert all(encode[decode[i]] == i for i in range(256))
+    # Values above LINEAR_MAX saturate
+    assert encode[LINEAR_MAX + 1] == encode[-1] == 255
+
+
+def test_mix_blends_in_linear_light():
+    assert mix((0, 0, 0), (255, 255, 255), 0) == (0, 0, 0)
+    assert mix((0, 0, 0), (255, 255, 255), 1) == (255, 255, 255)
+    # Half linear light is 188 in sRGB, not the 128 a naive blend gives
+    assert mix((0, 0, 0), (255, 255, 255), 0.5) == (188, 188, 188)
+
+
+def test_theme_indexing_and_gradient():
+    theme = Theme({'black': '#000000', 'white': '#ffffff'})
+    assert theme['white'] == '#ffffff'
+    assert theme.rgb('white') == (255, 255, 255)
+    assert 'black' in theme and 'red' not in theme
+
+    gradient = theme.gradient((3, 10), [(0.0, 'black'), (1.0, 'white')])
+    assert gradient.size == (3, 10)
+    column = [gradient.getpixel((0, y)) for y in range(10)]
+    assert column[0] == (0, 0, 0)
+    assert column == sorted(column)
+    assert all(gradient.getpixel((2, y)) == column[y] for y in range(10))
+
+
+def test_composite_linear_matches_a_per_pixel_linear_blend():
+    from PIL import Image
+
+    base = Image.new('RGB', (4, 4), (0, 0, 0))
+    overlay = Image.new('RGBA', (2, 2), (255, 255, 255, 128))
+    composite_linear(base, overlay, (1, 1))
+
+    expected = mix((0, 0, 0), (255, 255, 255), 128 / 255)
+    assert base.getpixel((1, 1)) == base.getpixel((2, 2)) == expected
+    assert base.getpixel((0, 0)) == base.getpixel((3, 3)) == (0, 0, 0)